@@ -20,7 +20,9 @@ Architecture:
 - Exceptions: Hierarchical error handling
 """
 
-from .account import Account
+import importlib
+
+from .account import Account, verify_transactions
 from .config import (
     DEFAULT_CONFIGS,
     AsyncConfig,
@@ -40,13 +42,16 @@ from .metagraph import get_metagraph_summary  # Legacy functions
 from .metagraph import (
     MetagraphClient,
     MetagraphError,
+    clear_discovery_cache,
     discover_all_metagraphs,
     discover_production_metagraphs,
     get_realistic_metagraph_summary,
+    prewarm_metagraphs,
 )
 from .network import Network, NetworkError
 from .transactions import create_metagraph_data_transaction  # Convenience functions
 from .transactions import (
+    TokenTxTemplate,
     Transactions,
     create_dag_transaction,
     create_dag_transfer,
@@ -214,6 +219,24 @@ except ImportError:
     build_balance_subscription = None
     GRAPHQL_AVAILABLE = False
 
+# Attributes imported on first access (PEP 562) so that importing the SDK
+# does not pay for their dependencies; snapshot holder analytics pull in NumPy
+_LAZY_ATTRIBUTES = {
+    "HoldersView": ".holders",
+    "NUMPY_AVAILABLE": ".holders",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
 __version__ = "1.2.0"
 __author__ = "Constellation Network Community"
 __license__ = "MIT"
@@ -222,7 +245,9 @@ __license__ = "MIT"
 __all__ = [
     # Core classes
     "Account",
+    "verify_transactions",
     "Transactions",
+    "TokenTxTemplate",
     "Network",
     "MetagraphClient",
     # Configuration management (Phase 2)
@@ -241,6 +266,8 @@ __all__ = [
     "DEFAULT_CONFIGS",
     # Metagraph functions
     "discover_production_metagraphs",
+    "prewarm_metagraphs",
+    "clear_discovery_cache",
     "get_realistic_metagraph_summary",
     "discover_all_metagraphs",  # Legacy
     "get_metagraph_summary",  # Legacy
@@ -296,6 +323,9 @@ __all__ = [
     "batch_get_balances",
     "batch_get_transactions",
     "batch_get_ordinals",
+    # Snapshot holder analytics
+    "HoldersView",
+    "NUMPY_AVAILABLE",
     # Async availability flag
     "ASYNC_AVAILABLE",
     # Streaming availability flag
@@ -6,16 +6,72 @@ Note: Transaction creation has been moved to the transactions module.
 Use constellation_sdk.Transactions for creating transactions.
 """
 
+import functools
 import hashlib
 import json
 import secrets
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
+from cryptography.exceptions import InvalidSignature
 from cryptography.hazmat.primitives import hashes, serialization
 from cryptography.hazmat.primitives.asymmetric import ec
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from .exceptions import ConstellationError
 
+# Signature algorithm shared by signing and verification
+_ECDSA_SHA256 = ec.ECDSA(hashes.SHA256())
+
+
+# Scalar types both encoders write identically; floats are excluded on purpose
+_PLAIN_JSON_SCALARS = (str, int, bool, type(None))
+
+
+def _is_plain_json(value: Any) -> bool:
+    """
+    Check whether a value holds only dict, list, tuple, str, int, bool and
+    None at any depth, with string dict keys.
+    """
+    value_type = type(value)
+    if value_type in _PLAIN_JSON_SCALARS:
+        return True
+    if value_type is dict:
+        return all(
+            type(key) is str and _is_plain_json(item) for key, item in value.items()
+        )
+    if value_type is list or value_type is tuple:
+        return all(_is_plain_json(item) for item in value)
+    return False
+
+
+def _canonical_json(value: Dict[str, Any]) -> bytes:
+    """
+    Serialize a transaction value to the canonical bytes that get signed.
+
+    Uses orjson when it is installed and the value is plain JSON. orjson
+    formats floats differently (1e-7 vs 1e-07), writes NaN/Infinity as null,
+    natively encodes types such as datetime, UUID and dataclasses that the
+    json module rejects, and writes non-ASCII text as raw UTF-8 where the
+    json module escapes it. Anything else therefore goes through the json
+    module, so both the signed bytes and which values can be signed are the
+    same with or without orjson.
+    """
+    if ORJSON_AVAILABLE and _is_plain_json(value):
+        try:
+            encoded = orjson.dumps(value, option=orjson.OPT_SORT_KEYS)
+        except orjson.JSONEncodeError:
+            pass
+        else:
+            if encoded.isascii():
+                return encoded
+    return json.dumps(value, sort_keys=True, separators=(",", ":")).encode("utf-8")
+
 
 class Account:
     """
@@ -43,6 +99,8 @@ class Account:
         >>> account = Account("your_private_key_hex")
     """
 
+    __slots__ = ("private_key", "public_key", "_address", "_public_key_hex")
+
     def __init__(self, private_key_hex: Optional[str] = None):
         """
         Initialize account with optional private key.
@@ -56,7 +114,8 @@ class Account:
             self.private_key = ec.generate_private_key(ec.SECP256K1())
 
         self.public_key = self.private_key.public_key()
-        self.address = self._derive_address()
+        self._address = None
+        self._public_key_hex = None
 
     def _load_private_key(self, hex_key: str) -> ec.EllipticCurvePrivateKey:
         """Load private key from hex string."""
@@ -87,12 +146,20 @@ class Account:
 
     def _derive_address(self) -> str:
         """Derive DAG address from public key."""
-        public_bytes = self.public_key.public_numbers().x.to_bytes(
-            32, "big"
-        ) + self.public_key.public_numbers().y.to_bytes(32, "big")
+        # Uncompressed SEC1 point is 0x04 || x || y; drop the prefix byte
+        public_bytes = self.public_key.public_bytes(
+            serialization.Encoding.X962, serialization.PublicFormat.UncompressedPoint
+        )[1:]
         address_hash = hashlib.sha256(public_bytes).hexdigest()
         return f"DAG{address_hash[:35]}"
 
+    @property
+    def address(self) -> str:
+        """Get the DAG address, derived on first access."""
+        if self._address is None:
+            self._address = self._derive_address()
+        return self._address
+
     @property
     def private_key_hex(self) -> str:
         """Get private key as hex string."""
@@ -101,14 +168,31 @@ class Account:
         )
         return private_bytes.hex()
 
+    def redacted_key(self) -> str:
+        """
+        Get a shortened private key suitable for logs and console output.
+
+        Shows only the first and last 4 hex characters, enough to tell keys
+        apart without revealing a meaningful part of the secret.
+
+        Returns:
+            Redacted key such as "a1b2...e5f6"
+        """
+        private_bytes = self.private_key.private_numbers().private_value.to_bytes(
+            32, "big"
+        )
+        return f"{private_bytes[:2].hex()}...{private_bytes[-2:].hex()}"
+
     @property
     def public_key_hex(self) -> str:
-        """Get public key as hex string."""
-        public_bytes = self.public_key.public_bytes(
-            encoding=serialization.Encoding.X962,
-            format=serialization.PublicFormat.UncompressedPoint,
-        )
-        return public_bytes.hex()
+        """Get public key as hex string, serialized on first access."""
+        if self._public_key_hex is None:
+            public_bytes = self.public_key.public_bytes(
+                encoding=serialization.Encoding.X962,
+                format=serialization.PublicFormat.UncompressedPoint,
+            )
+            self._public_key_hex = public_bytes.hex()
+        return self._public_key_hex
 
     def sign_message(self, message: str) -> str:
         """
@@ -121,7 +205,7 @@ class Account:
             Hex-encoded signature
         """
         message_bytes = message.encode("utf-8")
-        signature = self.private_key.sign(message_bytes, ec.ECDSA(hashes.SHA256()))
+        signature = self.private_key.sign(message_bytes, _ECDSA_SHA256)
         return signature.hex()
 
     # Transaction creation logic moved to transactions.py module
@@ -159,12 +243,11 @@ class Account:
                 "salt": transaction_data["salt"],
             }
 
-        # Create hash of the value for signing
-        value_json = json.dumps(value, sort_keys=True, separators=(",", ":"))
-        value_bytes = value_json.encode("utf-8")
+        # Canonical bytes of the value for signing
+        value_bytes = _canonical_json(value)
 
         # Create signature
-        signature = self.private_key.sign(value_bytes, ec.ECDSA(hashes.SHA256()))
+        signature = self.private_key.sign(value_bytes, _ECDSA_SHA256)
         signature_hex = signature.hex()
 
         # Create the complete signed transaction
@@ -187,6 +270,58 @@ class Account:
         Returns:
             Signed transaction ready for metagraph submission
         """
+        value = self._metagraph_value(transaction_data)
+
+        # Canonical bytes of the value for signing
+        value_bytes = _canonical_json(value)
+
+        # Create signature
+        signature = self.private_key.sign(value_bytes, _ECDSA_SHA256)
+        signature_hex = signature.hex()
+
+        # Create the complete signed transaction
+        signed_transaction = {
+            "value": value,
+            "proofs": [{"id": self.public_key_hex, "signature": signature_hex}],
+        }
+
+        return signed_transaction
+
+    def sign_many(self, transactions: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Sign a batch of metagraph transactions.
+
+        Equivalent to calling sign_metagraph_transaction() for each
+        transaction, with the proof id and signing method looked up once
+        for the whole batch.
+
+        Args:
+            transactions: Metagraph transactions to sign
+
+        Returns:
+            Signed transactions, in input order
+
+        Example:
+            >>> signed_a, signed_b = account.sign_many([tx_a, tx_b])
+        """
+        proof_id = self.public_key_hex
+        sign = self.private_key.sign
+
+        signed_transactions = []
+        for transaction_data in transactions:
+            value = self._metagraph_value(transaction_data)
+            signature = sign(_canonical_json(value), _ECDSA_SHA256)
+            signed_transactions.append(
+                {
+                    "value": value,
+                    "proofs": [{"id": proof_id, "signature": signature.hex()}],
+                }
+            )
+        return signed_transactions
+
+    @staticmethod
+    def _metagraph_value(transaction_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the signed value of a metagraph transaction."""
         # Handle metagraph-specific transaction structure
         if "data" in transaction_data:
             # Data submission transaction
@@ -216,18 +351,48 @@ class Account:
             if "parent" in transaction_data:
                 value["parent"] = transaction_data["parent"]
 
-        # Create hash of the value for signing
-        value_json = json.dumps(value, sort_keys=True, separators=(",", ":"))
-        value_bytes = value_json.encode("utf-8")
+        return value
 
-        # Create signature
-        signature = self.private_key.sign(value_bytes, ec.ECDSA(hashes.SHA256()))
-        signature_hex = signature.hex()
 
-        # Create the complete signed transaction
-        signed_transaction = {
-            "value": value,
-            "proofs": [{"id": self.public_key_hex, "signature": signature_hex}],
-        }
+@functools.lru_cache(maxsize=1024)
+def _load_public_key(public_key_hex: str) -> ec.EllipticCurvePublicKey:
+    """Parse an uncompressed SECP256K1 public key, memoized per signer."""
+    return ec.EllipticCurvePublicKey.from_encoded_point(
+        ec.SECP256K1(), bytes.fromhex(public_key_hex)
+    )
 
-        return signed_transaction
+
+def verify_transactions(
+    signed_transactions: Iterable[Dict[str, Any]],
+) -> List[bool]:
+    """
+    Verify the proofs of many signed transactions.
+
+    Each transaction value is serialized once, and signer public keys are
+    parsed once per distinct key, so verifying many transactions from the same
+    accounts only pays for the ECDSA checks themselves.
+
+    Args:
+        signed_transactions: Transactions as returned by sign_transaction()
+            or sign_metagraph_transaction()
+
+    Returns:
+        One flag per transaction, True if it has proofs and all of them verify
+
+    Example:
+        >>> signed = [alice.sign_transaction(tx) for tx in transfers]
+        >>> assert all(verify_transactions(signed))
+    """
+    results = []
+    for transaction in signed_transactions:
+        try:
+            value_bytes = _canonical_json(transaction["value"])
+            proofs = transaction["proofs"]
+            for proof in proofs:
+                _load_public_key(proof["id"]).verify(
+                    bytes.fromhex(proof["signature"]), value_bytes, _ECDSA_SHA256
+                )
+            results.append(bool(proofs))
+        except (InvalidSignature, KeyError, TypeError, ValueError):
+            results.append(False)
+    return results
@@ -24,6 +24,13 @@ except ImportError:
     ClientTimeout = None
     ClientResponse = None
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from .batch import (
     BatchOperation,
     BatchOperationType,
@@ -48,6 +55,18 @@ from .logging import get_network_logger, get_performance_tracker
 from .validation import AddressValidator, AmountValidator
 
 
+def _json_loads(text: str) -> Any:
+    """
+    Decode a JSON response body, using orjson when it is installed.
+
+    orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers
+    catching the stdlib error work with either decoder.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
 class AsyncHTTPClient:
     """
     High-performance async HTTP client with connection pooling and retry logic.
@@ -97,6 +116,7 @@ class AsyncHTTPClient:
                 limit_per_host=self.config.connector_limit_per_host,
                 ttl_dns_cache=self.config.connector_ttl_dns_cache,
                 use_dns_cache=self.config.connector_use_dns_cache,
+                keepalive_timeout=self.config.connector_keepalive_timeout,
                 ssl=False if not self.config.verify_ssl else None,
                 enable_cleanup_closed=True,
             )
@@ -147,7 +167,7 @@ class AsyncHTTPClient:
             )
             if sleep_time > 0:
                 self.logger.logger.warning(
-                    f"Rate limit exceeded, sleeping for {sleep_time:.2f}s"
+                    "Rate limit exceeded, sleeping for %.2fs", sleep_time
                 )
                 await asyncio.sleep(sleep_time)
                 self._rate_limit_window_start = time.time()
@@ -198,7 +218,7 @@ class AsyncHTTPClient:
                 start_time = time.time()
 
                 self.logger.logger.debug(
-                    f"Making {method} request to {url} (attempt {attempt + 1})"
+                    "Making %s request to %s (attempt %d)", method, url, attempt + 1
                 )
 
                 async with self._session.request(method, url, **kwargs) as response:
@@ -219,8 +239,10 @@ class AsyncHTTPClient:
 
                     # Parse JSON response
                     try:
-                        data = await response.json()
-                        self.logger.logger.debug(f"Request successful: {method} {url}")
+                        data = await response.json(loads=_json_loads)
+                        self.logger.logger.debug(
+                            "Request successful: %s %s", method, url
+                        )
                         return data
                     except json.JSONDecodeError as e:
                         text = await response.text()
@@ -230,12 +252,14 @@ class AsyncHTTPClient:
 
             except asyncio.TimeoutError as e:
                 last_exception = TimeoutError(f"Request timeout: {url}")
-                self.logger.logger.warning(f"Timeout on attempt {attempt + 1}: {url}")
+                self.logger.logger.warning(
+                    "Timeout on attempt %d: %s", attempt + 1, url
+                )
 
             except aiohttp.ClientConnectionError as e:
                 last_exception = ConnectionError(f"Connection error: {e}")
                 self.logger.logger.warning(
-                    f"Connection error on attempt {attempt + 1}: {e}"
+                    "Connection error on attempt %d: %s", attempt + 1, e
                 )
 
             except HTTPError:
@@ -245,13 +269,13 @@ class AsyncHTTPClient:
             except Exception as e:
                 last_exception = NetworkError(f"Network error: {e}")
                 self.logger.logger.warning(
-                    f"Network error on attempt {attempt + 1}: {e}"
+                    "Network error on attempt %d: %s", attempt + 1, e
                 )
 
             # Wait before retry (with exponential backoff)
             if attempt < network_config.max_retries:
                 delay = network_config.retry_delay * (2**attempt)
-                self.logger.logger.debug(f"Retrying in {delay}s...")
+                self.logger.logger.debug("Retrying in %ss...", delay)
                 await asyncio.sleep(delay)
 
         # All retries exhausted
@@ -266,6 +290,11 @@ class AsyncNetwork:
     transaction submission, and node information retrieval.
     """
 
+    # Batch operations are dispatched in chunks of at most max_batch_size,
+    # with at most max_concurrent_chunks chunks of a batch in flight at once
+    max_batch_size = 50
+    max_concurrent_chunks = 4
+
     def __init__(self, network_config: Optional[NetworkConfig] = None):
         """
         Initialize async network client.
@@ -368,7 +397,7 @@ class AsyncNetwork:
         cache_key = self._get_cache_key(f"/addresses/{address}/balance")
 
         if self._is_cache_valid(cache_key):
-            self.logger.logger.debug(f"Returning cached balance for {address}")
+            self.logger.logger.debug("Returning cached balance for %s", address)
             return self._cache[cache_key]
 
         url = urljoin(self.config.l0_url, f"/addresses/{address}/balance")
@@ -496,7 +525,7 @@ class AsyncNetwork:
             for i, (address, result) in enumerate(zip(addresses, results)):
                 if isinstance(result, Exception):
                     self.logger.logger.warning(
-                        f"Failed to get balance for {address}: {result}"
+                        "Failed to get balance for %s: %s", address, result
                     )
                     balances[address] = {"error": str(result)}
                 else:
@@ -521,7 +550,7 @@ class AsyncNetwork:
             elapsed = time.time() - start_time
 
             self.perf_tracker.end_operation("health_check", success=True)
-            self.logger.logger.info(f"Health check passed in {elapsed:.2f}s")
+            self.logger.logger.info("Health check passed in %.2fs", elapsed)
             return True
 
         except Exception as e:
@@ -573,14 +602,21 @@ class AsyncNetwork:
                 f"Batch validation failed: {'; '.join(validation_errors)}"
             )
 
-        # Create concurrent tasks for all operations
-        tasks = [
-            self._execute_single_operation_async(operation) for operation in operations
+        chunk_size = self.max_batch_size
+        chunks = [
+            operations[i : i + chunk_size]
+            for i in range(0, len(operations), chunk_size)
         ]
 
+        # Created per call so it binds to the event loop running this batch
+        semaphore = asyncio.Semaphore(self.max_concurrent_chunks)
+
         try:
-            # Execute all operations concurrently
-            results = await asyncio.gather(*tasks, return_exceptions=True)
+            # Execute chunks concurrently, bounded by the semaphore
+            chunk_results = await asyncio.gather(
+                *[self._dispatch_batch_chunk(chunk, semaphore) for chunk in chunks]
+            )
+            results = [result for chunk in chunk_results for result in chunk]
 
             # Process results
             batch_results = []
@@ -628,13 +664,37 @@ class AsyncNetwork:
             "failed_operations": len(failed_ops),
             "success_rate": len(successful_ops) / len(operations) * 100,
             "execution_time": execution_time,
-            "concurrent_execution": True,
+            "concurrent_execution": len(operations) > 1,
+            "chunks": len(chunks),
+            "concurrent_chunks": min(len(chunks), self.max_concurrent_chunks) > 1,
         }
 
         return BatchResponse(
             results=batch_results, summary=summary, execution_time=execution_time
         )
 
+    async def _dispatch_batch_chunk(
+        self, operations: List[BatchOperation], semaphore: asyncio.Semaphore
+    ) -> List[Any]:
+        """
+        Execute one chunk of batch operations concurrently.
+
+        Args:
+            operations: Operations in this chunk
+            semaphore: Bounds how many chunks of the batch run at once
+
+        Returns:
+            Operation results, or the raised exception for failed operations
+        """
+        async with semaphore:
+            return await asyncio.gather(
+                *[
+                    self._execute_single_operation_async(operation)
+                    for operation in operations
+                ],
+                return_exceptions=True,
+            )
+
     async def _execute_single_operation_async(self, operation: BatchOperation) -> Any:
         """
         Execute a single batch operation asynchronously.
@@ -818,7 +878,7 @@ class AsyncNetwork:
         cache_key = self._get_cache_key(f"/addresses/{address}/ordinal")
 
         if self._is_cache_valid(cache_key):
-            self.logger.logger.debug(f"Returning cached ordinal for {address}")
+            self.logger.logger.debug("Returning cached ordinal for %s", address)
             return self._cache[cache_key]
 
         url = urljoin(self.config.be_url, f"/addresses/{address}/ordinal")
@@ -829,7 +889,7 @@ class AsyncNetwork:
             self._cache_response(cache_key, ordinal)
             return ordinal
         except Exception as e:
-            self.logger.logger.warning(f"Failed to get ordinal for {address}: {e}")
+            self.logger.logger.warning("Failed to get ordinal for %s: %s", address, e)
             return 0  # Default to 0 if operation failed
 
     async def get_transactions(
@@ -850,7 +910,7 @@ class AsyncNetwork:
         )
 
         if self._is_cache_valid(cache_key):
-            self.logger.logger.debug(f"Returning cached transactions for {address}")
+            self.logger.logger.debug("Returning cached transactions for %s", address)
             return self._cache[cache_key]
 
         url = urljoin(self.config.be_url, f"/addresses/{address}/transactions")
@@ -863,7 +923,9 @@ class AsyncNetwork:
             self._cache_response(cache_key, transactions)
             return transactions
         except Exception as e:
-            self.logger.logger.warning(f"Failed to get transactions for {address}: {e}")
+            self.logger.logger.warning(
+                "Failed to get transactions for %s: %s", address, e
+            )
             return []  # Default to empty list if operation failed
 
     async def get_recent_transactions(self, limit: int = 50) -> List[Dict[str, Any]]:
@@ -892,7 +954,7 @@ class AsyncNetwork:
             self._cache_response(cache_key, transactions)
             return transactions
         except Exception as e:
-            self.logger.logger.warning(f"Failed to get recent transactions: {e}")
+            self.logger.logger.warning("Failed to get recent transactions: %s", e)
             return []  # Default to empty list if operation failed
 
     async def get_cluster_info(self) -> List[Dict[str, Any]]:
@@ -916,7 +978,7 @@ class AsyncNetwork:
             self._cache_response(cache_key, cluster_info)
             return cluster_info
         except Exception as e:
-            self.logger.logger.warning(f"Failed to get cluster info: {e}")
+            self.logger.logger.warning("Failed to get cluster info: %s", e)
             return []  # Default to empty list if operation failed
 
 
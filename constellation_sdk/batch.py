@@ -5,9 +5,15 @@ This module provides enhanced REST capabilities for executing multiple operation
 in a single API call, improving performance and reducing network round trips.
 """
 
+import sys
+from collections import defaultdict
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
+
+# Per-operation dataclasses drop their __dict__ where dataclass(slots=True)
+# is supported (Python 3.10+)
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
 
 class BatchOperationType(Enum):
@@ -22,7 +28,13 @@ class BatchOperationType(Enum):
     SUBMIT_TRANSACTION = "submit_transaction"
 
 
-@dataclass
+# Direct lookups between operation types and their wire names, avoiding
+# Enum value coercion on the batch construction path
+_OP_WIRE: Dict[BatchOperationType, str] = {op: op.value for op in BatchOperationType}
+_OP_PARSE: Dict[str, BatchOperationType] = {v: k for k, v in _OP_WIRE.items()}
+
+
+@dataclass(**_SLOTS)
 class BatchOperation:
     """
     Represents a single operation in a batch request.
@@ -37,8 +49,34 @@ class BatchOperation:
     params: Dict[str, Any]
     id: Optional[str] = None
 
+    @classmethod
+    def build_many(
+        cls,
+        operation: BatchOperationType,
+        params_list: Iterable[Dict[str, Any]],
+        id_prefix: str,
+    ) -> List["BatchOperation"]:
+        """
+        Create one operation of the same type per params entry.
 
-@dataclass
+        The operation type is passed as an enum, so no string parsing happens
+        per operation.
+
+        Args:
+            operation: Type shared by all operations
+            params_list: Parameters for each operation
+            id_prefix: Operations are identified as "{id_prefix}_{index}"
+
+        Returns:
+            List of BatchOperation instances
+        """
+        return [
+            cls(operation, params, f"{id_prefix}_{i}")
+            for i, params in enumerate(params_list)
+        ]
+
+
+@dataclass(**_SLOTS)
 class BatchResult:
     """
     Result of a single batch operation.
@@ -57,6 +95,16 @@ class BatchResult:
     error: Optional[str] = None
     id: Optional[str] = None
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize the result with the operation's wire name."""
+        return {
+            "id": self.id,
+            "operation": _OP_WIRE[self.operation],
+            "success": self.success,
+            "data": self.data,
+            "error": self.error,
+        }
+
 
 @dataclass
 class BatchResponse:
@@ -73,16 +121,41 @@ class BatchResponse:
     summary: Dict[str, Any] = field(default_factory=dict)
     execution_time: Optional[float] = None
 
+    def __post_init__(self):
+        # Index results once so lookups by ID or ID prefix are O(1)
+        self._by_id: Dict[str, BatchResult] = {}
+        self._by_prefix: Dict[str, List[BatchResult]] = defaultdict(list)
+        for result in self.results:
+            if result.id is None:
+                continue
+            self._by_id.setdefault(result.id, result)
+            prefix = result.id.rpartition("_")[0]
+            if prefix:
+                self._by_prefix[prefix].append(result)
+
     def get_result(self, operation_id: str) -> Optional[BatchResult]:
         """Get result by operation ID."""
-        for result in self.results:
-            if result.id == operation_id:
-                return result
-        return None
+        return self._by_id.get(operation_id)
+
+    def results_by_prefix(self, prefix: str) -> Iterator[BatchResult]:
+        """
+        Iterate over results whose ID is "{prefix}_{suffix}".
+
+        Args:
+            prefix: ID prefix, with or without the trailing underscore
+
+        Returns:
+            Iterator over matching results in batch order
+        """
+        return iter(self._by_prefix.get(prefix.rstrip("_"), ()))
+
+    def iter_successful(self) -> Iterator[BatchResult]:
+        """Iterate over successful results without building a list."""
+        return (r for r in self.results if r.success)
 
     def get_successful_results(self) -> List[BatchResult]:
         """Get only successful results."""
-        return [r for r in self.results if r.success]
+        return list(self.iter_successful())
 
     def get_failed_results(self) -> List[BatchResult]:
         """Get only failed results."""
@@ -92,7 +165,8 @@ class BatchResponse:
         """Calculate success rate as percentage."""
         if not self.results:
             return 0.0
-        return (len(self.get_successful_results()) / len(self.results)) * 100
+        successful = sum(1 for _ in self.iter_successful())
+        return (successful / len(self.results)) * 100
 
 
 class BatchValidator:
@@ -204,8 +278,8 @@ def create_batch_operation(
     """
     if isinstance(operation, str):
         try:
-            operation = BatchOperationType(operation)
-        except ValueError:
+            operation = _OP_PARSE[operation]
+        except KeyError:
             raise ValueError(f"Invalid operation type: {operation}")
 
     return BatchOperation(operation=operation, params=params, id=operation_id)
@@ -214,37 +288,28 @@ def create_batch_operation(
 # Convenience functions for common batch operations
 def batch_get_balances(addresses: List[str]) -> List[BatchOperation]:
     """Create batch operations to get balances for multiple addresses."""
-    return [
-        create_batch_operation(
-            BatchOperationType.GET_BALANCE,
-            {"address": address},
-            operation_id=f"balance_{i}",
-        )
-        for i, address in enumerate(addresses)
-    ]
+    return BatchOperation.build_many(
+        BatchOperationType.GET_BALANCE,
+        ({"address": address} for address in addresses),
+        "balance",
+    )
 
 
 def batch_get_transactions(
     addresses: List[str], limit: int = 10
 ) -> List[BatchOperation]:
     """Create batch operations to get transactions for multiple addresses."""
-    return [
-        create_batch_operation(
-            BatchOperationType.GET_TRANSACTIONS,
-            {"address": address, "limit": limit},
-            operation_id=f"transactions_{i}",
-        )
-        for i, address in enumerate(addresses)
-    ]
+    return BatchOperation.build_many(
+        BatchOperationType.GET_TRANSACTIONS,
+        ({"address": address, "limit": limit} for address in addresses),
+        "transactions",
+    )
 
 
 def batch_get_ordinals(addresses: List[str]) -> List[BatchOperation]:
     """Create batch operations to get ordinals for multiple addresses."""
-    return [
-        create_batch_operation(
-            BatchOperationType.GET_ORDINAL,
-            {"address": address},
-            operation_id=f"ordinal_{i}",
-        )
-        for i, address in enumerate(addresses)
-    ]
+    return BatchOperation.build_many(
+        BatchOperationType.GET_ORDINAL,
+        ({"address": address} for address in addresses),
+        "ordinal",
+    )
@@ -0,0 +1,149 @@
+"""
+Short-lived result caching for the SDK's read-heavy queries.
+
+Provides a small thread-safe TTL cache and a decorator that memoizes a
+function in one, used by Network's per-client response cache and by the
+module-level metagraph discovery cache.
+"""
+
+import copy
+import functools
+import inspect
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional, Tuple
+
+
+class TTLCache:
+    """
+    Thread-safe cache whose entries expire a fixed number of seconds after
+    they are stored.
+
+    The oldest entry is evicted once maxsize entries are held.
+
+    Example:
+        >>> cache = TTLCache(ttl=1.0, maxsize=128)
+        >>> cache.set(("balance", "DAG4J6..."), 100)
+        >>> hit, value = cache.get(("balance", "DAG4J6..."))
+    """
+
+    def __init__(self, ttl: float, maxsize: int):
+        """
+        Create an empty cache.
+
+        Args:
+            ttl: Seconds an entry stays valid after it is stored
+            maxsize: Maximum number of entries kept
+        """
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Tuple[bool, Any]:
+        """
+        Look up an unexpired entry.
+
+        Args:
+            key: Entry key
+
+        Returns:
+            Tuple of (hit, value); value is None on a miss
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return False, None
+            if entry[0] <= now:
+                del self._entries[key]
+                return False, None
+            return True, entry[1]
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Store an entry, evicting the oldest one if the cache is full.
+
+        Args:
+            key: Entry key
+            value: Value to cache
+        """
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def discard(self, predicate: Callable[[Hashable], bool]) -> None:
+        """
+        Drop every entry whose key matches a predicate.
+
+        Args:
+            predicate: Called with each key; entries it returns True for
+                are removed
+        """
+        with self._lock:
+            for key in [k for k in self._entries if predicate(k)]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._entries.clear()
+
+
+def ttl_cached(
+    resolve: Callable[[Tuple[Any, ...]], Optional[Tuple[TTLCache, Tuple[Any, ...]]]],
+    copy_result: Callable[[Any], Any] = copy.deepcopy,
+) -> Callable:
+    """
+    Memoize a function in a TTLCache chosen per call.
+
+    Call arguments are bound to the function's signature with defaults
+    applied, so positional and keyword calls share one entry. resolve()
+    receives the argument values in parameter order and returns the cache
+    and key parts to use, or None to bypass caching for that call. Entries
+    are keyed on (function name, *key parts).
+
+    Callers get copy_result(value), a deep copy unless another copier is
+    given, so mutating a returned value never alters the cached entry.
+    Exceptions are not cached.
+
+    Args:
+        resolve: Maps bound argument values to (cache, key parts) or None
+        copy_result: Copies a cached value before it is returned
+
+    Example:
+        >>> _cache = TTLCache(ttl=60.0, maxsize=8)
+        >>> @ttl_cached(lambda arguments: (_cache, arguments))
+        ... def discover(network="mainnet"):
+        ...     ...
+    """
+
+    def decorator(func: Callable) -> Callable:
+        signature = inspect.signature(func)
+        name = func.__name__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            target = resolve(tuple(bound.arguments.values()))
+            if target is None:
+                return func(*args, **kwargs)
+
+            cache, key_parts = target
+            key = (name,) + tuple(key_parts)
+            hit, value = cache.get(key)
+            if not hit:
+                value = func(*args, **kwargs)
+                cache.set(key, value)
+            return copy_result(value)
+
+        return wrapper
+
+    return decorator
@@ -1543,16 +1543,7 @@ def batch_custom_cmd(ctx, operations_file, output_file):
 
         if ctx.obj["output_format"] == "json":
             output_data = {
-                "results": [
-                    {
-                        "id": result.id,
-                        "operation": result.operation.value,
-                        "success": result.success,
-                        "data": result.data,
-                        "error": result.error,
-                    }
-                    for result in response.results
-                ],
+                "results": [result.to_dict() for result in response.results],
                 "summary": response.summary,
             }
             if output_file:
@@ -66,6 +66,7 @@ class AsyncConfig:
     connector_limit_per_host: int = 30  # Connections per host
     connector_ttl_dns_cache: int = 300  # DNS cache TTL
     connector_use_dns_cache: bool = True  # Use DNS caching
+    connector_keepalive_timeout: float = 30.0  # Idle keep-alive lifetime
 
     # Timeout settings
     total_timeout: int = 30  # Total request timeout
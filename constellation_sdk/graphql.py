@@ -7,12 +7,13 @@ metagraphs, and network data.
 """
 
 import asyncio
+import functools
 import json
 import logging
 import time
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, AsyncGenerator, Dict, List, Optional, Union
+from typing import Any, AsyncGenerator, Dict, List, NamedTuple, Optional, Union
 
 try:
     import aiohttp
@@ -36,6 +37,33 @@ class GraphQLOperationType(Enum):
     SUBSCRIPTION = "subscription"
 
 
+class _QueryPlan(NamedTuple):
+    """Selections the REST translation layer serves for a query document."""
+
+    account: bool
+    transactions: bool
+    network: bool
+    metagraph: bool
+
+
+@functools.lru_cache(maxsize=256)
+def _plan_query(query: str) -> _QueryPlan:
+    """
+    Work out which selections a query document needs.
+
+    Documents are static in practice, so the plan is cached per document the
+    way a server caches persisted queries, instead of rescanning the text on
+    every execution.
+    """
+    query_str = query.lower()
+    return _QueryPlan(
+        account="account" in query_str,
+        transactions="transactions" in query_str,
+        network="network" in query_str,
+        metagraph="metagraph" in query_str,
+    )
+
+
 @dataclass
 class GraphQLQuery:
     """
@@ -106,7 +134,6 @@ class GraphQLClient:
         self.subscription_endpoint = self._get_subscription_endpoint()
 
         # Client state
-        self._session = None
         self._websocket = None
         self._subscription_tasks = {}
 
@@ -186,6 +213,10 @@ class GraphQLClient:
         """
         Execute GraphQL query asynchronously.
 
+        The REST translation runs in the default executor, so independent
+        queries awaited together overlap their network I/O. Connections are
+        reused through the network client's pooled HTTP session.
+
         Args:
             query: GraphQL query string or GraphQLQuery object
             variables: Query variables
@@ -204,10 +235,6 @@ class GraphQLClient:
         start_time = time.time()
 
         try:
-            # Initialize async session if needed
-            if not self._session:
-                self._session = aiohttp.ClientSession()
-
             # For now, simulate GraphQL execution
             response_data = await self._execute_via_rest_translation_async(query)
 
@@ -299,13 +326,13 @@ class GraphQLClient:
         This is a simulation layer until full GraphQL endpoint is available.
         """
         # Parse query to determine what data is needed
-        query_str = query.query.lower()
+        plan = _plan_query(query.query)
         variables = query.variables
 
         result = {}
 
         # Account queries
-        if "account" in query_str and "address" in variables:
+        if plan.account and "address" in variables:
             address = variables["address"]
             AddressValidator.validate(address)
 
@@ -315,7 +342,7 @@ class GraphQLClient:
             }
 
             # Add transactions if requested
-            if "transactions" in query_str:
+            if plan.transactions:
                 try:
                     # Simulate transaction history
                     account_data["transactions"] = []
@@ -325,7 +352,7 @@ class GraphQLClient:
             result["account"] = account_data
 
         # Network queries
-        if "network" in query_str:
+        if plan.network:
             try:
                 network_data = {
                     "status": "active",
@@ -337,7 +364,7 @@ class GraphQLClient:
                 self.logger.warning(f"Failed to get network data: {e}")
 
         # Metagraph queries
-        if "metagraph" in query_str and "id" in variables:
+        if plan.metagraph and "id" in variables:
             metagraph_id = variables["id"]
             try:
                 # Simulate metagraph data
@@ -357,9 +384,12 @@ class GraphQLClient:
         """
         Async version of REST translation.
         """
-        # For now, just call the sync version
-        # In production, this would use async HTTP calls
-        return self._execute_via_rest_translation(query)
+        # The translation makes blocking REST calls, so run it in the default
+        # executor to keep the event loop free while it waits on the network
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, functools.partial(self._execute_via_rest_translation, query)
+        )
 
     async def _simulate_subscription(
         self, subscription: GraphQLQuery
@@ -399,9 +429,8 @@ class GraphQLClient:
         }
 
     async def close(self):
-        """Close async resources."""
-        if self._session:
-            await self._session.close()
+        """Close async resources and the network client's HTTP session."""
+        self.network_client.close()
 
         if self._websocket:
             await self._websocket.close()
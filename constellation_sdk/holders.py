@@ -0,0 +1,96 @@
+"""
+Columnar analytics over snapshot holder balances.
+
+Wraps the list returned by Network.get_snapshot_holders() in NumPy arrays so
+aggregates such as top-K, totals and concentration run as vectorized
+operations instead of Python loops over dictionaries.
+"""
+
+from typing import Any, Dict, List
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+from .exceptions import ConstellationError
+
+
+class HoldersView:
+    """
+    Read-only view over snapshot holders backed by NumPy arrays.
+
+    Example:
+        >>> view = HoldersView(network.get_snapshot_holders())
+        >>> for holder in view.top(5):
+        ...     print(holder["wallet"], holder["amount"])
+    """
+
+    def __init__(self, holders: List[Dict[str, Any]]):
+        """
+        Build the view from holder dictionaries.
+
+        Args:
+            holders: List of {"wallet": str, "amount": float} dictionaries
+        """
+        if not NUMPY_AVAILABLE:
+            raise ConstellationError(
+                "NumPy support required. Install with: pip install numpy"
+            )
+
+        self.wallets = np.array([h["wallet"] for h in holders], dtype=object)
+        self.amounts = np.fromiter(
+            (h["amount"] for h in holders), dtype=np.float64, count=len(holders)
+        )
+
+    def __len__(self) -> int:
+        return len(self.amounts)
+
+    def top(self, k: int) -> List[Dict[str, Any]]:
+        """
+        Get the k largest holders, largest first.
+
+        Args:
+            k: Number of holders to return
+
+        Returns:
+            List of {"wallet", "amount"} dictionaries
+        """
+        count = len(self.amounts)
+        if k <= 0 or count == 0:
+            return []
+
+        if k < count:
+            indices = np.argpartition(self.amounts, -k)[-k:]
+        else:
+            indices = np.arange(count)
+        indices = indices[np.argsort(self.amounts[indices])[::-1]]
+
+        return [
+            {"wallet": self.wallets[i], "amount": float(self.amounts[i])}
+            for i in indices
+        ]
+
+    def total(self) -> float:
+        """Get the sum of all holder balances in DAG."""
+        return float(self.amounts.sum())
+
+    def gini(self) -> float:
+        """
+        Get the Gini coefficient of holder balances.
+
+        Returns:
+            Value between 0.0 (perfectly equal) and 1.0 (fully concentrated)
+        """
+        count = len(self.amounts)
+        total = self.amounts.sum()
+        if count == 0 or total == 0:
+            return 0.0
+
+        ranked = np.sort(self.amounts)
+        weights = np.arange(1, count + 1)
+        return float(
+            2 * np.dot(weights, ranked) / (count * total) - (count + 1) / count
+        )
@@ -101,15 +101,22 @@ class ConstellationLogger:
             return self.context.data.copy()
         return {}
 
-    def _log_structured(self, level: int, message: str, **kwargs):
+    def _log_structured(self, level: int, message: str, *args, **kwargs):
         """
         Log structured message with context.
 
         Args:
             level: Logging level
-            message: Log message
+            message: Log message, %-formatted with args if any are given
+            *args: Arguments for lazy %-style message formatting
             **kwargs: Additional structured data
         """
+        # Formatting and JSON encoding only happen for enabled levels
+        if not self.logger.isEnabledFor(level):
+            return
+        if args:
+            message = message % args
+
         data = {
             "message": message,
             "timestamp": datetime.now(timezone.utc).isoformat(),
@@ -120,17 +127,17 @@ class ConstellationLogger:
         # Log as JSON for structured logging
         self.logger.log(level, json.dumps(data, default=str))
 
-    def debug(self, message: str, **kwargs):
+    def debug(self, message: str, *args, **kwargs):
         """Log debug message."""
-        self._log_structured(logging.DEBUG, message, **kwargs)
+        self._log_structured(logging.DEBUG, message, *args, **kwargs)
 
-    def info(self, message: str, **kwargs):
+    def info(self, message: str, *args, **kwargs):
         """Log info message."""
-        self._log_structured(logging.INFO, message, **kwargs)
+        self._log_structured(logging.INFO, message, *args, **kwargs)
 
-    def warning(self, message: str, **kwargs):
+    def warning(self, message: str, *args, **kwargs):
         """Log warning message."""
-        self._log_structured(logging.WARNING, message, **kwargs)
+        self._log_structured(logging.WARNING, message, *args, **kwargs)
 
     def error(self, message: str, error: Optional[Exception] = None, **kwargs):
         """
@@ -9,13 +9,28 @@ automated node testing deployments. Real production metagraphs are primarily
 on MainNet (~7) with some active ones on test networks.
 """
 
-from typing import Any, Dict, List, Optional, Union
+import asyncio
+import functools
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
+from .cache import TTLCache, ttl_cached
 from .config import NetworkConfig
 from .exceptions import ConstellationError
-from .network import Network, NetworkError
+from .network import (
+    MAX_RETRIES,
+    POOL_CONNECTIONS,
+    POOL_MAXSIZE,
+    RETRY_BACKOFF_FACTOR,
+    Network,
+    NetworkError,
+)
 
 # GraphQL integration (optional)
 try:
@@ -30,6 +45,39 @@ try:
 except ImportError:
     GRAPHQL_AVAILABLE = False
 
+# Categories assigned by _categorize_metagraph() that are not production
+_TEST_CATEGORIES = frozenset(("test", "automated"))
+
+# Production metagraph lists change rarely; cache discovery results briefly
+DISCOVERY_CACHE_TTL = 60.0  # seconds
+DISCOVERY_CACHE_MAXSIZE = 8
+
+_discovery_cache = TTLCache(DISCOVERY_CACHE_TTL, DISCOVERY_CACHE_MAXSIZE)
+
+# Block explorer session shared by every MetagraphClient, so clients created
+# per call or per network still reuse keep-alive connections
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+
+def _get_session() -> requests.Session:
+    """Get the shared block explorer session, creating it on first use."""
+    global _session
+    with _session_lock:
+        if _session is None:
+            adapter = HTTPAdapter(
+                pool_connections=POOL_CONNECTIONS,
+                pool_maxsize=POOL_MAXSIZE,
+                max_retries=Retry(
+                    total=MAX_RETRIES, backoff_factor=RETRY_BACKOFF_FACTOR
+                ),
+            )
+            session = requests.Session()
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _session = session
+        return _session
+
 
 class MetagraphError(ConstellationError):
     """Exception for metagraph-related errors."""
@@ -134,7 +182,7 @@ class MetagraphClient:
             if limit is not None:
                 params["limit"] = limit
 
-            response = requests.get(currency_url, params=params, timeout=10)
+            response = _get_session().get(currency_url, params=params, timeout=10)
 
             if response.status_code != 200:
                 raise MetagraphError(
@@ -159,10 +207,10 @@ class MetagraphClient:
                 }
 
                 # Filter based on include_test_deployments flag
-                if not include_test_deployments and metagraph["category"] in [
-                    "test",
-                    "automated",
-                ]:
+                if (
+                    not include_test_deployments
+                    and metagraph["category"] in _TEST_CATEGORIES
+                ):
                     continue
 
                 metagraphs.append(metagraph)
@@ -187,6 +235,32 @@ class MetagraphClient:
         """
         return self.discover_metagraphs(include_test_deployments=False)
 
+    def partition_deployments(
+        self,
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Split all deployments into production and test metagraphs.
+
+        Fetches the deployment list once and partitions it in a single pass,
+        instead of calling discover_production_metagraphs() and
+        discover_metagraphs(include_test_deployments=True) separately.
+
+        Returns:
+            Tuple of (production metagraphs, test/automated deployments)
+
+        Example:
+            >>> client = MetagraphClient('testnet')
+            >>> production, test = client.partition_deployments()
+            >>> print(f"Filtered out: {len(test)} test deployments")
+        """
+        production, test = [], []
+        for metagraph in self.discover_metagraphs(include_test_deployments=True):
+            if metagraph["category"] in _TEST_CATEGORIES:
+                test.append(metagraph)
+            else:
+                production.append(metagraph)
+        return production, test
+
     def _categorize_metagraph(self, currency: Dict[str, Any]) -> str:
         """
         Categorize a metagraph as 'production', 'test', or 'automated'.
@@ -229,7 +303,7 @@ class MetagraphClient:
         try:
             # Get balance information
             balance_url = f"{self.base_url}/addresses/{metagraph_id}/balance"
-            balance_response = requests.get(balance_url, timeout=5)
+            balance_response = _get_session().get(balance_url, timeout=5)
 
             balance = 0
             if balance_response.status_code == 200:
@@ -238,7 +312,7 @@ class MetagraphClient:
 
             # Get transaction history
             tx_url = f"{self.base_url}/addresses/{metagraph_id}/transactions"
-            tx_response = requests.get(tx_url, timeout=5)
+            tx_response = _get_session().get(tx_url, timeout=5)
 
             transaction_count = 0
             if tx_response.status_code == 200:
@@ -271,19 +345,58 @@ class MetagraphClient:
             >>> print(f"Found {len(active_mgs)} active metagraphs")
         """
         all_metagraphs = self.discover_production_metagraphs()
+        infos = self.get_metagraphs_bulk_info([mg["id"] for mg in all_metagraphs])
         active_metagraphs = []
 
         for mg in all_metagraphs:
-            try:
-                info = self.get_metagraph_info(mg["id"])
-                if info.get("is_active", False):
-                    mg.update(info)
-                    active_metagraphs.append(mg)
-            except:
-                continue  # Skip if we can't get info
+            info = infos.get(mg["id"])
+            if info is not None and info.get("is_active", False):
+                mg.update(info)
+                active_metagraphs.append(mg)
 
         return active_metagraphs
 
+    def get_metagraphs_bulk_info(
+        self, metagraph_ids: List[str], max_workers: int = 8
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Get detailed information about several metagraphs.
+
+        The block explorer has no multi-metagraph endpoint, so the
+        get_metagraph_info() lookups run concurrently instead of one after
+        another.
+
+        Args:
+            metagraph_ids: The metagraph IDs (DAG addresses)
+            max_workers: Maximum number of concurrent metagraph lookups
+
+        Returns:
+            Dictionary mapping each metagraph ID to its information; IDs whose
+            lookup failed are left out
+
+        Example:
+            >>> client = MetagraphClient('mainnet')
+            >>> infos = client.get_metagraphs_bulk_info(['DAG7Ghth...', 'DAG0CyyS...'])
+            >>> active = [mg_id for mg_id, info in infos.items() if info['is_active']]
+        """
+
+        def lookup(metagraph_id: str) -> Optional[Dict[str, Any]]:
+            try:
+                return self.get_metagraph_info(metagraph_id)
+            except Exception:
+                return None  # Skip if we can't get info
+
+        max_workers = min(max_workers, len(metagraph_ids))
+        if max_workers <= 1:
+            infos = list(map(lookup, metagraph_ids))
+        else:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                infos = list(executor.map(lookup, metagraph_ids))
+
+        return {
+            mg_id: info for mg_id, info in zip(metagraph_ids, infos) if info is not None
+        }
+
     def get_balance(self, address: str, metagraph_id: str) -> float:
         """
         Get token balance for an address on a specific metagraph.
@@ -308,7 +421,7 @@ class MetagraphClient:
             # Use metagraph-specific balance endpoint
             balance_url = f"{self.base_url}/metagraphs/{metagraph_id}/balance"
             params = {"address": address}
-            response = requests.get(balance_url, params=params, timeout=5)
+            response = _get_session().get(balance_url, params=params, timeout=5)
 
             if response.status_code == 404:
                 # Check if it's specifically a metagraph not found error
@@ -357,6 +470,41 @@ class MetagraphClient:
                 raise ConstellationError("Request timeout")
             raise MetagraphError(f"Error getting balance: {e}")
 
+    def get_balances(
+        self, metagraph_id: str, addresses: List[str], max_workers: int = 8
+    ) -> Dict[str, float]:
+        """
+        Get token balances for several addresses on one metagraph.
+
+        The block explorer has no multi-address balance endpoint, so the
+        lookups run concurrently instead of one after another.
+
+        Args:
+            metagraph_id: The metagraph ID
+            addresses: Addresses to check balances for
+            max_workers: Maximum number of concurrent balance requests
+
+        Returns:
+            Dictionary mapping each address to its token balance
+
+        Example:
+            >>> client = MetagraphClient('mainnet')
+            >>> balances = client.get_balances('DAG7Ghth...', ['DAG4J6gix...', 'DAG123...'])
+            >>> print(f"Total: {sum(balances.values())}")
+        """
+        if metagraph_id is None or addresses is None:
+            raise ConstellationError("Addresses and metagraph_id cannot be None")
+
+        max_workers = min(max_workers, len(addresses))
+        if max_workers <= 1:
+            return {a: self.get_balance(a, metagraph_id) for a in addresses}
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            balances = executor.map(
+                lambda address: self.get_balance(address, metagraph_id), addresses
+            )
+            return dict(zip(addresses, balances))
+
     def get_transactions(
         self, address: str, metagraph_id: str, limit: Optional[int] = None
     ) -> List[Dict[str, Any]]:
@@ -387,7 +535,7 @@ class MetagraphClient:
             if limit is not None:
                 params["limit"] = limit
 
-            response = requests.get(tx_url, params=params, timeout=5)
+            response = _get_session().get(tx_url, params=params, timeout=5)
 
             if response.status_code == 404:
                 # Address or metagraph not found, return empty list
@@ -433,7 +581,7 @@ class MetagraphClient:
                 if value is not None:
                     params[key] = value
 
-            response = requests.get(data_url, params=params, timeout=5)
+            response = _get_session().get(data_url, params=params, timeout=5)
 
             if response.status_code == 404:
                 # Metagraph not found, return empty list
@@ -464,7 +612,7 @@ class MetagraphClient:
         try:
             # Assuming an endpoint structure like this.
             state_url = f"{self.base_url}/metagraphs/{metagraph_id}/state/{state_key}"
-            response = requests.get(state_url, timeout=5)
+            response = _get_session().get(state_url, timeout=5)
 
             if response.status_code == 200:
                 return response.json().get("data")
@@ -535,8 +683,6 @@ class MetagraphClient:
         Raises:
             MetagraphError: If the transaction is not confirmed within the timeout.
         """
-        import time
-
         start_time = time.time()
         while time.time() - start_time < timeout:
             try:
@@ -605,7 +751,7 @@ class MetagraphClient:
         for network in networks:
             try:
                 be_url = f"https://be-{network}.constellationnetwork.io/currency"
-                response = requests.get(be_url, timeout=5)
+                response = _get_session().get(be_url, timeout=5)
                 if response.status_code == 200:
                     currencies = response.json()["data"]
                     count = len(currencies)
@@ -639,6 +785,35 @@ class MetagraphClient:
 
         return summary
 
+    # Async variants: run the blocking lookups in the default executor so
+    # independent calls can be awaited together, sharing the pooled session
+    async def _run_in_executor(self, method, *args, **kwargs):
+        """Run a blocking client method without blocking the event loop."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, functools.partial(method, *args, **kwargs)
+        )
+
+    async def adiscover_production_metagraphs(self) -> List[Dict[str, Any]]:
+        """
+        Async version of discover_production_metagraphs().
+
+        Example:
+            >>> mainnet, testnet = await asyncio.gather(
+            ...     MetagraphClient('mainnet').adiscover_production_metagraphs(),
+            ...     MetagraphClient('testnet').adiscover_production_metagraphs(),
+            ... )
+        """
+        return await self._run_in_executor(self.discover_production_metagraphs)
+
+    async def aget_metagraph_info(self, metagraph_id: str) -> Dict[str, Any]:
+        """Async version of get_metagraph_info()."""
+        return await self._run_in_executor(self.get_metagraph_info, metagraph_id)
+
+    async def aget_network_summary(self) -> Dict[str, Any]:
+        """Async version of get_network_summary()."""
+        return await self._run_in_executor(self.get_network_summary)
+
     # Helper methods for transaction creation moved to transactions.py module
 
     # GraphQL-powered methods (enhanced functionality)
@@ -908,6 +1083,7 @@ class MetagraphClient:
 
 
 # Convenience functions for quick access
+@ttl_cached(lambda arguments: (_discovery_cache, arguments))
 def discover_production_metagraphs(network: str = "mainnet") -> List[Dict[str, Any]]:
     """
     Convenience function to discover production metagraphs on a network.
@@ -915,6 +1091,9 @@ def discover_production_metagraphs(network: str = "mainnet") -> List[Dict[str, A
     Args:
         network: Network name ('mainnet' recommended for production)
 
+    Results are cached per network for DISCOVERY_CACHE_TTL seconds; use
+    clear_discovery_cache() to force a fresh discovery.
+
     Returns:
         List of production metagraph dictionaries
 
@@ -923,14 +1102,42 @@ def discover_production_metagraphs(network: str = "mainnet") -> List[Dict[str, A
         >>> production_mgs = discover_production_metagraphs('mainnet')
         >>> print(f"Found {len(production_mgs)} production metagraphs")
     """
-    client = MetagraphClient(network)
-    return client.discover_production_metagraphs()
+    return MetagraphClient(network).discover_production_metagraphs()
+
 
+def clear_discovery_cache() -> None:
+    """Drop cached discovery results so the next call queries the network."""
+    _discovery_cache.clear()
 
+
+async def prewarm_metagraphs(network: str = "mainnet") -> List[Dict[str, Any]]:
+    """
+    Run production metagraph discovery in a worker thread to fill the cache.
+
+    Intended to be scheduled at application startup so later calls to
+    discover_production_metagraphs() are served from memory.
+
+    Args:
+        network: Network name to discover
+
+    Returns:
+        List of production metagraph dictionaries
+
+    Example:
+        >>> warmer = asyncio.create_task(prewarm_metagraphs('mainnet'))
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, discover_production_metagraphs, network)
+
+
+@ttl_cached(lambda arguments: (_discovery_cache, arguments))
 def get_realistic_metagraph_summary() -> Dict[str, Any]:
     """
     Get a realistic summary of metagraphs across all networks.
 
+    Cached like discover_production_metagraphs(); use clear_discovery_cache()
+    to force a fresh summary.
+
     Returns:
         Dictionary with realistic network summary
 
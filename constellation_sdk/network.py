@@ -3,10 +3,29 @@ Network interface for Constellation Network.
 Handles API calls, balance queries, transaction submission, and batch operations.
 """
 
+import re
+import sys
 import time
-from typing import Any, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import ijson
+
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
 
 from .batch import (
     BatchOperation,
@@ -19,8 +38,122 @@ from .batch import (
     batch_get_transactions,
     create_batch_operation,
 )
+from .cache import TTLCache, ttl_cached
 from .config import DEFAULT_CONFIGS, NetworkConfig
-from .exceptions import NetworkError
+from .exceptions import AddressValidationError, NetworkError
+from .validation import AddressValidator
+
+if TYPE_CHECKING:
+    from .holders import HoldersView
+
+# Connection pool sizing for the shared HTTP session
+POOL_CONNECTIONS = 4
+POOL_MAXSIZE = 16
+MAX_RETRIES = 3
+RETRY_BACKOFF_FACTOR = 0.2
+
+# Legacy 38-character hex address format accepted by Network.validate_address
+_HEX_ADDRESS_RE = re.compile(r"DAG[0-9A-Fa-f]{35}")
+
+# Latest combined global snapshot (mainnet Global L0)
+SNAPSHOT_COMBINED_URL = (
+    "http://l0-lb-mainnet.constellationnetwork.io/global-snapshots/latest/combined"
+)
+# Placeholder wallet excluded from holder listings
+_ZERO_WALLET = "0000000000000000000000000000000000000000"
+
+# Short-lived response cache for read-heavy queries
+CACHE_TTL = 1.0  # seconds
+CACHE_MAXSIZE = 1024
+
+
+def _parse_json(response: requests.Response) -> Any:
+    """
+    Decode a JSON response body, using orjson when it is installed.
+
+    orjson parses the raw bytes directly, skipping the text decode that
+    Response.json() performs first.
+    """
+    if ORJSON_AVAILABLE:
+        content = response.content
+        if isinstance(content, (bytes, bytearray, memoryview, str)):
+            return orjson.loads(content)
+    return response.json()
+
+
+# Transaction fields holding addresses that recur across a batch
+_ADDRESS_FIELDS = ("source", "destination")
+
+
+def _intern_addresses(transactions: Any) -> Any:
+    """
+    Intern the address fields of decoded transactions in place.
+
+    The same few addresses appear in most transactions of a portfolio batch;
+    interning collapses the copies into one object and lets later dict
+    lookups by address hit the identity fast path. Dictionary keys need no
+    treatment because both json and orjson already reuse key strings.
+    """
+    if not isinstance(transactions, list):
+        return transactions
+    for tx in transactions:
+        if not isinstance(tx, dict):
+            continue
+        for field in _ADDRESS_FIELDS:
+            value = tx.get(field)
+            if type(value) is str:
+                tx[field] = sys.intern(value)
+    return transactions
+
+
+def _network_cache(
+    arguments: Tuple[Any, ...],
+) -> Optional[Tuple[TTLCache, Tuple[Any, ...]]]:
+    """
+    Resolve the response cache for a Network method call.
+
+    Entries are per client and keyed on (method name, network name, *args);
+    clients created with cache_enabled=False bypass the cache.
+    """
+    network = arguments[0]
+    if not network.cache_enabled:
+        return None
+    return network._cache, (network.config.name,) + arguments[1:]
+
+
+def _copy_holders(holders: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Copy a holder list; each holder only holds a str and a float."""
+    return [dict(holder) for holder in holders]
+
+
+def _stream_info_balances(stream: Any) -> Iterator[Tuple[str, Any]]:
+    """
+    Incrementally yield (wallet, amount) pairs from a combined snapshot body.
+
+    Like the whole-body path, only the balances map of the second top-level
+    element ([snapshot, info]) is read; parsing stops once that element ends.
+
+    Raises:
+        ijson.JSONError: If the body is not valid JSON
+    """
+    index = -1
+    wallet = value_prefix = None
+    for prefix, event, value in ijson.parse(stream, use_float=True):
+        if prefix == "item" and event != "map_key":
+            # A new top-level element starts; end events close the current one
+            if event in ("end_map", "end_array"):
+                if index == 1:
+                    return
+            else:
+                index += 1
+                if index > 1:
+                    return
+        elif index == 1:
+            if event == "map_key" and prefix == "item.balances":
+                wallet = value
+                value_prefix = f"item.balances.{value}"
+            elif event == "number" and prefix == value_prefix:
+                yield wallet, value
 
 
 class Network:
@@ -33,13 +166,16 @@ class Network:
         >>> print(f"Balance: {balance/1e8} DAG")
     """
 
-    def __init__(self, network_or_config):
+    def __init__(self, network_or_config, cache_enabled: bool = True):
         """
         Initialize network connection.
 
         Args:
             network_or_config: Network name ('mainnet', 'testnet', 'integrationnet')
                              or NetworkConfig object
+            cache_enabled: Reuse balance, ordinal, node info and snapshot holder
+                responses for CACHE_TTL seconds. Disable for benchmarks or when
+                every call must reach the network.
         """
         if isinstance(network_or_config, str):
             if network_or_config not in DEFAULT_CONFIGS:
@@ -53,16 +189,70 @@ class Network:
                 f"Invalid network configuration type: {type(network_or_config)}"
             )
 
+        self._session: Optional[requests.Session] = None
+        self.cache_enabled = cache_enabled
+        self._cache = TTLCache(CACHE_TTL, CACHE_MAXSIZE)
+
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+        self.close()
+
+    @property
+    def session(self) -> requests.Session:
+        """
+        Pooled HTTP session shared by all requests from this client.
+
+        Created on first use so keep-alive connections are reused across
+        calls instead of paying a TCP/TLS handshake per request.
+        """
+        if self._session is None:
+            adapter = HTTPAdapter(
+                pool_connections=POOL_CONNECTIONS,
+                pool_maxsize=POOL_MAXSIZE,
+                max_retries=Retry(
+                    total=MAX_RETRIES, backoff_factor=RETRY_BACKOFF_FACTOR
+                ),
+            )
+            session = requests.Session()
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            self._session = session
+        return self._session
+
+    def close(self):
+        """Close the pooled HTTP session, if one was opened."""
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
+    def invalidate(self, address: Optional[str] = None):
+        """
+        Drop cached responses.
+
+        Args:
+            address: Only drop entries for this address. Clears the whole
+                cache when omitted.
+        """
+        if address is None:
+            self._cache.clear()
+        else:
+            self._cache.discard(lambda key: address in key[2:])
+
     def _make_request(
         self, url: str, method: str = "GET", **kwargs
     ) -> requests.Response:
         """Make HTTP request with error handling."""
         try:
-            response = requests.request(method, url, timeout=30, **kwargs)
+            response = self.session.request(method, url, timeout=30, **kwargs)
             return response
         except (requests.RequestException, ConnectionError) as e:
             raise NetworkError(f"Network request failed: {e}") from e
 
+    @ttl_cached(_network_cache)
     def get_balance(self, address: str) -> int:
         """
         Get address balance in Datolites (1 DAG = 1e8 Datolites).
@@ -73,11 +263,12 @@ class Network:
         Returns:
             Balance in Datolites
         """
+        self._check_address(address)
         url = f"{self.config.be_url}/addresses/{address}/balance"
         response = self._make_request(url)
 
         if response.status_code == 200:
-            return response.json()["data"]["balance"]
+            return _parse_json(response)["data"]["balance"]
         elif response.status_code == 404:
             return 0  # Address not found = zero balance
         else:
@@ -89,17 +280,18 @@ class Network:
         response = self._make_request(url)
 
         if response.status_code == 200:
-            return response.json()
+            return _parse_json(response)
         else:
             raise NetworkError(f"Cluster info failed: {response.status_code}")
 
+    @ttl_cached(_network_cache)
     def get_node_info(self) -> Dict[str, Any]:
         """Get information about the connected node."""
         url = f"{self.config.l1_url}/node/info"
         response = self._make_request(url)
 
         if response.status_code == 200:
-            return response.json()
+            return _parse_json(response)
         else:
             raise NetworkError(f"Node info failed: {response.status_code}")
 
@@ -117,7 +309,7 @@ class Network:
         response = self._make_request(url, params={"limit": limit})
 
         if response.status_code == 200:
-            return response.json()["data"]
+            return _intern_addresses(_parse_json(response)["data"])
         else:
             raise NetworkError(f"Transaction query failed: {response.status_code}")
 
@@ -143,7 +335,11 @@ class Network:
         )
 
         if response.status_code == 200:
-            return response.json()
+            value = signed_transaction.get("value", {})
+            for address in (value.get("source"), value.get("destination")):
+                if address:
+                    self.invalidate(address)
+            return _parse_json(response)
         elif response.status_code == 400:
             raise NetworkError(f"Invalid transaction: {response.text}")
         elif response.status_code == 500:
@@ -168,7 +364,7 @@ class Network:
         response = self._make_request(url)
 
         if response.status_code == 200:
-            return response.json()["data"]
+            return _parse_json(response)["data"]
         elif response.status_code == 404:
             return None
         else:
@@ -176,13 +372,27 @@ class Network:
 
     def validate_address(self, address: str) -> bool:
         """Validate DAG address format."""
-        return (
-            isinstance(address, str)
-            and address.startswith("DAG")
-            and len(address) == 38
-            and all(c in "0123456789ABCDEFabcdef" for c in address[3:])
-        )
+        return isinstance(address, str) and bool(_HEX_ADDRESS_RE.fullmatch(address))
+
+    def _check_address(self, address: str) -> None:
+        """
+        Reject malformed addresses before any request is issued.
 
+        Only the type and 'DAG' prefix are checked by default, so addresses the
+        node resolves itself (such as unknown ones returning zero balance) still
+        reach it. strict_validation applies the full AddressValidator rules.
+
+        Raises:
+            AddressValidationError: If the address cannot be valid
+        """
+        if not self.config.validate_addresses:
+            return
+        if self.config.strict_validation:
+            AddressValidator.validate(address)
+        elif not (isinstance(address, str) and address.startswith("DAG")):
+            raise AddressValidationError(address, "Address must start with 'DAG'")
+
+    @ttl_cached(_network_cache)
     def get_ordinal(self, address: str) -> int:
         """
         Get address ordinal (transaction count).
@@ -193,11 +403,12 @@ class Network:
         Returns:
             Address ordinal (transaction count)
         """
+        self._check_address(address)
         url = f"{self.config.be_url}/addresses/{address}/ordinal"
         response = self._make_request(url)
 
         if response.status_code == 200:
-            return response.json()["data"]["ordinal"]
+            return _parse_json(response)["data"]["ordinal"]
         elif response.status_code == 404:
             return 0  # Address not found = zero ordinal
         else:
@@ -214,11 +425,12 @@ class Network:
         Returns:
             List of transaction data
         """
+        self._check_address(address)
         url = f"{self.config.be_url}/addresses/{address}/transactions"
         response = self._make_request(url, params={"limit": limit})
 
         if response.status_code == 200:
-            return response.json()["data"]
+            return _intern_addresses(_parse_json(response)["data"])
         elif response.status_code == 404:
             return []  # Address not found = no transactions
         else:
@@ -228,7 +440,9 @@ class Network:
     # Batch Operations (Enhanced REST Phase 1)
     # ========================================
 
-    def batch_request(self, operations: List[BatchOperation]) -> BatchResponse:
+    def batch_request(
+        self, operations: List[BatchOperation], max_workers: int = 1
+    ) -> BatchResponse:
         """
         Execute multiple operations in a single batch request.
 
@@ -238,6 +452,8 @@ class Network:
 
         Args:
             operations: List of batch operations to execute
+            max_workers: Number of operations to run concurrently on the
+                pooled session. Defaults to sequential execution.
 
         Returns:
             BatchResponse containing results of all operations
@@ -263,29 +479,12 @@ class Network:
                 f"Batch validation failed: {'; '.join(validation_errors)}"
             )
 
-        results = []
-
-        # Execute operations sequentially (can be optimized with threading/async later)
-        for operation in operations:
-            try:
-                result = self._execute_single_operation(operation)
-                results.append(
-                    BatchResult(
-                        operation=operation.operation,
-                        success=True,
-                        data=result,
-                        id=operation.id,
-                    )
-                )
-            except Exception as e:
-                results.append(
-                    BatchResult(
-                        operation=operation.operation,
-                        success=False,
-                        error=str(e),
-                        id=operation.id,
-                    )
-                )
+        max_workers = min(max_workers, len(operations))
+        if max_workers > 1:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                results = list(executor.map(self._run_batch_operation, operations))
+        else:
+            results = [self._run_batch_operation(op) for op in operations]
 
         execution_time = time.time() - start_time
 
@@ -299,12 +498,31 @@ class Network:
             "failed_operations": len(failed_ops),
             "success_rate": len(successful_ops) / len(operations) * 100,
             "execution_time": execution_time,
+            "concurrent_execution": max_workers > 1,
         }
 
         return BatchResponse(
             results=results, summary=summary, execution_time=execution_time
         )
 
+    def _run_batch_operation(self, operation: BatchOperation) -> BatchResult:
+        """Execute one batch operation, capturing failures in the result."""
+        try:
+            result = self._execute_single_operation(operation)
+            return BatchResult(
+                operation=operation.operation,
+                success=True,
+                data=result,
+                id=operation.id,
+            )
+        except Exception as e:
+            return BatchResult(
+                operation=operation.operation,
+                success=False,
+                error=str(e),
+                id=operation.id,
+            )
+
     def _execute_single_operation(self, operation: BatchOperation) -> Any:
         """
         Execute a single batch operation.
@@ -425,6 +643,9 @@ class Network:
         """
         Get comprehensive address overview in a single batch request.
 
+        The balance, ordinal and transaction queries are independent, so they
+        run concurrently and the overview costs about one round trip.
+
         Args:
             address: DAG address
 
@@ -444,7 +665,7 @@ class Network:
             ),
         ]
 
-        response = self.batch_request(operations)
+        response = self.batch_request(operations, max_workers=len(operations))
 
         # Extract results
         balance_result = response.get_result("balance")
@@ -468,44 +689,113 @@ class Network:
             "execution_time": response.execution_time,
         }
 
-    def get_snapshot_holders(self) -> List[Dict[str, Any]]:
+    def iter_snapshot_holders(self) -> Iterator[Dict[str, Any]]:
         """
-        Get a list of all wallet balances from the latest global snapshot.
+        Iterate over wallet balances from the latest global snapshot.
 
-        This method fetches the latest combined snapshot from the Global L0 API,
-        extracts the wallet balances, and returns a list of all holders with
-        their respective balances in DAG.
+        When ijson is installed the response is parsed incrementally while it
+        downloads, so holders are yielded without materializing the full
+        snapshot. Otherwise the body is decoded in one go.
 
         Returns:
-            A list of dictionaries, each containing 'wallet' and 'amount'.
-            Returns an empty list if the snapshot format is unexpected.
+            Iterator of dictionaries, each containing 'wallet' and 'amount'.
+            Yields nothing if the snapshot format is unexpected.
+
+        Raises:
+            NetworkError: If the request fails or the body is not valid JSON,
+                e.g. a truncated download
 
         Example:
-            >>> # Get all holders from the latest snapshot
-            >>> holders = network.get_snapshot_holders()
+            >>> top5 = heapq.nlargest(
+            ...     5, network.iter_snapshot_holders(), key=itemgetter("amount")
+            ... )
         """
-        url_to_fetch = "http://l0-lb-mainnet.constellationnetwork.io/global-snapshots/latest/combined"
-
         response = self._make_request(
-            url_to_fetch, headers={"Accept": "application/json"}
+            SNAPSHOT_COMBINED_URL,
+            headers={"Accept": "application/json"},
+            stream=IJSON_AVAILABLE,
         )
 
         if response.status_code != 200:
+            # A streamed response holds its connection until closed
+            response.close()
             raise NetworkError(
-                f"Failed to fetch snapshot from {url_to_fetch}: {response.status_code}"
+                f"Failed to fetch snapshot from {SNAPSHOT_COMBINED_URL}: "
+                f"{response.status_code}"
             )
 
+        if IJSON_AVAILABLE:
+            # The combined snapshot is [snapshot, info]; balances live in info
+            response.raw.decode_content = True
+            try:
+                for wallet, amount in _stream_info_balances(response.raw):
+                    if wallet != _ZERO_WALLET:
+                        yield {"wallet": wallet, "amount": amount / 1e8}
+            except ijson.JSONError as e:
+                raise NetworkError(
+                    f"Invalid snapshot JSON from {SNAPSHOT_COMBINED_URL}: {e}"
+                ) from e
+            finally:
+                response.close()
+            return
+
+        try:
+            json_data = _parse_json(response)
+        except ValueError as e:
+            raise NetworkError(
+                f"Invalid snapshot JSON from {SNAPSHOT_COMBINED_URL}: {e}"
+            ) from e
+
         try:
-            json_data = response.json()
             balances = json_data[1]["balances"]
         except (KeyError, IndexError, TypeError):
             # Handle cases where the snapshot format is not as expected
-            return []
+            return
+        if not isinstance(balances, dict):
+            return
 
-        holders = []
         for wallet, amount in balances.items():
-            if wallet == "0000000000000000000000000000000000000000":
-                continue
-            holders.append({"wallet": wallet, "amount": amount / 1e8})
+            if wallet != _ZERO_WALLET:
+                yield {"wallet": wallet, "amount": amount / 1e8}
+
+    @ttl_cached(_network_cache, copy_result=_copy_holders)
+    def get_snapshot_holders(self) -> List[Dict[str, Any]]:
+        """
+        Get a list of all wallet balances from the latest global snapshot.
+
+        This method fetches the latest combined snapshot from the Global L0 API,
+        extracts the wallet balances, and returns a list of all holders with
+        their respective balances in DAG.
+
+        Returns:
+            A list of dictionaries, each containing 'wallet' and 'amount'.
+            Returns an empty list if the snapshot format is unexpected.
+
+        Raises:
+            NetworkError: If the request fails or the body is not valid JSON.
+                Failed fetches are never cached.
+
+        Example:
+            >>> # Get all holders from the latest snapshot
+            >>> holders = network.get_snapshot_holders()
+        """
+        return list(self.iter_snapshot_holders())
+
+    def get_snapshot_holders_view(self) -> "HoldersView":
+        """
+        Get snapshot holders as a NumPy-backed HoldersView.
+
+        Requires NumPy. Use this for aggregates such as top-K, totals or
+        concentration over the full holder set.
+
+        Returns:
+            HoldersView over the latest snapshot holders
+
+        Example:
+            >>> view = network.get_snapshot_holders_view()
+            >>> top5 = view.top(5)
+        """
+        # Import here so NumPy is only loaded when a view is requested
+        from .holders import HoldersView
 
-        return holders
+        return HoldersView(self.get_snapshot_holders())
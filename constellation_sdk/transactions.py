@@ -608,6 +608,85 @@ class Transactions:
         )
 
 
+class TokenTxTemplate:
+    """
+    Template for token transfers that share a source, metagraph and fee.
+
+    The shared fields are validated and stored once, so build() only
+    validates the destination and amount of each transfer. The result is
+    the same dictionary Transactions.create_token_transfer() returns.
+
+    Example:
+        >>> template = TokenTxTemplate(account.address, "DAG7Ghth1WhW...")
+        >>> txs = [template.build("DAG4J6gixV...", amount) for amount in amounts]
+        >>> signed = account.sign_many(txs)
+    """
+
+    __slots__ = ("_base",)
+
+    def __init__(self, source: str, metagraph_id: str, fee: Union[int, float] = 0):
+        """
+        Validate and store the fields shared by every transfer.
+
+        Args:
+            source: Source address sending the tokens
+            metagraph_id: ID of the metagraph handling this token
+            fee: Transaction fee (usually 0)
+
+        Raises:
+            AddressValidationError: If the source address is invalid
+            AmountValidationError: If the fee is invalid
+            MetagraphIdValidationError: If the metagraph ID is invalid
+        """
+        AddressValidator.validate(source)
+        AmountValidator.validate(fee, allow_zero=True)
+        MetagraphIdValidator.validate(metagraph_id)
+
+        self._base = {
+            "source": source,
+            "fee": int(fee),
+            "metagraph_id": metagraph_id,
+        }
+
+    def build(
+        self,
+        destination: str,
+        amount: Union[int, float],
+        salt: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        Create a token transfer from the template.
+
+        Args:
+            destination: Recipient address
+            amount: Amount to transfer (in token's smallest unit)
+            salt: Salt for transaction uniqueness (auto-generated if None)
+
+        Returns:
+            Unsigned transaction ready for signing
+
+        Raises:
+            AddressValidationError: If the destination address is invalid
+            AmountValidationError: If the amount is invalid
+            TransactionValidationError: If the salt is not an integer
+        """
+        AddressValidator.validate(destination)
+        AmountValidator.validate(amount)
+
+        if salt is None:
+            salt = Transactions._generate_salt()
+        elif not isinstance(salt, int):
+            raise TransactionValidationError(
+                "Salt must be an integer", transaction_type="token"
+            )
+
+        transaction_data = dict(self._base)
+        transaction_data["destination"] = destination
+        transaction_data["amount"] = int(amount)
+        transaction_data["salt"] = salt
+        return transaction_data
+
+
 # Convenience functions for backward compatibility
 def create_dag_transaction(
     sender: Account, destination: str, amount: Union[int, float], **kwargs
@@ -8,8 +8,11 @@ amount validation, transaction validation, and more.
 
 import functools
 import hashlib
+import inspect
+import operator
 import re
-from typing import Any, Callable, Dict, List, Optional, Union
+from collections.abc import Mapping
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
 
 from .exceptions import (
     AddressValidationError,
@@ -20,6 +23,10 @@ from .exceptions import (
     ValidationError,
 )
 
+# Set to False to bypass the validation decorators entirely (e.g. for trusted,
+# pre-validated pipelines). Checked on every call, so it can be toggled at runtime.
+VALIDATION_ENABLED = True
+
 # =====================
 # Address Validation
 # =====================
@@ -67,6 +74,11 @@ class AddressValidator:
         if not cls.validate_format(address):
             return False
 
+        return cls._checksum_matches(address)
+
+    @staticmethod
+    def _checksum_matches(address: str) -> bool:
+        """Compute the checksum of an address already known to be well-formed."""
         # Extract the hex part (without 'DAG' prefix)
         hex_part = address[3:]
 
@@ -78,6 +90,30 @@ class AddressValidator:
         # In reality, this would be compared against embedded checksum in the address
         return checksum % 2 == 0
 
+    @classmethod
+    def check(cls, address: str, check_checksum: bool = False) -> bool:
+        """
+        Check a DAG address without raising.
+
+        Args:
+            address: Address string to check
+            check_checksum: Whether to verify checksum
+
+        Returns:
+            bool: True if address is valid
+        """
+        # Cheap type, length and prefix tests first; the regex and checksum
+        # only run for candidates that pass them
+        if not (
+            isinstance(address, str)
+            and len(address) in (38, 40)
+            and address.startswith("DAG")
+        ):
+            return False
+        if not cls.DAG_ADDRESS_PATTERN.match(address):
+            return False
+        return not check_checksum or cls._checksum_matches(address)
+
     @classmethod
     def validate(cls, address: str, check_checksum: bool = False) -> None:
         """
@@ -90,6 +126,9 @@ class AddressValidator:
         Raises:
             AddressValidationError: If address is invalid
         """
+        if cls.check(address, check_checksum):
+            return
+
         if not isinstance(address, str):
             raise AddressValidationError(address, "Address must be a string")
 
@@ -111,6 +150,24 @@ class AddressValidator:
             raise AddressValidationError(address, "Invalid address checksum")
 
 
+@functools.lru_cache(maxsize=4096)
+def _check_address_cached(address: str, check_checksum: bool) -> bool:
+    """Memoized AddressValidator.check for addresses seen repeatedly."""
+    return AddressValidator.check(address, check_checksum)
+
+
+def _validate_address_cached(address: str, check_checksum: bool = False) -> None:
+    """
+    Validate an address, reusing cached results for previously seen strings.
+
+    Raises:
+        AddressValidationError: If address is invalid
+    """
+    if isinstance(address, str) and _check_address_cached(address, check_checksum):
+        return
+    AddressValidator.validate(address, check_checksum)
+
+
 # =====================
 # Amount Validation
 # =====================
@@ -128,6 +185,31 @@ class AmountValidator:
     MIN_AMOUNT = 1
     MAX_AMOUNT = 2**53 - 1  # JavaScript safe integer
 
+    @classmethod
+    def check(cls, amount: Union[int, float], allow_zero: bool = False) -> bool:
+        """
+        Check a transaction amount without raising.
+
+        Args:
+            amount: Amount to check
+            allow_zero: Whether to allow zero amounts
+
+        Returns:
+            bool: True if amount is valid
+        """
+        # Exact ints (the common case) go straight to the range comparisons
+        if type(amount) is not int:
+            if isinstance(amount, float):
+                if not amount.is_integer():
+                    return False
+                amount = int(amount)
+            elif not isinstance(amount, int):
+                return False
+
+        if amount == 0:
+            return allow_zero
+        return cls.MIN_AMOUNT <= amount <= cls.MAX_AMOUNT
+
     @classmethod
     def validate(cls, amount: Union[int, float], allow_zero: bool = False) -> None:
         """
@@ -140,6 +222,9 @@ class AmountValidator:
         Raises:
             AmountValidationError: If amount is invalid
         """
+        if cls.check(amount, allow_zero):
+            return
+
         if not isinstance(amount, (int, float)):
             raise AmountValidationError(amount, "Amount must be a number")
 
@@ -189,6 +274,25 @@ class MetagraphIdValidator:
         r"^DAG[123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz]{37}$"
     )  # 40 chars total
 
+    @classmethod
+    def check(cls, metagraph_id: str) -> bool:
+        """
+        Check a metagraph ID without raising.
+
+        Args:
+            metagraph_id: Metagraph ID to check
+
+        Returns:
+            bool: True if metagraph ID is valid
+        """
+        if not isinstance(metagraph_id, str):
+            return False
+        if len(metagraph_id) == 38:
+            return bool(cls.HEX_PATTERN.match(metagraph_id))
+        if len(metagraph_id) == 40:
+            return bool(cls.BASE58_PATTERN.match(metagraph_id))
+        return False
+
     @classmethod
     def validate(cls, metagraph_id: str) -> None:
         """
@@ -200,6 +304,9 @@ class MetagraphIdValidator:
         Raises:
             MetagraphIdValidationError: If metagraph ID is invalid
         """
+        if cls.check(metagraph_id):
+            return
+
         if not isinstance(metagraph_id, str):
             raise MetagraphIdValidationError(
                 metagraph_id, "Metagraph ID must be a string"
@@ -390,6 +497,14 @@ class TransactionValidator:
             )
 
 
+# Transaction type -> validator, resolved once by the validate_transaction decorator
+_TRANSACTION_VALIDATORS: Dict[str, Callable[[Dict[str, Any]], None]] = {
+    "dag": TransactionValidator.validate_dag_transaction,
+    "token": TransactionValidator.validate_token_transaction,
+    "data": TransactionValidator.validate_data_transaction,
+}
+
+
 # =====================
 # Data Validation
 # =====================
@@ -441,6 +556,61 @@ class DataValidator:
 # =====================
 
 
+def _noop_validate(cls, *args, **kwargs) -> None:
+    """Replacement validate() body for validator classes that are disabled."""
+    return None
+
+
+def _is_noop(validate: Callable) -> bool:
+    """Check whether a bound validate() method has been replaced by the no-op."""
+    return getattr(validate, "__func__", validate) is _noop_validate
+
+
+def disable_validator(validator_cls: type) -> None:
+    """
+    Turn a validator class's validate() into a no-op.
+
+    Decorators applied after this call detect the no-op and return the
+    decorated function unwrapped, so it carries no validation overhead.
+
+    Args:
+        validator_cls: Validator class to disable (e.g. AddressValidator)
+    """
+    validator_cls.validate = classmethod(_noop_validate)
+
+
+def _resolve_param_index(func: Callable, param_name: str) -> Optional[int]:
+    """
+    Resolve the positional index of a parameter once, at decoration time.
+
+    Args:
+        func: Function being decorated
+        param_name: Name of the parameter to locate
+
+    Returns:
+        Positional index of the parameter, or None if it has no such parameter
+    """
+    param_names = list(inspect.signature(func).parameters.keys())
+    if param_name in param_names:
+        return param_names.index(param_name)
+    return None
+
+
+def _copy_meta(wrapper: Callable, func: Callable) -> Callable:
+    """
+    Copy the identifying metadata of ``func`` onto ``wrapper``.
+
+    A lighter-weight alternative to ``functools.wraps`` that only carries
+    over the attributes callers and introspection tools actually read.
+    """
+    wrapper.__module__ = func.__module__
+    wrapper.__name__ = func.__name__
+    wrapper.__qualname__ = func.__qualname__
+    wrapper.__doc__ = func.__doc__
+    wrapper.__wrapped__ = func
+    return wrapper
+
+
 def validate_address(param_name: str, check_checksum: bool = True):
     """
     Decorator to validate DAG address parameters.
@@ -451,32 +621,27 @@ def validate_address(param_name: str, check_checksum: bool = True):
     """
 
     def decorator(func: Callable) -> Callable:
-        @functools.wraps(func)
+        if _is_noop(AddressValidator.validate):
+            return func
+
+        param_index = _resolve_param_index(func, param_name)
+
         def wrapper(*args, **kwargs):
-            # Get parameter value
-            if param_name in kwargs:
-                address = kwargs[param_name]
-            else:
-                # Try to get from positional args based on function signature
-                import inspect
-
-                sig = inspect.signature(func)
-                param_names = list(sig.parameters.keys())
-                if param_name in param_names:
-                    param_index = param_names.index(param_name)
-                    if param_index < len(args):
-                        address = args[param_index]
-                    else:
-                        address = None
-                else:
-                    address = None
+            if not VALIDATION_ENABLED:
+                return func(*args, **kwargs)
+
+            # Keyword arguments are the common case; fall back to the position
+            # resolved at decoration time
+            address = kwargs.get(param_name)
+            if address is None and param_index is not None and param_index < len(args):
+                address = args[param_index]
 
             if address is not None:
-                AddressValidator.validate(address, check_checksum)
+                _validate_address_cached(address, check_checksum)
 
             return func(*args, **kwargs)
 
-        return wrapper
+        return _copy_meta(wrapper, func)
 
     return decorator
 
@@ -491,32 +656,27 @@ def validate_amount(param_name: str, allow_zero: bool = False):
     """
 
     def decorator(func: Callable) -> Callable:
-        @functools.wraps(func)
+        if _is_noop(AmountValidator.validate):
+            return func
+
+        param_index = _resolve_param_index(func, param_name)
+
         def wrapper(*args, **kwargs):
-            # Get parameter value
-            if param_name in kwargs:
-                amount = kwargs[param_name]
-            else:
-                # Try to get from positional args
-                import inspect
-
-                sig = inspect.signature(func)
-                param_names = list(sig.parameters.keys())
-                if param_name in param_names:
-                    param_index = param_names.index(param_name)
-                    if param_index < len(args):
-                        amount = args[param_index]
-                    else:
-                        amount = None
-                else:
-                    amount = None
+            if not VALIDATION_ENABLED:
+                return func(*args, **kwargs)
+
+            # Keyword arguments are the common case; fall back to the position
+            # resolved at decoration time
+            amount = kwargs.get(param_name)
+            if amount is None and param_index is not None and param_index < len(args):
+                amount = args[param_index]
 
             if amount is not None:
                 AmountValidator.validate(amount, allow_zero)
 
             return func(*args, **kwargs)
 
-        return wrapper
+        return _copy_meta(wrapper, func)
 
     return decorator
 
@@ -530,32 +690,31 @@ def validate_metagraph_id(param_name: str):
     """
 
     def decorator(func: Callable) -> Callable:
-        @functools.wraps(func)
+        if _is_noop(MetagraphIdValidator.validate):
+            return func
+
+        param_index = _resolve_param_index(func, param_name)
+
         def wrapper(*args, **kwargs):
-            # Get parameter value
-            if param_name in kwargs:
-                metagraph_id = kwargs[param_name]
-            else:
-                # Try to get from positional args
-                import inspect
-
-                sig = inspect.signature(func)
-                param_names = list(sig.parameters.keys())
-                if param_name in param_names:
-                    param_index = param_names.index(param_name)
-                    if param_index < len(args):
-                        metagraph_id = args[param_index]
-                    else:
-                        metagraph_id = None
-                else:
-                    metagraph_id = None
+            if not VALIDATION_ENABLED:
+                return func(*args, **kwargs)
+
+            # Keyword arguments are the common case; fall back to the position
+            # resolved at decoration time
+            metagraph_id = kwargs.get(param_name)
+            if (
+                metagraph_id is None
+                and param_index is not None
+                and param_index < len(args)
+            ):
+                metagraph_id = args[param_index]
 
             if metagraph_id is not None:
                 MetagraphIdValidator.validate(metagraph_id)
 
             return func(*args, **kwargs)
 
-        return wrapper
+        return _copy_meta(wrapper, func)
 
     return decorator
 
@@ -564,29 +723,27 @@ def validate_transaction(tx_type: str):
     """
     Decorator to validate transaction data.
 
+    The decorated function must take the transaction as its first positional
+    argument; it is always validated before the function is called.
+
     Args:
         tx_type: Transaction type ('dag', 'token', 'data')
+
+    Raises:
+        ValidationError: If the transaction type is unknown
     """
+    validator = _TRANSACTION_VALIDATORS.get(tx_type)
+    if validator is None:
+        raise ValidationError(f"Unknown transaction type: {tx_type}")
 
     def decorator(func: Callable) -> Callable:
-        @functools.wraps(func)
-        def wrapper(*args, **kwargs):
-            # Assume first argument is transaction data
-            if args:
-                transaction = args[0]
-
-                if tx_type == "dag":
-                    TransactionValidator.validate_dag_transaction(transaction)
-                elif tx_type == "token":
-                    TransactionValidator.validate_token_transaction(transaction)
-                elif tx_type == "data":
-                    TransactionValidator.validate_data_transaction(transaction)
-                else:
-                    raise ValidationError(f"Unknown transaction type: {tx_type}")
+        def wrapper(transaction, /, *args, **kwargs):
+            if VALIDATION_ENABLED:
+                validator(transaction)
 
-            return func(*args, **kwargs)
+            return func(transaction, *args, **kwargs)
 
-        return wrapper
+        return _copy_meta(wrapper, func)
 
     return decorator
 
@@ -607,11 +764,7 @@ def is_valid_dag_address(address: str, check_checksum: bool = False) -> bool:
     Returns:
         bool: True if address is valid
     """
-    try:
-        AddressValidator.validate(address, check_checksum)
-        return True
-    except AddressValidationError:
-        return False
+    return AddressValidator.check(address, check_checksum)
 
 
 def is_valid_amount(amount: Union[int, float], allow_zero: bool = False) -> bool:
@@ -625,11 +778,7 @@ def is_valid_amount(amount: Union[int, float], allow_zero: bool = False) -> bool
     Returns:
         bool: True if amount is valid
     """
-    try:
-        AmountValidator.validate(amount, allow_zero)
-        return True
-    except AmountValidationError:
-        return False
+    return AmountValidator.check(amount, allow_zero)
 
 
 def is_valid_metagraph_id(metagraph_id: str) -> bool:
@@ -642,38 +791,83 @@ def is_valid_metagraph_id(metagraph_id: str) -> bool:
     Returns:
         bool: True if metagraph ID is valid
     """
-    try:
-        MetagraphIdValidator.validate(metagraph_id)
-        return True
-    except MetagraphIdValidationError:
-        return False
+    return MetagraphIdValidator.check(metagraph_id)
+
 
+_get_destination_amount = operator.itemgetter("destination", "amount")
 
-def validate_batch_transfers(transfers: List[Dict[str, Any]]) -> None:
+
+def validate_batch_transfers(
+    transfers: Iterable[Dict[str, Any]], fail_fast: bool = True
+) -> None:
     """
     Validate a batch of transfer operations.
 
+    Accepts any iterable (list, tuple, deque, generator) and walks it once,
+    so transfers produced on the fly do not need to be materialized first.
+
     Args:
-        transfers: List of transfer dictionaries
+        transfers: Iterable of transfer dictionaries
+        fail_fast: Raise on the first invalid transfer. When False, the whole
+                   batch is checked with non-raising predicates and a single
+                   ValidationError listing every invalid transfer is raised.
 
     Raises:
-        ValidationError: If any transfer is invalid
+        ValidationError: If any transfer is invalid, there are no transfers,
+            or transfers is None, a string, bytes or a mapping
     """
-    if not isinstance(transfers, list):
-        raise ValidationError("Transfers must be a list")
-
-    if not transfers:
-        raise ValidationError("Transfers list cannot be empty")
+    # These are iterable but never a batch: a string or bytes would be walked
+    # character by character and a mapping key by key
+    if transfers is None or isinstance(transfers, (str, bytes, bytearray, Mapping)):
+        raise ValidationError(
+            "Transfers must be an iterable of transfer dictionaries",
+            field="transfers",
+            value=type(transfers).__name__,
+        )
+
+    seen = False
+    errors: List[Tuple[int, str]] = []
+
+    # Bind hot-loop callables to locals to avoid repeated global/attribute lookups
+    get_destination_amount = _get_destination_amount
+    address_validate = AddressValidator.validate
+    amount_validate = AmountValidator.validate
+    address_ok = AddressValidator.check
+    amount_ok = AmountValidator.check
 
     for i, transfer in enumerate(transfers):
+        seen = True
+
         if not isinstance(transfer, dict):
-            raise ValidationError(f"Transfer {i} must be a dictionary")
+            reason = "must be a dictionary"
+        else:
+            try:
+                destination, amount = get_destination_amount(transfer)
+            except KeyError:
+                missing = "destination" if "destination" not in transfer else "amount"
+                reason = f"missing {missing}"
+            else:
+                if fail_fast:
+                    address_validate(destination)
+                    amount_validate(amount)
+                    continue
+                if not address_ok(destination):
+                    reason = f"has invalid destination: {destination}"
+                elif not amount_ok(amount):
+                    reason = f"has invalid amount: {amount}"
+                else:
+                    continue
 
-        if "destination" not in transfer:
-            raise ValidationError(f"Transfer {i} missing destination")
+        if fail_fast:
+            raise ValidationError(f"Transfer {i} {reason}")
+        errors.append((i, reason))
 
-        if "amount" not in transfer:
-            raise ValidationError(f"Transfer {i} missing amount")
+    if not seen:
+        raise ValidationError("Transfers list cannot be empty")
 
-        AddressValidator.validate(transfer["destination"])
-        AmountValidator.validate(transfer["amount"])
+    if errors:
+        raise ValidationError(
+            "; ".join(f"Transfer {i} {reason}" for i, reason in errors),
+            field="transfers",
+            value=[i for i, _ in errors],
+        )
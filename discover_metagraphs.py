@@ -1,10 +1,66 @@
 import json
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from constellation_sdk import MetagraphClient, GraphQLClient
 
+# Metagraphs per aliased query; chunks are fetched concurrently
+CHUNK_SIZE = 10
+MAX_WORKERS = 16
+
+METAGRAPH_DETAILS_FIELDS = "id name tokenSymbol totalSupply transactionCount"
+
+@lru_cache(maxsize=None)
+def build_metagraph_details_query(count):
+    """
+    Builds a GraphQL query that fetches details for `count` metagraphs, using
+    one aliased `metagraph` field (m0, m1, ...) per `$id0`, `$id1`, ... variable.
+
+    The query text depends only on `count`, so it is built once per chunk size
+    and the server can reuse its parsed form across requests.
+    """
+    params = ", ".join(f"$id{i}: String!" for i in range(count))
+    fields = " ".join(
+        f"m{i}: metagraph(id: $id{i}) {{ {METAGRAPH_DETAILS_FIELDS} }}"
+        for i in range(count)
+    )
+    return f"query GetMetagraphDetails({params}) {{ {fields} }}"
+
+def fetch_metagraph_details(graphql_client, metagraph_ids):
+    """
+    Fetches details for all metagraph IDs, splitting them into chunks of
+    CHUNK_SIZE aliased lookups and running the chunk queries in parallel.
+
+    Returns a (details, errors) tuple where details maps each ID to its data.
+    """
+    chunks = [
+        metagraph_ids[i:i + CHUNK_SIZE]
+        for i in range(0, len(metagraph_ids), CHUNK_SIZE)
+    ]
+
+    def execute_chunk(chunk):
+        variables = {f"id{i}": metagraph_id for i, metagraph_id in enumerate(chunk)}
+        return graphql_client.execute(
+            build_metagraph_details_query(len(chunk)), variables=variables
+        )
+
+    with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(chunks))) as executor:
+        responses = list(executor.map(execute_chunk, chunks))
+
+    details = {}
+    errors = []
+    for chunk, response in zip(chunks, responses):
+        data = response.data or {}
+        for i, metagraph_id in enumerate(chunk):
+            details[metagraph_id] = data.get(f"m{i}")
+        errors.extend(response.errors)
+
+    return details, errors
+
 def get_rich_metagraph_details():
     """
     Discovers production metagraphs and then uses the GraphQL client to fetch
-    rich analytics for the first metagraph, printing the raw server response.
+    rich analytics for all of them in parallel batched requests, printing the
+    raw server response.
     """
     print("Connecting to the Constellation network to discover metagraphs...")
 
@@ -17,36 +73,24 @@ def get_rich_metagraph_details():
             print("No production metagraphs found at this time.")
             return
 
-        print(f"\n✅ Found {len(metagraphs)} production metagraphs. Now fetching raw details for the first one...\n")
+        print(f"\n✅ Found {len(metagraphs)} production metagraphs. Now fetching raw details for all of them...\n")
 
         # 2. Initialize the GraphQLClient to get detailed analytics
         graphql_client = GraphQLClient('mainnet')
-        
-        # 3. Query details for the first metagraph
-        first_metagraph_id = metagraphs[0]['id']
-        print(f"--- Querying details for: {first_metagraph_id} ---")
-
-        query = f"""
-        query GetMetagraphDetails {{
-          metagraph(id: "{first_metagraph_id}") {{
-            id
-            name
-            tokenSymbol
-            totalSupply
-            transactionCount
-          }}
-        }}
-        """
-        
+
+        # 3. Query details for every metagraph
+        metagraph_ids = [mg['id'] for mg in metagraphs]
+        print(f"--- Querying details for {len(metagraph_ids)} metagraphs ---")
+
         try:
-            # 4. Execute the query and get the raw response object
-            response = graphql_client.execute(query)
+            # 4. Execute the chunked queries and map aliased results back to IDs
+            details, errors = fetch_metagraph_details(graphql_client, metagraph_ids)
 
-            # 5. Print the raw data and errors from the response object
+            # 5. Print the raw data and errors from the responses
             print("\n--- Raw Server Response ---")
             response_dict = {
-                "data": response.data,
-                "errors": response.errors
+                "data": details,
+                "errors": errors
             }
             print(json.dumps(response_dict, indent=2))
 
@@ -58,4 +102,4 @@ def get_rich_metagraph_details():
         print("Please ensure you have an internet connection and the SDK is installed correctly.")
 
 if __name__ == "__main__":
-    get_rich_metagraph_details() 
\ No newline at end of file
+    get_rich_metagraph_details()
@@ -8,7 +8,8 @@ reducing network round trips and improving performance for complex queries.
 
 import asyncio
 import json
-import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 
 from constellation_sdk import (
     ASYNC_AVAILABLE,
@@ -22,6 +23,18 @@ from constellation_sdk import (
     batch_get_transactions,
     create_batch_operation,
 )
+from timing import Timer
+
+# Worker threads for the concurrent "individual calls" baseline
+MAX_WORKERS = 8
+
+
+def _balance_or_zero(network, address):
+    """Fetch a balance, treating any failure as zero."""
+    try:
+        return network.get_balance(address)
+    except Exception:
+        return 0
 
 
 def main():
@@ -71,13 +84,12 @@ def main():
     ]
 
     print(f"🔄 Executing {len(operations)} operations in a single batch...")
-    start_time = time.time()
 
     try:
-        response = network.batch_request(operations)
-        execution_time = time.time() - start_time
+        with Timer() as t:
+            response = network.batch_request(operations)
 
-        print(f"✅ Batch completed in {execution_time:.3f}s")
+        print(f"✅ Batch completed in {t.s:.3f}s")
         print(f"📊 Summary:")
         print(f"   Total operations: {response.summary['total_operations']}")
         print(f"   Successful: {response.summary['successful_operations']}")
@@ -124,27 +136,32 @@ def main():
     try:
         # Compare individual vs batch performance
 
-        # Individual calls
-        start_time = time.time()
-        individual_balances = {}
-        for address in addresses:
-            try:
-                individual_balances[address] = network.get_balance(address)
-            except Exception:
-                individual_balances[address] = 0
-        individual_time = time.time() - start_time
+        # Both runs read balances through the client's response cache; clear
+        # it before each so neither is timed against warm entries
+        network.invalidate()
+
+        # Individual calls, issued concurrently so the baseline is not
+        # serialized round trips
+        with Timer() as individual, ThreadPoolExecutor(MAX_WORKERS) as executor:
+            fetch = partial(_balance_or_zero, network)
+            individual_balances = dict(zip(addresses, executor.map(fetch, addresses)))
+        individual_time = individual.s
 
         # Batch call
-        start_time = time.time()
-        batch_balances = network.get_multi_balance(addresses)
-        batch_time = time.time() - start_time
+        network.invalidate()
+        with Timer() as batch:
+            batch_balances = network.get_multi_balance(addresses)
+        batch_time = batch.s
 
         print(f"⏱️  Performance Comparison:")
         print(
-            f"   Individual calls: {individual_time:.3f}s ({len(addresses)} requests)"
+            f"   Individual calls: {individual_time:.3f}s"
+            f" ({len(addresses)} concurrent requests)"
         )
         print(f"   Batch call: {batch_time:.3f}s (1 request)")
         print(f"   Efficiency gain: {individual_time / batch_time:.1f}x faster")
+        matches = individual_balances == batch_balances
+        print(f"   Results match: {'✅ yes' if matches else '⚠️ no'}")
         print()
 
         # Display results
@@ -209,25 +226,24 @@ def main():
     print("🔄 Using convenience functions for common operations...")
 
     try:
-        # Batch balance operations
-        balance_operations = batch_get_balances(addresses[:3])
-        print(f"   📊 Created {len(balance_operations)} balance operations")
+        # Build and execute in one timed block; report only afterwards so
+        # terminal output does not leak into the measurement
+        with Timer() as t:
+            balance_operations = batch_get_balances(addresses[:3])
+            tx_operations = batch_get_transactions(addresses[:2], limit=5)
+            ordinal_operations = batch_get_ordinals(addresses[:3])
 
-        # Batch transaction operations
-        tx_operations = batch_get_transactions(addresses[:2], limit=5)
-        print(f"   📤 Created {len(tx_operations)} transaction operations")
+            # Execute all convenience operations together
+            all_operations = balance_operations + tx_operations + ordinal_operations
+            response = network.batch_request(all_operations)
 
-        # Batch ordinal operations
-        ordinal_operations = batch_get_ordinals(addresses[:3])
+        print(f"   📊 Created {len(balance_operations)} balance operations")
+        print(f"   📤 Created {len(tx_operations)} transaction operations")
         print(f"   🔢 Created {len(ordinal_operations)} ordinal operations")
-
-        # Execute all convenience operations together
-        all_operations = balance_operations + tx_operations + ordinal_operations
-        response = network.batch_request(all_operations)
-
         print(f"✅ Executed {len(all_operations)} operations")
         print(f"   Success rate: {response.success_rate():.1f}%")
         print(f"   Execution time: {response.execution_time:.3f}s")
+        print(f"   Total time (build + execute): {t.s:.3f}s")
 
     except Exception as e:
         print(f"❌ Convenience functions failed: {e}")
@@ -264,8 +280,8 @@ def main():
 
         print(f"📊 Mixed Results:")
         print(f"   Total operations: {len(mixed_operations)}")
-        print(f"   Successful: {len(response.get_successful_results())}")
-        print(f"   Failed: {len(response.get_failed_results())}")
+        print(f"   Successful: {response.summary['successful_operations']}")
+        print(f"   Failed: {response.summary['failed_operations']}")
         print(f"   Success rate: {response.success_rate():.1f}%")
         print()
 
@@ -304,11 +320,10 @@ def main():
                     for i, addr in enumerate(addresses)
                 ]
 
-                start_time = time.time()
-                response = await async_network.batch_request(operations)
-                async_time = time.time() - start_time
+                with Timer() as t:
+                    response = await async_network.batch_request(operations)
 
-                print(f"⚡ Async batch completed in {async_time:.3f}s")
+                print(f"⚡ Async batch completed in {t.s:.3f}s")
                 print(
                     f"   Concurrent execution: {response.summary.get('concurrent_execution', False)}"
                 )
@@ -345,26 +360,18 @@ def main():
     print("🔄 Creating custom batch operations...")
 
     try:
-        # Create a custom batch for portfolio analysis
-        portfolio_operations = []
-
-        # Add balance checks for all addresses
-        for i, address in enumerate(addresses):
-            portfolio_operations.append(
-                create_batch_operation(
-                    "get_balance", {"address": address}, f"portfolio_balance_{i}"
-                )
-            )
-
-        # Add transaction history for active addresses
-        for i, address in enumerate(addresses[:2]):
-            portfolio_operations.append(
-                create_batch_operation(
-                    "get_transactions",
-                    {"address": address, "limit": 10},
-                    f"portfolio_txs_{i}",
-                )
-            )
+        # Create a custom batch for portfolio analysis: balance checks for all
+        # addresses plus transaction history for active addresses
+        portfolio_operations = BatchOperation.build_many(
+            BatchOperationType.GET_BALANCE,
+            ({"address": address} for address in addresses),
+            "portfolio_balance",
+        )
+        portfolio_operations += BatchOperation.build_many(
+            BatchOperationType.GET_TRANSACTIONS,
+            ({"address": address, "limit": 10} for address in addresses[:2]),
+            "portfolio_txs",
+        )
 
         # Add network info
         portfolio_operations.append(
@@ -386,12 +393,13 @@ def main():
         active_addresses = 0
         total_transactions = 0
 
-        for result in response.get_successful_results():
-            if "portfolio_balance_" in result.id:
+        for result in response.results_by_prefix("portfolio_balance"):
+            if result.success:
                 total_portfolio_value += result.data
                 if result.data > 0:
                     active_addresses += 1
-            elif "portfolio_txs_" in result.id:
+        for result in response.results_by_prefix("portfolio_txs"):
+            if result.success:
                 total_transactions += len(result.data)
 
         print(f"📈 Portfolio Summary:")
@@ -9,6 +9,8 @@ with the Constellation Python SDK, from basic setup to advanced features.
 Perfect for developers new to Constellation or blockchain development.
 """
 
+import os
+
 from constellation_sdk import (
     Account,
     MetagraphClient,
@@ -17,6 +19,17 @@ from constellation_sdk import (
     discover_production_metagraphs,
 )
 
+# Set DEMO_VERBOSE=0 to skip the explanatory tips and overview steps
+VERBOSE = os.environ.get("DEMO_VERBOSE", "1") != "0"
+
+
+def tip(title, *lines):
+    """Print an explanatory tip block when VERBOSE is enabled."""
+    if VERBOSE:
+        print(f"\n💡 {title}")
+        for line in lines:
+            print(f"   - {line}")
+
 
 def step_1_create_accounts():
     """Step 1: Create and manage accounts"""
@@ -27,9 +40,7 @@ def step_1_create_accounts():
     alice = Account()
     print(f"✅ Created Alice's account:")
     print(f"   Address: {alice.address}")
-    print(
-        f"   Private Key: {alice.private_key_hex[:20]}...{alice.private_key_hex[-10:]}"
-    )
+    print(f"   Private Key (redacted): {alice.redacted_key()}")
 
     # Create another account
     bob = Account()
@@ -37,10 +48,12 @@ def step_1_create_accounts():
     print(f"   Address: {bob.address}")
 
     # 💡 Pro tip: Save private keys securely!
-    print("\n💡 Important: Save your private keys securely!")
-    print("   - Never share them publicly")
-    print("   - Store them in environment variables or secure vaults")
-    print("   - You can recreate accounts from private keys")
+    tip(
+        "Important: Save your private keys securely!",
+        "Never share them publicly",
+        "Store them in environment variables or secure vaults",
+        "You can recreate accounts from private keys",
+    )
 
     return alice, bob
 
@@ -63,10 +76,12 @@ def step_2_connect_to_network():
     print(f"   Node State: {node_info.get('state', 'Unknown')}")
 
     # 💡 Network options
-    print("\n💡 Available Networks:")
-    print("   - 'testnet': For development and learning (FREE tokens)")
-    print("   - 'mainnet': Production network (REAL tokens)")
-    print("   - 'integrationnet': Internal testing")
+    tip(
+        "Available Networks:",
+        "'testnet': For development and learning (FREE tokens)",
+        "'mainnet': Production network (REAL tokens)",
+        "'integrationnet': Internal testing",
+    )
 
     return testnet
 
@@ -85,10 +100,12 @@ def step_3_check_balances(network, alice, bob):
     print(f"✅ Bob's balance: {bob_balance / 1e8:.8f} DAG")
 
     # 💡 Understanding DAG units
-    print("\n💡 Understanding DAG Units:")
-    print("   - 1 DAG = 100,000,000 Datolites (smallest unit)")
-    print("   - SDK returns balances in Datolites")
-    print("   - Divide by 1e8 to get DAG amount")
+    tip(
+        "Understanding DAG Units:",
+        "1 DAG = 100,000,000 Datolites (smallest unit)",
+        "SDK returns balances in Datolites",
+        "Divide by 1e8 to get DAG amount",
+    )
 
     if alice_balance == 0:
         print("\n🚰 Need TestNet tokens? Visit the TestNet faucet!")
@@ -122,11 +139,13 @@ def step_4_create_transactions(network, alice, bob):
     print(f"   Structure: {list(signed_tx.keys())}")
 
     # 💡 Clean Architecture
-    print("\n💡 Clean Architecture:")
-    print("   - Transactions class: Creates transaction data")
-    print("   - Account class: Signs transactions")
-    print("   - Network class: Submits transactions")
-    print("   - Clear separation of concerns!")
+    tip(
+        "Clean Architecture:",
+        "Transactions class: Creates transaction data",
+        "Account class: Signs transactions",
+        "Network class: Submits transactions",
+        "Clear separation of concerns!",
+    )
 
     return signed_tx
 
@@ -175,13 +194,15 @@ def step_5_metagraph_operations():
         print(f"✅ Data transaction created")
 
         # 💡 Metagraph possibilities
-        print("\n💡 What can you build with metagraphs?")
-        print("   - Custom tokens and DeFi applications")
-        print("   - IoT sensor data verification")
-        print("   - Supply chain tracking")
-        print("   - Gaming economies")
-        print("   - Social media platforms")
-        print("   - Any custom blockchain application!")
+        tip(
+            "What can you build with metagraphs?",
+            "Custom tokens and DeFi applications",
+            "IoT sensor data verification",
+            "Supply chain tracking",
+            "Gaming economies",
+            "Social media platforms",
+            "Any custom blockchain application!",
+        )
     else:
         print("   No production metagraphs found (normal for new networks)")
 
@@ -239,11 +260,13 @@ def step_7_next_steps():
     print("   - GitHub: Contribute to the SDK")
     print("   - Documentation: https://docs.constellationnetwork.io/")
 
-    print("\n💡 Pro Tips:")
-    print("   - Start with TestNet for learning")
-    print("   - Use transaction simulation")
-    print("   - Join the Discord community")
-    print("   - Explore the examples directory")
+    tip(
+        "Pro Tips:",
+        "Start with TestNet for learning",
+        "Use transaction simulation",
+        "Join the Discord community",
+        "Explore the examples directory",
+    )
 
 
 def main():
@@ -268,11 +291,12 @@ def main():
         # Step 5: Metagraph operations
         step_5_metagraph_operations()
 
-        # Step 6: Advanced features
-        step_6_advanced_features()
+        if VERBOSE:
+            # Step 6: Advanced features
+            step_6_advanced_features()
 
-        # Step 7: Next steps
-        step_7_next_steps()
+            # Step 7: Next steps
+            step_7_next_steps()
 
         print("\n🎉 CONGRATULATIONS!")
         print("You've completed the beginner's guide to Constellation Python SDK!")
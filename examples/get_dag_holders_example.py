@@ -3,8 +3,14 @@ Example of using the Constellation SDK to get the full list of DAG holders
 from a mainnet snapshot.
 """
 
+import heapq
+from operator import itemgetter
+
+from constellation_sdk.holders import NUMPY_AVAILABLE, HoldersView
 from constellation_sdk.network import Network
 
+TOP_HOLDERS = 5
+
 
 def main():
     """
@@ -23,16 +29,19 @@ def main():
             print("No holders found or snapshot data is unavailable.")
             return
 
-        # Sort holders by amount in descending order
-        sorted_holders = sorted(holders, key=lambda x: x["amount"], reverse=True)
+        # Select the largest holders without sorting the full list
+        if NUMPY_AVAILABLE:
+            top_holders = HoldersView(holders).top(TOP_HOLDERS)
+        else:
+            top_holders = heapq.nlargest(TOP_HOLDERS, holders, key=itemgetter("amount"))
 
         # Print summary
         print(f"\nSuccessfully fetched snapshot data.")
         print(f"Total unique holders: {len(holders)}")
 
         # Print top 5 holders
-        print("\nTop 5 DAG Holders:")
-        for i, holder in enumerate(sorted_holders[:5]):
+        print(f"\nTop {TOP_HOLDERS} DAG Holders:")
+        for i, holder in enumerate(top_holders):
             print(
                 f"  {i+1}. Wallet: {holder['wallet']}, Amount: {holder['amount']:,.2f} DAG"
             )
@@ -9,15 +9,24 @@ This example shows how to use GraphQL to build sophisticated applications that
 require complex data fetching and real-time updates.
 """
 
+import argparse
 import asyncio
+import copy
+import dataclasses
+import functools
+import hashlib
 import json
 import sys
-from typing import Any, Dict, List
+import textwrap
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
 
 from constellation_sdk import (
     GRAPHQL_AVAILABLE,
     Account,
 )
+from constellation_sdk.cache import TTLCache
 
 # GraphQL imports (conditional)
 if GRAPHQL_AVAILABLE:
@@ -32,45 +41,157 @@ if GRAPHQL_AVAILABLE:
         build_network_status_query,
         build_portfolio_query,
         execute_query,
-        execute_query_async,
         get_account_portfolio,
         get_metagraph_overview,
         get_network_status,
     )
 
 
+# Key generation is the slowest part of creating an Account, so the demos
+# share one small pool instead of generating fresh keys in every function
+DEMO_ACCOUNT_POOL_SIZE = 6
+_DEMO_ACCOUNTS = (
+    tuple(Account() for _ in range(DEMO_ACCOUNT_POOL_SIZE)) if GRAPHQL_AVAILABLE else ()
+)
+
+
+def get_demo_accounts(n: int) -> tuple:
+    """Get the first n accounts of the shared demo pool."""
+    return _DEMO_ACCOUNTS[:n]
+
+
+# Upper bound on concurrent queries issued by the async demo
+MAX_IN_FLIGHT_QUERIES = 4
+
+
+# Short-lived cache of successful query results shared by the demos
+RESULT_CACHE_TTL = 30.0  # seconds
+RESULT_CACHE_MAXSIZE = 128
+_RESULT_CACHE = TTLCache(RESULT_CACHE_TTL, RESULT_CACHE_MAXSIZE)
+_RESULT_CACHE_STATS = {"hits": 0, "misses": 0, "warmed": 0}
+
+
+def _query_digest(query: str) -> bytes:
+    return hashlib.blake2b(query.encode(), digest_size=16).digest()
+
+
+def _result_key(client, query: str, variables: Optional[Dict[str, Any]]) -> tuple:
+    # Known query constants are hashed once at import; look them up by identity
+    digest = _QUERY_DIGESTS.get(id(query)) or _query_digest(query)
+    return (client.graphql_endpoint, digest, json.dumps(variables, sort_keys=True))
+
+
+def _copy_response(response, **changes):
+    """Copy a response with its own data, so cached entries are never shared."""
+    return dataclasses.replace(response, data=copy.deepcopy(response.data), **changes)
+
+
+def _store_result(key: tuple, response) -> None:
+    if response.is_successful:
+        _RESULT_CACHE.set(key, _copy_response(response))
+
+
+def cached_execute(client, query: str, variables: Optional[Dict[str, Any]] = None):
+    """
+    Execute a query, reusing a recent identical result when available.
+
+    Results are keyed on the client's endpoint, the query text and the
+    variables; failed responses are never cached. A cached result is
+    returned with a "cached" response extension set.
+    """
+    key = _result_key(client, query, variables)
+
+    hit, response = _RESULT_CACHE.get(key)
+    if hit:
+        _RESULT_CACHE_STATS["hits"] += 1
+        return _copy_response(
+            response, extensions={**response.extensions, "cached": True}
+        )
+
+    _RESULT_CACHE_STATS["misses"] += 1
+    response = client.execute(query, variables)
+    _store_result(key, response)
+    return response
+
+
+def warm_result_cache(client, queries: List[tuple]) -> None:
+    """
+    Prime the result cache by running the given queries concurrently.
+
+    Args:
+        client: GraphQL client the demos will use
+        queries: (query, variables) pairs the demos are about to execute
+    """
+    keys = [_result_key(client, query, variables) for query, variables in queries]
+    with ThreadPoolExecutor(max_workers=len(queries)) as executor:
+        responses = list(executor.map(lambda qv: client.execute(*qv), queries))
+
+    for key, response in zip(keys, responses):
+        _store_result(key, response)
+        _RESULT_CACHE_STATS["warmed"] += response.is_successful
+
+
+# Query strings depend only on their arguments, so build each one once
+@functools.lru_cache(maxsize=256)
+def _cached_build_network() -> str:
+    return build_network_status_query()
+
+
+@functools.lru_cache(maxsize=256)
+def _cached_build_account(
+    address: str, include_transactions: bool = True, include_balances: bool = True
+) -> str:
+    return build_account_query(address, include_transactions, include_balances)
+
+
+@functools.lru_cache(maxsize=256)
+def _cached_build_metagraph(
+    metagraph_id: str, include_holders: bool = True, include_transactions: bool = True
+) -> str:
+    return build_metagraph_query(metagraph_id, include_holders, include_transactions)
+
+
+@functools.lru_cache(maxsize=256)
+def _cached_build_portfolio(addresses: tuple) -> str:
+    return build_portfolio_query(list(addresses))
+
+
+DATOSHI_PER_DAG = 10**8
+
+
+def fmt_dag(amount: int) -> str:
+    """Format a datoshi amount as DAG with exact integer arithmetic."""
+    sign = "-" if amount < 0 else ""
+    whole, frac = divmod(abs(int(amount)), DATOSHI_PER_DAG)
+    return f"{sign}{whole}.{frac:08d}"
+
+
+SECTION_RULE = "=" * 60
+SUBSECTION_RULE = "─" * 40
+
+
 def print_section(title: str):
     """Print a formatted section header."""
-    print(f"\n{'='*60}")
-    print(f"🌌 {title}")
-    print(f"{'='*60}")
+    sys.stdout.write(f"\n{SECTION_RULE}\n🌌 {title}\n{SECTION_RULE}\n")
 
 
 def print_subsection(title: str):
     """Print a formatted subsection header."""
-    print(f"\n{'─'*40}")
-    print(f"✨ {title}")
-    print(f"{'─'*40}")
+    sys.stdout.write(f"\n{SUBSECTION_RULE}\n✨ {title}\n{SUBSECTION_RULE}\n")
 
 
-def basic_graphql_demo():
-    """Demonstrate basic GraphQL query execution."""
-    print_section("Basic GraphQL Demo")
+def print_execution_time(response):
+    """Print a query's execution time, or note that it came from the cache."""
+    if response.extensions.get("cached"):
+        print("⏱️  Execution time: served from cache")
+    else:
+        print(f"⏱️  Execution time: {response.execution_time:.3f}s")
 
-    if not GRAPHQL_AVAILABLE:
-        print("❌ GraphQL functionality not available. Install optional dependencies:")
-        print("   pip install aiohttp websockets")
-        return
-
-    # Initialize GraphQL client
-    client = GraphQLClient("testnet")
-    print(f"📡 Connected to GraphQL endpoint: {client.graphql_endpoint}")
-
-    print_subsection("Network Status Query")
 
-    # Simple network status query
-    network_query = """
-    query NetworkStatus {
+# Network status and account portfolio selections under one operation, so
+# both are fetched in a single round trip
+COMBINED_STATUS_QUERY = textwrap.dedent("""
+    query Combined($address: String!) {
         network {
             status
             nodeCount
@@ -86,59 +207,144 @@ def basic_graphql_demo():
                 activeAddresses
             }
         }
+        account(address: $address) {
+            address
+            balance
+            transactions(first: 20) {
+                hash
+                amount
+                timestamp
+                destination
+            }
+            metagraphBalances {
+                metagraphId
+                balance
+                tokenSymbol
+            }
+        }
+    }
+    """).strip()
+
+
+# Queries used by the performance and error handling demos
+COMPREHENSIVE_QUERY = textwrap.dedent("""
+    query ComprehensiveData($addresses: [String!]!) {
+        accounts(addresses: $addresses) {
+            address
+            balance
+            transactions(first: 5) {
+                hash
+                amount
+            }
+        }
+        network {
+            status
+            nodeCount
+            version
+        }
+    }
+    """).strip()
+
+INVALID_SYNTAX_QUERY = "query { invalid syntax here }"
+
+UNKNOWN_FIELD_QUERY = textwrap.dedent("""
+    query {
+        network {
+            nonExistentField
+        }
     }
+    """).strip()
+
+
+# Digests of the module-level query strings, keyed by object identity. The
+# constants live for the whole process, so their ids are never reused.
+_QUERY_DIGESTS = {
+    id(query): _query_digest(query)
+    for query in (
+        COMBINED_STATUS_QUERY,
+        COMPREHENSIVE_QUERY,
+        INVALID_SYNTAX_QUERY,
+        UNKNOWN_FIELD_QUERY,
+    )
+}
+if GRAPHQL_AVAILABLE:
+    _QUERY_DIGESTS.update(
+        (id(query), _query_digest(query))
+        for query in (
+            ConstellationSchema.NETWORK_STATUS,
+            ConstellationSchema.ACCOUNT_PORTFOLIO,
+            ConstellationSchema.METAGRAPH_OVERVIEW,
+        )
+    )
+
+
+def run_combined(client, address: str):
     """
+    Fetch network status and an account portfolio with one query.
 
-    try:
-        response = client.execute(network_query)
+    Returns:
+        Tuple of (response, network data, account data)
+    """
+    response = cached_execute(client, COMBINED_STATUS_QUERY, {"address": address})
+    data = response.data or {}
+    return response, data.get("network", {}), data.get("account", {})
 
-        if response.is_successful:
-            print("✅ Network status query executed successfully")
-            print(f"⏱️  Execution time: {response.execution_time:.3f}s")
-            print("\n📊 Network Data:")
-            print(json.dumps(response.data, indent=2))
-        else:
-            print("❌ Network status query failed")
-            for error in response.errors:
-                print(f"  Error: {error}")
 
-    except Exception as e:
-        print(f"❌ Error executing network query: {e}")
+def basic_graphql_demo(client, verbose: bool = False):
+    """
+    Demonstrate basic GraphQL query execution.
+
+    Args:
+        client: Shared GraphQL client
+        verbose: Dump the full network payload instead of a summary
+    """
+    print_section("Basic GraphQL Demo")
+
+    if not GRAPHQL_AVAILABLE:
+        print("❌ GraphQL functionality not available. Install optional dependencies:")
+        print("   pip install aiohttp websockets")
+        return
+
+    print(f"📡 Connected to GraphQL endpoint: {client.graphql_endpoint}")
 
-    print_subsection("Account Portfolio Query")
+    print_subsection("Combined Network + Account Query")
 
     # Create a test account for demonstration
-    account = Account()
+    (account,) = get_demo_accounts(1)
     print(f"📍 Demo account: {account.address}")
 
-    # Account portfolio query with variables
-    account_query = GraphQLQuery(
-        query=ConstellationSchema.ACCOUNT_PORTFOLIO,
-        variables={"address": account.address},
-    )
-
     try:
-        response = client.execute(account_query)
+        response, network_data, account_data = run_combined(client, account.address)
 
         if response.is_successful:
-            print("✅ Account portfolio query executed successfully")
-            print(f"⏱️  Execution time: {response.execution_time:.3f}s")
-
-            account_data = response.data.get("account", {})
-            balance = account_data.get("balance", 0)
-            transactions = account_data.get("transactions", [])
-            metagraph_balances = account_data.get("metagraphBalances", [])
+            print("✅ Combined query executed successfully (1 round trip)")
+            print_execution_time(response)
+            print("\n📊 Network Data:")
+            if verbose:
+                # Stream straight to stdout rather than building one big string
+                json.dump(network_data, sys.stdout, indent=2)
+                sys.stdout.write("\n")
+            else:
+                print(f"   Status: {network_data.get('status', 'Unknown')}")
+                print(f"   Fields: {', '.join(network_data) or 'none'}")
+                print("   (run with --verbose for the full payload)")
+
+            balance, transactions, metagraph_balances = (
+                account_data.get("balance", 0),
+                account_data.get("transactions", ()),
+                account_data.get("metagraphBalances", ()),
+            )
 
-            print(f"\n💰 Account Balance: {balance / 1e8:.8f} DAG")
+            print(f"\n💰 Account Balance: {fmt_dag(balance)} DAG")
             print(f"📜 Recent Transactions: {len(transactions)}")
             print(f"🏛️  Metagraph Balances: {len(metagraph_balances)}")
         else:
-            print("❌ Account portfolio query failed")
+            print("❌ Combined query failed")
             for error in response.errors:
                 print(f"  Error: {error}")
 
     except Exception as e:
-        print(f"❌ Error executing account query: {e}")
+        print(f"❌ Error executing combined query: {e}")
 
     # Show client statistics
     print_subsection("Client Statistics")
@@ -148,7 +354,7 @@ def basic_graphql_demo():
     print(f"📊 Errors encountered: {stats['errors_encountered']}")
 
 
-def query_builder_demo():
+def query_builder_demo(client):
     """Demonstrate the GraphQL query builder."""
     print_section("Query Builder Demo")
 
@@ -158,9 +364,9 @@ def query_builder_demo():
 
     print_subsection("Programmatic Query Construction")
 
-    # Create test account
-    account = Account()
-    addresses = [account.address, Account().address, Account().address]
+    # Reuse pooled test accounts
+    accounts = get_demo_accounts(3)
+    addresses = [acc.address for acc in accounts]
 
     print(f"🏗️  Building queries for {len(addresses)} addresses...")
 
@@ -194,14 +400,9 @@ def query_builder_demo():
 
     # Build network status query
     print("\n3️⃣ Building Network Query:")
-    network_query = (
-        QueryBuilder()
-        .network()
-        .with_status()
-        .with_latest_block()
-        .with_metrics()
-        .build()
-    )
+    # Same chain as QueryBuilder().network().with_status().with_latest_block()
+    # .with_metrics().build(), built once and shared with later demos
+    network_query = _cached_build_network()
 
     print("Generated Query:")
     print(network_query)
@@ -226,15 +427,13 @@ def query_builder_demo():
     print_subsection("Execute Built Queries")
 
     # Execute one of the built queries
-    client = GraphQLClient("testnet")
-
     try:
         print("🔄 Executing network status query...")
-        response = client.execute(network_query)
+        response = cached_execute(client, network_query)
 
         if response.is_successful:
             print("✅ Network query executed successfully")
-            print(f"⏱️  Execution time: {response.execution_time:.3f}s")
+            print_execution_time(response)
 
             network_data = response.data.get("network", {})
             print(f"📊 Network Status: {network_data.get('status', 'Unknown')}")
@@ -260,7 +459,7 @@ def subscription_demo():
     print_subsection("Real-time Subscription Building")
 
     # Create test accounts for monitoring
-    addresses = [Account().address, Account().address]
+    addresses = [acc.address for acc in get_demo_accounts(2)]
     metagraph_ids = ["DAG7Ghth6FKMcvfK6A8BGSKvJvBYe4EFKgPvvQPJqhQs"]
 
     print(f"📡 Building subscriptions for {len(addresses)} addresses...")
@@ -296,7 +495,7 @@ def subscription_demo():
     print("   • Custom event filtering")
 
 
-async def async_graphql_demo():
+async def async_graphql_demo(client):
     """Demonstrate async GraphQL operations."""
     print_section("Async GraphQL Demo")
 
@@ -307,57 +506,58 @@ async def async_graphql_demo():
     print_subsection("Async Query Execution")
 
     # Multiple accounts for concurrent operations
-    accounts = [Account() for _ in range(3)]
+    accounts = get_demo_accounts(3)
     addresses = [acc.address for acc in accounts]
 
     print(f"🚀 Executing async queries for {len(addresses)} accounts...")
 
-    # Convenience function for async queries
-    try:
-        print("\n1️⃣ Network Status (Async):")
-        network_response = await execute_query_async(
-            "testnet", ConstellationSchema.NETWORK_STATUS
-        )
-
-        if network_response.is_successful:
-            print("✅ Network status retrieved successfully")
-            print(f"⏱️  Execution time: {network_response.execution_time:.3f}s")
-
-            network_data = network_response.data.get("network", {})
-            print(f"📊 Status: {network_data.get('status', 'Unknown')}")
-        else:
-            print("❌ Network status query failed")
-
-    except Exception as e:
-        print(f"❌ Error in async network query: {e}")
-
-    # Multiple account queries concurrently
+    # Network status and every account query run concurrently: execute_async
+    # hands the blocking REST translation to a worker thread, so the phase
+    # costs the slowest query rather than the sum of all of them. Results
+    # are printed as each one arrives instead of after the last.
     try:
-        print("\n2️⃣ Multiple Account Queries (Concurrent):")
-
-        async def get_account_data(address: str) -> Dict[str, Any]:
-            return await execute_query_async(
-                "testnet", ConstellationSchema.ACCOUNT_PORTFOLIO, {"address": address}
+        print("\n1️⃣ Network Status + Account Queries (Concurrent):")
+
+        # Cap in-flight queries so larger address lists do not tie up an
+        # unbounded number of worker threads and pooled connections at once
+        semaphore = asyncio.Semaphore(MAX_IN_FLIGHT_QUERIES)
+
+        async def _tagged(index, coro):
+            try:
+                async with semaphore:
+                    return index, await coro
+            except Exception as e:
+                return index, e
+
+        queries = [client.execute_async(ConstellationSchema.NETWORK_STATUS)]
+        queries += [
+            client.execute_async(
+                ConstellationSchema.ACCOUNT_PORTFOLIO, {"address": address}
             )
+            for address in addresses[:2]  # Limit to 2 for demo
+        ]
 
-        # Execute multiple queries concurrently
-        tasks = [
-            get_account_data(addr) for addr in addresses[:2]
-        ]  # Limit to 2 for demo
-        responses = await asyncio.gather(*tasks, return_exceptions=True)
-
-        print(f"✅ Executed {len(responses)} concurrent queries")
+        for future in asyncio.as_completed(
+            [_tagged(i, query) for i, query in enumerate(queries)]
+        ):
+            i, response = await future
+            label = "Network" if i == 0 else f"Account {i}"
 
-        for i, response in enumerate(responses):
             if isinstance(response, Exception):
-                print(f"  Account {i+1}: ❌ {response}")
+                print(f"  {label}: ❌ {response}")
+            elif not response.is_successful:
+                print(f"  {label}: ❌ Query failed")
+            elif i == 0:
+                network_data = response.data.get("network", {})
+                print(
+                    f"  {label}: 📊 {network_data.get('status', 'Unknown')}"
+                    f" ({response.execution_time:.3f}s)"
+                )
             else:
-                if response.is_successful:
-                    account_data = response.data.get("account", {})
-                    balance = account_data.get("balance", 0)
-                    print(f"  Account {i+1}: 💰 {balance / 1e8:.8f} DAG")
-                else:
-                    print(f"  Account {i+1}: ❌ Query failed")
+                balance = response.data.get("account", {}).get("balance", 0)
+                print(f"  {label}: 💰 {fmt_dag(balance)} DAG")
+
+        print(f"✅ Executed {len(queries)} concurrent queries")
 
     except Exception as e:
         print(f"❌ Error in concurrent queries: {e}")
@@ -365,8 +565,6 @@ async def async_graphql_demo():
     print_subsection("Async Subscription Simulation")
 
     # Simulate subscription handling
-    client = GraphQLClient("testnet")
-
     try:
         print("🔄 Starting subscription simulation...")
         subscription_query = ConstellationSchema.TRANSACTION_SUBSCRIPTION
@@ -375,22 +573,26 @@ async def async_graphql_demo():
         print("📡 Simulating transaction updates for 10 seconds...")
 
         event_count = 0
-        async for response in client.subscribe(
-            subscription_query, {"addresses": addresses[:1]}
-        ):
-            if response.is_successful:
-                event_count += 1
-                tx_data = response.data.get("transactionUpdates", {})
-                print(
-                    f"  📝 Event {event_count}: Transaction {tx_data.get('hash', 'N/A')[:12]}..."
-                )
-
-                # Limit simulation
-                if event_count >= 5:
+        updates = client.subscribe(subscription_query, {"addresses": addresses[:1]})
+        try:
+            async for response in updates:
+                if response.is_successful:
+                    event_count += 1
+                    tx_data = response.data.get("transactionUpdates", {})
+                    print(
+                        f"  📝 Event {event_count}: Transaction {tx_data.get('hash', 'N/A')[:12]}..."
+                    )
+
+                    # Limit simulation
+                    if event_count >= 5:
+                        break
+                else:
+                    print(f"  ❌ Subscription error: {response.errors}")
                     break
-            else:
-                print(f"  ❌ Subscription error: {response.errors}")
-                break
+        finally:
+            # Close the generator now so the subscription is torn down
+            # immediately rather than when it is garbage collected
+            await updates.aclose()
 
         print(f"✅ Subscription simulation completed ({event_count} events)")
 
@@ -398,6 +600,8 @@ async def async_graphql_demo():
         print(f"❌ Error in subscription simulation: {e}")
 
     finally:
+        # Last user of the shared client; release the pooled HTTP
+        # connections of its underlying Network
         await client.close()
 
 
@@ -412,15 +616,26 @@ def convenience_functions_demo():
     print_subsection("Quick GraphQL Operations")
 
     # Create test data
-    account = Account()
+    (account,) = get_demo_accounts(1)
     metagraph_id = "DAG7Ghth6FKMcvfK6A8BGSKvJvBYe4EFKgPvvQPJqhQs"
 
     print(f"🎯 Using convenience functions for quick operations...")
 
+    # The three lookups are independent, so run them together; the results
+    # are reported below in their usual order once all have finished
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        network_future = executor.submit(get_network_status, "testnet")
+        portfolio_future = executor.submit(
+            get_account_portfolio, "testnet", account.address
+        )
+        metagraph_future = executor.submit(
+            get_metagraph_overview, "testnet", metagraph_id
+        )
+
     # Network status convenience function
     try:
         print("\n1️⃣ Network Status (Convenience Function):")
-        response = get_network_status("testnet")
+        response = network_future.result()
 
         if response.is_successful:
             print("✅ Network status retrieved")
@@ -440,7 +655,7 @@ def convenience_functions_demo():
     # Account portfolio convenience function
     try:
         print("\n2️⃣ Account Portfolio (Convenience Function):")
-        response = get_account_portfolio("testnet", account.address)
+        response = portfolio_future.result()
 
         if response.is_successful:
             print("✅ Account portfolio retrieved")
@@ -450,7 +665,7 @@ def convenience_functions_demo():
             balance = account_data.get("balance", 0)
             transactions = account_data.get("transactions", [])
 
-            print(f"💰 Balance: {balance / 1e8:.8f} DAG")
+            print(f"💰 Balance: {fmt_dag(balance)} DAG")
             print(f"📜 Transactions: {len(transactions)}")
         else:
             print("❌ Account portfolio failed")
@@ -463,7 +678,7 @@ def convenience_functions_demo():
     # Metagraph overview convenience function
     try:
         print("\n3️⃣ Metagraph Overview (Convenience Function):")
-        response = get_metagraph_overview("testnet", metagraph_id)
+        response = metagraph_future.result()
 
         if response.is_successful:
             print("✅ Metagraph overview retrieved")
@@ -472,7 +687,7 @@ def convenience_functions_demo():
             metagraph_data = response.data.get("metagraph", {})
             print(f"🏛️  Name: {metagraph_data.get('name', 'Unknown')}")
             print(f"🪙 Token: {metagraph_data.get('tokenSymbol', 'N/A')}")
-            print(f"📊 Supply: {metagraph_data.get('totalSupply', 0) / 1e8:.8f}")
+            print(f"📊 Supply: {fmt_dag(metagraph_data.get('totalSupply', 0))}")
         else:
             print("❌ Metagraph overview failed")
             for error in response.errors:
@@ -484,32 +699,32 @@ def convenience_functions_demo():
     print_subsection("Convenience Query Builders")
 
     # Show pre-built query generators
-    addresses = [account.address, Account().address]
+    addresses = [acc.address for acc in get_demo_accounts(2)]
 
     print("🔧 Generated queries using convenience builders:")
 
     print("\n• Account Query:")
-    account_query = build_account_query(
+    account_query = _cached_build_account(
         account.address, include_transactions=True, include_balances=True
     )
     print(f"  Length: {len(account_query)} characters")
 
     print("\n• Metagraph Query:")
-    metagraph_query = build_metagraph_query(
+    metagraph_query = _cached_build_metagraph(
         metagraph_id, include_holders=True, include_transactions=True
     )
     print(f"  Length: {len(metagraph_query)} characters")
 
     print("\n• Network Status Query:")
-    network_query = build_network_status_query()
+    network_query = _cached_build_network()
     print(f"  Length: {len(network_query)} characters")
 
     print("\n• Portfolio Query:")
-    portfolio_query = build_portfolio_query(addresses)
+    portfolio_query = _cached_build_portfolio(tuple(addresses))
     print(f"  Length: {len(portfolio_query)} characters")
 
 
-def error_handling_demo():
+def error_handling_demo(client):
     """Demonstrate GraphQL error handling."""
     print_section("GraphQL Error Handling Demo")
 
@@ -519,68 +734,46 @@ def error_handling_demo():
 
     print_subsection("Error Scenarios")
 
-    client = GraphQLClient("testnet")
-
-    # Invalid query syntax
-    print("\n1️⃣ Invalid Query Syntax:")
-    invalid_query = "query { invalid syntax here }"
-
-    try:
-        response = client.execute(invalid_query)
-
-        if response.has_errors:
-            print("✅ Error handling working correctly")
-            print(f"📊 {len(response.errors)} error(s) detected")
-            for error in response.errors:
-                print(f"  ❌ {error.get('message', 'Unknown error')}")
-        else:
-            print("⚠️  Expected error not detected")
-
-    except Exception as e:
-        print(f"✅ Exception caught: {e}")
-
-    # Non-existent field
-    print("\n2️⃣ Non-existent Field:")
-    field_query = """
-    query {
-        network {
-            nonExistentField
-        }
-    }
-    """
-
+    scenarios = [
+        (
+            "1️⃣ Invalid Query Syntax",
+            INVALID_SYNTAX_QUERY,
+            "Error handling working correctly",
+            "Expected error not detected",
+        ),
+        (
+            "2️⃣ Non-existent Field",
+            UNKNOWN_FIELD_QUERY,
+            "Field validation working",
+            "Field error not detected",
+        ),
+        (
+            "3️⃣ Invalid Variables",
+            GraphQLQuery(
+                query=ConstellationSchema.ACCOUNT_PORTFOLIO,
+                variables={"address": "INVALID_ADDRESS_FORMAT"},
+            ),
+            "Variable validation working",
+            "Variable error not detected",
+        ),
+    ]
+
+    # Submit every scenario in one batch; errors are still reported per query
     try:
-        response = client.execute(field_query)
-
-        if response.has_errors:
-            print("✅ Field validation working")
-            for error in response.errors:
-                print(f"  ❌ {error.get('message', 'Unknown error')}")
-        else:
-            print("⚠️  Field error not detected")
-
+        responses = client.batch_execute([query for _, query, _, _ in scenarios])
     except Exception as e:
         print(f"✅ Exception caught: {e}")
+        responses = []
 
-    # Invalid variables
-    print("\n3️⃣ Invalid Variables:")
-    var_query = GraphQLQuery(
-        query=ConstellationSchema.ACCOUNT_PORTFOLIO,
-        variables={"address": "INVALID_ADDRESS_FORMAT"},
-    )
-
-    try:
-        response = client.execute(var_query)
-
+    for (title, _, detected, missing), response in zip(scenarios, responses):
+        print(f"\n{title}:")
         if response.has_errors:
-            print("✅ Variable validation working")
+            print(f"✅ {detected}")
+            print(f"📊 {len(response.errors)} error(s) detected")
             for error in response.errors:
                 print(f"  ❌ {error.get('message', 'Unknown error')}")
         else:
-            print("⚠️  Variable error not detected")
-
-    except Exception as e:
-        print(f"✅ Exception caught: {e}")
+            print(f"⚠️  {missing}")
 
     print_subsection("Graceful Degradation")
 
@@ -591,7 +784,7 @@ def error_handling_demo():
     print("   • Applications can handle partial responses gracefully")
 
 
-def performance_demo():
+def performance_demo(client):
     """Demonstrate GraphQL performance benefits."""
     print_section("GraphQL Performance Demo")
 
@@ -601,8 +794,7 @@ def performance_demo():
 
     print_subsection("Performance Comparison")
 
-    client = GraphQLClient("testnet")
-    accounts = [Account() for _ in range(3)]
+    accounts = get_demo_accounts(3)
     addresses = [acc.address for acc in accounts]
 
     print(f"⚡ Comparing performance for {len(addresses)} accounts...")
@@ -610,41 +802,23 @@ def performance_demo():
     # Single comprehensive query vs multiple REST calls
     print("\n1️⃣ Single GraphQL Query (Multiple Data Points):")
 
-    comprehensive_query = """
-    query ComprehensiveData($addresses: [String!]!) {
-        accounts(addresses: $addresses) {
-            address
-            balance
-            transactions(first: 5) {
-                hash
-                amount
-            }
-        }
-        network {
-            status
-            nodeCount
-            version
-        }
-    }
-    """
-
     try:
-        start_time = time.time()
-        response = client.execute(comprehensive_query, {"addresses": addresses})
-        execution_time = time.time() - start_time
+        start_time = time.perf_counter()
+        response = client.execute(COMPREHENSIVE_QUERY, {"addresses": addresses})
+        execution_time = time.perf_counter() - start_time
 
         if response.is_successful:
             print("✅ Comprehensive query executed")
             print(f"⏱️  Total time: {execution_time:.3f}s")
             print(f"📊 Data points retrieved:")
 
-            accounts_data = response.data.get("accounts", [])
-            network_data = response.data.get("network", {})
+            accounts_data = response.data.get("accounts", ())
 
             print(f"   • {len(accounts_data)} account balances")
-            total_transactions = sum(
-                len(acc.get("transactions", [])) for acc in accounts_data
-            )
+            total_transactions = 0
+            for acc in accounts_data:
+                if "transactions" in acc:
+                    total_transactions += len(acc["transactions"])
             print(f"   • {total_transactions} transactions")
             print(f"   • 1 network status")
             print(f"   • All in a single request!")
@@ -674,6 +848,17 @@ def performance_demo():
 
 def main():
     """Run all GraphQL demos."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--verbose", action="store_true", help="print full query payloads"
+    )
+    parser.add_argument(
+        "--debug",
+        action="store_true",
+        help="print full tracebacks for unexpected demo failures",
+    )
+    args = parser.parse_args()
+
     print("🌌 Constellation Network GraphQL API Demo")
     print("=" * 60)
 
@@ -688,20 +873,39 @@ def main():
     print("🚀 Starting comprehensive GraphQL demonstration...")
 
     try:
+        # One client for every demo so its connections are reused
+        client = GraphQLClient("testnet")
+
+        # Fetch the deterministic queries the demos repeat in one concurrent
+        # round so the demos below are served from the result cache
+        (account,) = get_demo_accounts(1)
+        warm_result_cache(
+            client,
+            [
+                (COMBINED_STATUS_QUERY, {"address": account.address}),
+                (_cached_build_network(), None),
+            ],
+        )
+
         # Run synchronous demos
-        basic_graphql_demo()
-        query_builder_demo()
+        basic_graphql_demo(client, verbose=args.verbose)
+        query_builder_demo(client)
         subscription_demo()
         convenience_functions_demo()
-        error_handling_demo()
-        performance_demo()
+        error_handling_demo(client)
+        performance_demo(client)
 
         # Run async demo
         print_section("Running Async Demo")
-        asyncio.run(async_graphql_demo())
+        asyncio.run(async_graphql_demo(client))
 
         print_section("Demo Complete")
         print("✅ All GraphQL demos completed successfully!")
+        print(
+            f"🗄️  Result cache: {_RESULT_CACHE_STATS['warmed']} warmed,"
+            f" {_RESULT_CACHE_STATS['hits']} hits,"
+            f" {_RESULT_CACHE_STATS['misses']} misses"
+        )
         print("\n🎯 Next Steps:")
         print("   • Explore the CLI: constellation graphql --help")
         print("   • Try the playground: constellation graphql playground")
@@ -712,13 +916,13 @@ def main():
         print("\n\n⏹️  Demo interrupted by user")
     except Exception as e:
         print(f"\n❌ Demo error: {e}")
-        import traceback
+        if args.debug:
+            import traceback
 
-        traceback.print_exc()
+            traceback.print_exc()
+        else:
+            print("   (run with --debug for a traceback)")
 
 
 if __name__ == "__main__":
-    # Add time import for performance demo
-    import time
-
     main()
@@ -8,6 +8,10 @@ DeFi analytics, and monitoring systems.
 """
 
 import asyncio
+import contextvars
+import copy
+import heapq
+import io
 import json
 import sys
 import time
@@ -19,6 +23,7 @@ from constellation_sdk import (
     Account,
     Network,
 )
+from constellation_sdk.cache import TTLCache
 
 # GraphQL imports (conditional)
 if GRAPHQL_AVAILABLE:
@@ -26,6 +31,7 @@ if GRAPHQL_AVAILABLE:
         ConstellationSchema,
         GraphQLClient,
         GraphQLQuery,
+        GraphQLResponse,
         QueryBuilder,
         SubscriptionBuilder,
         build_account_query,
@@ -38,34 +44,264 @@ if GRAPHQL_AVAILABLE:
     )
 
 
+# Output buffer of the demo running in the current task; None prints directly
+_demo_output = contextvars.ContextVar("demo_output", default=None)
+
+
+def emit(*args):
+    """Print to the current demo's output buffer, or to stdout outside one."""
+    buffer = _demo_output.get()
+    print(*args, file=sys.stdout if buffer is None else buffer)
+
+
+async def _capture_output(demo) -> str:
+    """Run a demo with its output buffered and return what it printed."""
+    buffer = io.StringIO()
+    # gather() runs each demo in its own task, so this does not leak across
+    _demo_output.set(buffer)
+    await demo()
+    return buffer.getvalue()
+
+
 def print_header(title: str):
     """Print a formatted header."""
-    print(f"\n{'='*80}")
-    print(f"🚀 {title}")
-    print(f"{'='*80}")
+    emit(f"\n{'='*80}")
+    emit(f"🚀 {title}")
+    emit(f"{'='*80}")
 
 
 def print_section(title: str):
     """Print a formatted section."""
-    print(f"\n{'─'*60}")
-    print(f"✨ {title}")
-    print(f"{'─'*60}")
+    emit(f"\n{'─'*60}")
+    emit(f"✨ {title}")
+    emit(f"{'─'*60}")
 
 
 def print_result(success: bool, message: str):
     """Print a formatted result."""
     icon = "✅" if success else "❌"
-    print(f"{icon} {message}")
+    emit(f"{icon} {message}")
+
+
+# Raw on-chain amounts are integers in datoshi; convert once when reporting
+DATOSHI_PER_DAG = 10**8
+
+# One client per network, shared by every analyzer so they reuse one pool
+_CLIENTS: Dict[str, "GraphQLClient"] = {}
+
+
+def _get_client(network: str) -> "GraphQLClient":
+    """Get the shared GraphQL client for a network, creating it on first use."""
+    client = _CLIENTS.get(network)
+    if client is None:
+        client = _CLIENTS[network] = GraphQLClient(network)
+    return client
+
+
+async def close_clients():
+    """Close every shared GraphQL client."""
+    while _CLIENTS:
+        _, client = _CLIENTS.popitem()
+        await client.close()
+
+
+# Seconds a fetched portfolio or ecosystem overview is reused by repeat calls,
+# and how many distinct address or metagraph sets each analyzer keeps
+RESULT_CACHE_TTL = 5.0
+RESULT_CACHE_MAXSIZE = 32
+
+
+def _cache_lookup(cache: TTLCache, key: Tuple) -> Any:
+    """
+    Get a copy of an unexpired cached result, or None.
+
+    Callers get their own copy so mutating it never alters the cached entry.
+    """
+    hit, result = cache.get(key)
+    return copy.deepcopy(result) if hit else None
+
+
+def _account_metrics(
+    accounts: List[Dict[str, Any]], cutoff_time: float, keep_transactions=True
+) -> Tuple[List[Tuple[int, int, int, int]], List[Dict[str, Any]]]:
+    """
+    Aggregate recent activity per account.
+
+    Args:
+        accounts: Account dictionaries with their transactions
+        cutoff_time: Unix time before which transactions are ignored
+        keep_transactions: Collect the recent transactions; when False the
+            returned list is empty
+
+    Returns:
+        Tuple of per-account (volume, recent, incoming, outgoing) counters and
+        the recent transactions of all accounts, in account order
+    """
+    metrics = []
+    recent_transactions = []
+    for account_data in accounts:
+        address = account_data["address"]
+        volume = recent = incoming = outgoing = 0
+        for tx in account_data.get("transactions", []):
+            if tx.get("timestamp", 0) <= cutoff_time:
+                continue
+            volume += tx.get("amount", 0)
+            recent += 1
+            incoming += tx.get("destination") == address
+            outgoing += tx.get("source") == address
+            if keep_transactions:
+                recent_transactions.append(tx)
+        metrics.append((volume, recent, incoming, outgoing))
+    return metrics, recent_transactions
+
+
+# Addresses per accounts query; larger lists are split and fetched concurrently
+# so no single query exceeds the server's complexity budget
+ADDRESS_CHUNK_SIZE = 50
+
+
+async def _execute_chunked(
+    client: "GraphQLClient", query: str, addresses: List[str]
+) -> "GraphQLResponse":
+    """
+    Execute an accounts query in ADDRESS_CHUNK_SIZE shards and merge them.
+
+    Shards overlap because execute_async runs each blocking REST translation
+    in a worker thread. The merged response carries every shard's accounts,
+    in order, plus the other top-level fields of the first shard. The first failing shard's
+    response is returned as-is.
+    """
+    if len(addresses) <= ADDRESS_CHUNK_SIZE:
+        return await client.execute_async(query, {"addresses": addresses})
+
+    responses = await asyncio.gather(
+        *(
+            client.execute_async(
+                query, {"addresses": addresses[i : i + ADDRESS_CHUNK_SIZE]}
+            )
+            for i in range(0, len(addresses), ADDRESS_CHUNK_SIZE)
+        )
+    )
+    for response in responses:
+        if not response.is_successful:
+            return response
+
+    data = dict(responses[0].data)
+    data["accounts"] = [
+        account
+        for response in responses
+        for account in response.data.get("accounts", [])
+    ]
+    return GraphQLResponse(
+        data=data, execution_time=max(r.execution_time or 0 for r in responses)
+    )
+
+
+# Static query documents, built once and reused on every call
+_PORTFOLIO_QUERY = """
+query ComprehensivePortfolio($addresses: [String!]!) {
+    accounts(addresses: $addresses) {
+        address
+        balance
+        transactions(first: 10) {
+            hash
+            amount
+            timestamp
+            destination
+            type
+        }
+        metagraphBalances {
+            metagraphId
+            balance
+            tokenSymbol
+        }
+    }
+    network {
+        status
+        latestBlock {
+            height
+            timestamp
+        }
+        metrics {
+            activeAddresses
+            totalTransactions
+        }
+    }
+}
+"""
+
+_MARKET_QUERY = """
+query MarketAnalysis($addresses: [String!]!) {
+    accounts(addresses: $addresses) {
+        address
+        balance
+        transactions(first: 50) {
+            hash
+            amount
+            timestamp
+            destination
+            source
+        }
+    }
+    network {
+        status
+        metrics {
+            transactionRate
+            activeAddresses
+            totalTransactions
+        }
+        latestBlock {
+            height
+            timestamp
+        }
+    }
+}
+"""
+
+_ECOSYSTEM_QUERY = """
+query EcosystemOverview($metagraphIds: [String!]!) {
+    metagraphs(ids: $metagraphIds) {
+        id
+        name
+        tokenSymbol
+        totalSupply
+        holderCount
+        transactionCount
+        status
+        validators {
+            address
+            stake
+        }
+        recentTransactions: transactions(first: 20) {
+            hash
+            amount
+            timestamp
+            type
+        }
+    }
+    network {
+        status
+        metrics {
+            totalTransactions
+            activeAddresses
+            transactionRate
+        }
+    }
+}
+"""
 
 
 class PortfolioTracker:
     """Real-world portfolio tracking using GraphQL."""
 
-    def __init__(self, network: str = "testnet"):
+    def __init__(
+        self, network: str = "testnet", client: Optional["GraphQLClient"] = None
+    ):
         self.network = network
-        self.client = GraphQLClient(network)
+        self.client = client or _get_client(network)
         self.tracked_addresses = []
         self.portfolio_data = {}
+        self._cache = TTLCache(RESULT_CACHE_TTL, RESULT_CACHE_MAXSIZE)
 
     def add_address(self, address: str, label: str = None):
         """Add an address to track."""
@@ -77,107 +313,34 @@ class PortfolioTracker:
             }
         )
 
-    def get_comprehensive_portfolio(self) -> Dict[str, Any]:
-        """Get comprehensive portfolio data using GraphQL."""
+    async def get_comprehensive_portfolio(
+        self, force_refresh: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Get comprehensive portfolio data using GraphQL.
+
+        Results are reused for RESULT_CACHE_TTL seconds unless force_refresh
+        is set.
+        """
         if not self.tracked_addresses:
             return {"error": "No addresses to track"}
 
-        # Build comprehensive portfolio query
         addresses = [addr["address"] for addr in self.tracked_addresses]
-
-        portfolio_query = f"""
-        query ComprehensivePortfolio($addresses: [String!]!) {{
-            accounts(addresses: $addresses) {{
-                address
-                balance
-                transactions(first: 10) {{
-                    hash
-                    amount
-                    timestamp
-                    destination
-                    type
-                }}
-                metagraphBalances {{
-                    metagraphId
-                    balance
-                    tokenSymbol
-                }}
-            }}
-            network {{
-                status
-                latestBlock {{
-                    height
-                    timestamp
-                }}
-                metrics {{
-                    activeAddresses
-                    totalTransactions
-                }}
-            }}
-        }}
-        """
+        key = tuple(sorted(addresses))
+        if not force_refresh:
+            cached = _cache_lookup(self._cache, key)
+            if cached is not None:
+                self.portfolio_data = cached
+                return cached
 
         try:
-            response = self.client.execute(portfolio_query, {"addresses": addresses})
+            response = await _execute_chunked(self.client, _PORTFOLIO_QUERY, addresses)
 
             if response.is_successful:
-                # Process and enrich data
-                portfolio_data = {
-                    "timestamp": datetime.now().isoformat(),
-                    "total_accounts": len(addresses),
-                    "total_dag_balance": 0,
-                    "total_metagraph_tokens": 0,
-                    "accounts": [],
-                    "network_status": response.data.get("network", {}),
-                    "execution_time": response.execution_time,
-                }
-
-                for account_data in response.data.get("accounts", []):
-                    # Find label for this address
-                    label = next(
-                        (
-                            addr["label"]
-                            for addr in self.tracked_addresses
-                            if addr["address"] == account_data["address"]
-                        ),
-                        "Unknown",
-                    )
-
-                    # Calculate metrics
-                    balance = account_data.get("balance", 0)
-                    transactions = account_data.get("transactions", [])
-                    metagraph_balances = account_data.get("metagraphBalances", [])
-
-                    portfolio_data["total_dag_balance"] += balance
-                    portfolio_data["total_metagraph_tokens"] += len(metagraph_balances)
-
-                    # Recent activity analysis
-                    recent_transactions = [
-                        tx
-                        for tx in transactions
-                        if tx.get("timestamp", 0) > time.time() - 86400  # Last 24h
-                    ]
-
-                    account_info = {
-                        "address": account_data["address"],
-                        "label": label,
-                        "balance_dag": balance / 1e8,  # Convert to DAG
-                        "balance_raw": balance,
-                        "transaction_count": len(transactions),
-                        "recent_activity": len(recent_transactions),
-                        "metagraph_tokens": len(metagraph_balances),
-                        "metagraph_details": metagraph_balances,
-                        "latest_transactions": transactions[:5],
-                    }
-
-                    portfolio_data["accounts"].append(account_info)
-
-                # Convert totals
-                portfolio_data["total_dag_balance"] = (
-                    portfolio_data["total_dag_balance"] / 1e8
+                portfolio_data = self._process_portfolio_data(
+                    response.data, response.execution_time
                 )
-
-                self.portfolio_data = portfolio_data
+                self._cache.set(key, copy.deepcopy(portfolio_data))
                 return portfolio_data
 
             else:
@@ -186,16 +349,75 @@ class PortfolioTracker:
         except Exception as e:
             return {"error": f"Portfolio tracking failed: {e}"}
 
-    def get_portfolio_summary(self) -> str:
+    def _process_portfolio_data(
+        self, data: Dict[str, Any], execution_time: Optional[float]
+    ) -> Dict[str, Any]:
+        """Process portfolio query data into per-account metrics."""
+        # Process and enrich data
+        portfolio_data = {
+            "timestamp": datetime.now().isoformat(),
+            "total_accounts": len(self.tracked_addresses),
+            "total_dag_balance": 0,
+            "total_metagraph_tokens": 0,
+            "total_latest_tx_shown": 0,
+            "accounts": [],
+            "network_status": data.get("network", {}),
+            "execution_time": execution_time,
+        }
+
+        label_by_address = {
+            addr["address"]: addr["label"] for addr in self.tracked_addresses
+        }
+        recent_cutoff = time.time() - 86400  # Last 24h
+
+        for account_data in data.get("accounts", []):
+            label = label_by_address.get(account_data["address"], "Unknown")
+
+            # Calculate metrics
+            balance = account_data.get("balance", 0)
+            transactions = account_data.get("transactions", [])
+            metagraph_balances = account_data.get("metagraphBalances", [])
+
+            portfolio_data["total_dag_balance"] += balance
+            portfolio_data["total_metagraph_tokens"] += len(metagraph_balances)
+            latest_transactions = transactions[:5]
+            portfolio_data["total_latest_tx_shown"] += len(latest_transactions)
+
+            # Recent activity analysis
+            recent_activity = sum(
+                1 for tx in transactions if tx.get("timestamp", 0) > recent_cutoff
+            )
+
+            account_info = {
+                "address": account_data["address"],
+                "label": label,
+                "balance_dag": balance / DATOSHI_PER_DAG,
+                "balance_raw": balance,
+                "transaction_count": len(transactions),
+                "recent_activity": recent_activity,
+                "metagraph_tokens": len(metagraph_balances),
+                "metagraph_details": metagraph_balances,
+                "latest_transactions": latest_transactions,
+            }
+
+            portfolio_data["accounts"].append(account_info)
+
+        # Convert totals
+        portfolio_data["total_dag_balance"] /= DATOSHI_PER_DAG
+
+        self.portfolio_data = portfolio_data
+        return portfolio_data
+
+    async def get_portfolio_summary(self) -> str:
         """Get a formatted portfolio summary."""
         if not self.portfolio_data:
-            self.get_comprehensive_portfolio()
+            await self.get_comprehensive_portfolio()
 
         if "error" in self.portfolio_data:
             return f"❌ Portfolio Error: {self.portfolio_data['error']}"
 
         data = self.portfolio_data
-        summary = f"""
+        parts = [f"""
 📊 Portfolio Summary ({data['timestamp'][:19]})
 {'─' * 50}
 💰 Total DAG Balance: {data['total_dag_balance']:.8f} DAG
@@ -204,73 +426,52 @@ class PortfolioTracker:
 ⏱️  Query Time: {data['execution_time']:.3f}s
 
 📋 Account Details:
-"""
+"""]
 
         for account in data["accounts"]:
-            summary += f"""
+            parts.append(f"""
   🏷️  {account['label']} ({account['address'][:12]}...)
   💰 Balance: {account['balance_dag']:.8f} DAG
   📜 Transactions: {account['transaction_count']} total, {account['recent_activity']} recent
   🏛️  Metagraph Tokens: {account['metagraph_tokens']}
-"""
+""")
 
         network = data["network_status"]
-        summary += f"""
+        parts.append(f"""
 🌐 Network Status: {network.get('status', 'Unknown')}
 📊 Active Addresses: {network.get('metrics', {}).get('activeAddresses', 'N/A')}
-"""
+""")
 
-        return summary
+        return "".join(parts)
 
 
 class TradingBotAnalyzer:
     """Trading bot analysis using GraphQL for market intelligence."""
 
-    def __init__(self, network: str = "testnet"):
+    def __init__(
+        self, network: str = "testnet", client: Optional["GraphQLClient"] = None
+    ):
         self.network = network
-        self.client = GraphQLClient(network)
+        self.client = client or _get_client(network)
         self.analysis_results = {}
 
-    def analyze_market_activity(
-        self, addresses: List[str], timeframe_hours: int = 24
+    async def analyze_market_activity(
+        self, addresses: List[str], timeframe_hours: int = 24, signals_only=False
     ) -> Dict[str, Any]:
-        """Analyze market activity for trading insights."""
-
-        # Build market analysis query
-        market_query = f"""
-        query MarketAnalysis($addresses: [String!]!) {{
-            accounts(addresses: $addresses) {{
-                address
-                balance
-                transactions(first: 50) {{
-                    hash
-                    amount
-                    timestamp
-                    destination
-                    source
-                    type
-                }}
-            }}
-            network {{
-                status
-                metrics {{
-                    transactionRate
-                    activeAddresses
-                    totalTransactions
-                }}
-                latestBlock {{
-                    height
-                    timestamp
-                }}
-            }}
-        }}
         """
+        Analyze market activity for trading insights.
 
+        With signals_only set, only the market insights read by
+        get_trading_signals() are computed; account_analysis stays empty and
+        largest_transactions is not ranked.
+        """
         try:
-            response = self.client.execute(market_query, {"addresses": addresses})
+            response = await _execute_chunked(self.client, _MARKET_QUERY, addresses)
 
             if response.is_successful:
-                return self._process_market_data(response.data, timeframe_hours)
+                return self._process_market_data(
+                    response.data, timeframe_hours, signals_only
+                )
             else:
                 return {
                     "error": "Market analysis query failed",
@@ -281,7 +482,7 @@ class TradingBotAnalyzer:
             return {"error": f"Market analysis failed: {e}"}
 
     def _process_market_data(
-        self, data: Dict[str, Any], timeframe_hours: int
+        self, data: Dict[str, Any], timeframe_hours: int, signals_only=False
     ) -> Dict[str, Any]:
         """Process market data for trading insights."""
         cutoff_time = time.time() - (timeframe_hours * 3600)
@@ -302,69 +503,61 @@ class TradingBotAnalyzer:
             },
         }
 
-        all_transactions = []
-
-        for account_data in data.get("accounts", []):
-            address = account_data["address"]
-            balance = account_data.get("balance", 0)
-            transactions = account_data.get("transactions", [])
+        accounts = data.get("accounts", [])
+        metrics, all_transactions = _account_metrics(
+            accounts, cutoff_time, keep_transactions=not signals_only
+        )
 
-            # Filter transactions by timeframe
-            recent_transactions = [
-                tx for tx in transactions if tx.get("timestamp", 0) > cutoff_time
-            ]
+        total_volume = transaction_count = active_traders = 0
 
-            # Calculate account metrics
-            account_volume = sum(tx.get("amount", 0) for tx in recent_transactions)
-            incoming_txs = [
-                tx for tx in recent_transactions if tx.get("destination") == address
-            ]
-            outgoing_txs = [
-                tx for tx in recent_transactions if tx.get("source") == address
-            ]
+        for account_data, account_metrics in zip(accounts, metrics):
+            account_volume, recent_count, incoming_count, outgoing_count = (
+                account_metrics
+            )
+            total_volume += account_volume
+            transaction_count += recent_count
+            active_traders += recent_count > 5
+            if signals_only:
+                continue
 
             account_analysis = {
-                "address": address,
-                "balance": balance / 1e8,
-                "recent_transactions": len(recent_transactions),
-                "volume": account_volume / 1e8,
-                "incoming_count": len(incoming_txs),
-                "outgoing_count": len(outgoing_txs),
-                "trading_ratio": len(outgoing_txs) / max(len(incoming_txs), 1),
+                "address": account_data["address"],
+                "balance": account_data.get("balance", 0) / DATOSHI_PER_DAG,
+                "recent_transactions": recent_count,
+                "volume": account_volume / DATOSHI_PER_DAG,
+                "incoming_count": incoming_count,
+                "outgoing_count": outgoing_count,
+                "trading_ratio": outgoing_count / max(incoming_count, 1),
                 "avg_transaction_size": (
-                    (account_volume / len(recent_transactions)) / 1e8
-                    if recent_transactions
+                    account_volume / (recent_count * DATOSHI_PER_DAG)
+                    if recent_count
                     else 0
                 ),
-                "is_active_trader": len(recent_transactions) > 5,
+                "is_active_trader": recent_count > 5,
             }
 
             analysis["account_analysis"].append(account_analysis)
-            all_transactions.extend(recent_transactions)
 
         # Calculate market insights
-        if all_transactions:
-            total_volume = sum(tx.get("amount", 0) for tx in all_transactions)
-            analysis["market_insights"]["total_volume"] = total_volume / 1e8
-            analysis["market_insights"]["transaction_count"] = len(all_transactions)
-            analysis["market_insights"]["active_traders"] = sum(
-                1 for acc in analysis["account_analysis"] if acc["is_active_trader"]
+        if transaction_count:
+            analysis["market_insights"]["total_volume"] = total_volume / DATOSHI_PER_DAG
+            analysis["market_insights"]["transaction_count"] = transaction_count
+            analysis["market_insights"]["active_traders"] = active_traders
+            analysis["market_insights"]["avg_transaction_size"] = total_volume / (
+                transaction_count * DATOSHI_PER_DAG
             )
-            analysis["market_insights"]["avg_transaction_size"] = (
-                total_volume / len(all_transactions)
-            ) / 1e8
 
             # Find largest transactions
-            sorted_txs = sorted(
-                all_transactions, key=lambda x: x.get("amount", 0), reverse=True
+            largest_txs = heapq.nlargest(
+                10, all_transactions, key=lambda x: x.get("amount", 0)
             )
             analysis["market_insights"]["largest_transactions"] = [
                 {
                     "hash": tx["hash"],
-                    "amount": tx.get("amount", 0) / 1e8,
+                    "amount": tx.get("amount", 0) / DATOSHI_PER_DAG,
                     "timestamp": tx.get("timestamp", 0),
                 }
-                for tx in sorted_txs[:10]
+                for tx in largest_txs
             ]
 
         return analysis
@@ -419,53 +612,37 @@ class TradingBotAnalyzer:
 class DeFiAnalyticsDashboard:
     """DeFi analytics using GraphQL for ecosystem insights."""
 
-    def __init__(self, network: str = "testnet"):
+    def __init__(
+        self, network: str = "testnet", client: Optional["GraphQLClient"] = None
+    ):
         self.network = network
-        self.client = GraphQLClient(network)
+        self.client = client or _get_client(network)
+        self._cache = TTLCache(RESULT_CACHE_TTL, RESULT_CACHE_MAXSIZE)
 
-    def get_ecosystem_overview(self, metagraph_ids: List[str]) -> Dict[str, Any]:
-        """Get comprehensive DeFi ecosystem overview."""
+    async def get_ecosystem_overview(
+        self, metagraph_ids: List[str], force_refresh: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Get comprehensive DeFi ecosystem overview.
 
-        # Build ecosystem query
-        ecosystem_query = f"""
-        query EcosystemOverview($metagraphIds: [String!]!) {{
-            metagraphs(ids: $metagraphIds) {{
-                id
-                name
-                tokenSymbol
-                totalSupply
-                holderCount
-                transactionCount
-                status
-                validators {{
-                    address
-                    stake
-                }}
-                recentTransactions: transactions(first: 20) {{
-                    hash
-                    amount
-                    timestamp
-                    type
-                }}
-            }}
-            network {{
-                status
-                metrics {{
-                    totalTransactions
-                    activeAddresses
-                    transactionRate
-                }}
-            }}
-        }}
+        Results are reused for RESULT_CACHE_TTL seconds unless force_refresh
+        is set.
         """
+        key = tuple(sorted(metagraph_ids))
+        if not force_refresh:
+            cached = _cache_lookup(self._cache, key)
+            if cached is not None:
+                return cached
 
         try:
-            response = self.client.execute(
-                ecosystem_query, {"metagraphIds": metagraph_ids}
+            response = await self.client.execute_async(
+                _ECOSYSTEM_QUERY, {"metagraphIds": metagraph_ids}
             )
 
             if response.is_successful:
-                return self._process_ecosystem_data(response.data)
+                ecosystem = self._process_ecosystem_data(response.data)
+                self._cache.set(key, copy.deepcopy(ecosystem))
+                return ecosystem
             else:
                 return {"error": "Ecosystem query failed", "details": response.errors}
 
@@ -505,21 +682,6 @@ class DeFiAnalyticsDashboard:
             ecosystem["ecosystem_metrics"]["total_transactions"] += transaction_count
             ecosystem["ecosystem_metrics"]["total_validators"] += validator_count
 
-            # Track most active and largest
-            if not ecosystem["ecosystem_metrics"]["most_active_metagraph"]:
-                ecosystem["ecosystem_metrics"]["most_active_metagraph"] = mg
-            elif transaction_count > ecosystem["ecosystem_metrics"][
-                "most_active_metagraph"
-            ].get("transactionCount", 0):
-                ecosystem["ecosystem_metrics"]["most_active_metagraph"] = mg
-
-            if not ecosystem["ecosystem_metrics"]["largest_metagraph"]:
-                ecosystem["ecosystem_metrics"]["largest_metagraph"] = mg
-            elif total_supply > ecosystem["ecosystem_metrics"]["largest_metagraph"].get(
-                "totalSupply", 0
-            ):
-                ecosystem["ecosystem_metrics"]["largest_metagraph"] = mg
-
             # Process recent transactions
             recent_txs = mg.get("recentTransactions", [])
             recent_volume = sum(tx.get("amount", 0) for tx in recent_txs)
@@ -528,17 +690,28 @@ class DeFiAnalyticsDashboard:
                 "id": mg["id"],
                 "name": mg.get("name", "Unknown"),
                 "token_symbol": mg.get("tokenSymbol", "N/A"),
-                "total_supply": total_supply / 1e8,
+                "total_supply": total_supply / DATOSHI_PER_DAG,
                 "holder_count": holder_count,
                 "transaction_count": transaction_count,
                 "validator_count": validator_count,
-                "recent_volume": recent_volume / 1e8,
+                "recent_volume": recent_volume / DATOSHI_PER_DAG,
                 "recent_transaction_count": len(recent_txs),
                 "status": mg.get("status", "Unknown"),
             }
 
             ecosystem["metagraph_details"].append(mg_details)
 
+        # Convert totals
+        ecosystem["ecosystem_metrics"]["total_supply"] /= DATOSHI_PER_DAG
+
+        # Find most active and largest
+        ecosystem["ecosystem_metrics"]["most_active_metagraph"] = max(
+            metagraphs, key=lambda m: m.get("transactionCount", 0), default=None
+        )
+        ecosystem["ecosystem_metrics"]["largest_metagraph"] = max(
+            metagraphs, key=lambda m: m.get("totalSupply", 0), default=None
+        )
+
         # Calculate averages
         if metagraphs:
             ecosystem["ecosystem_metrics"]["avg_holder_ratio"] = ecosystem[
@@ -548,6 +721,141 @@ class DeFiAnalyticsDashboard:
         return ecosystem
 
 
+class BatchRunner:
+    """
+    Run the portfolio, market and ecosystem analyses from one GraphQL request.
+
+    The three queries are merged into a single document with aliased root
+    fields, and each aliased result is handed to the matching analyzer's
+    processing step.
+    """
+
+    BATCH_QUERY = """
+    query UseCaseBatch(
+        $portfolioAddresses: [String!]!
+        $marketAddresses: [String!]!
+        $metagraphIds: [String!]!
+    ) {
+        portfolio: accounts(addresses: $portfolioAddresses) {
+            address
+            balance
+            transactions(first: 10) {
+                hash
+                amount
+                timestamp
+                destination
+                type
+            }
+            metagraphBalances {
+                metagraphId
+                balance
+                tokenSymbol
+            }
+        }
+        market: accounts(addresses: $marketAddresses) {
+            address
+            balance
+            transactions(first: 50) {
+                hash
+                amount
+                timestamp
+                destination
+                source
+            }
+        }
+        ecosystem: metagraphs(ids: $metagraphIds) {
+            id
+            name
+            tokenSymbol
+            totalSupply
+            holderCount
+            transactionCount
+            status
+            validators {
+                address
+                stake
+            }
+            recentTransactions: transactions(first: 20) {
+                hash
+                amount
+                timestamp
+                type
+            }
+        }
+        network {
+            status
+            latestBlock {
+                height
+                timestamp
+            }
+            metrics {
+                activeAddresses
+                totalTransactions
+                transactionRate
+            }
+        }
+    }
+    """
+
+    def __init__(
+        self,
+        tracker: PortfolioTracker,
+        analyzer: TradingBotAnalyzer,
+        dashboard: DeFiAnalyticsDashboard,
+    ):
+        self.tracker = tracker
+        self.analyzer = analyzer
+        self.dashboard = dashboard
+        self.client = tracker.client
+
+    async def run(
+        self,
+        market_addresses: List[str],
+        metagraph_ids: List[str],
+        timeframe_hours: int = 24,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch and process all three analyses with one request.
+
+        Returns:
+            Dictionary with "portfolio", "market" and "ecosystem" results, each
+            shaped like the corresponding analyzer method's return value
+        """
+        variables = {
+            "portfolioAddresses": [
+                a["address"] for a in self.tracker.tracked_addresses
+            ],
+            "marketAddresses": market_addresses,
+            "metagraphIds": metagraph_ids,
+        }
+
+        try:
+            response = await self.client.execute_async(self.BATCH_QUERY, variables)
+        except Exception as e:
+            error = {"error": f"Batched analysis failed: {e}"}
+            return dict.fromkeys(("portfolio", "market", "ecosystem"), error)
+
+        if not response.is_successful:
+            error = {"error": "Batched query failed", "details": response.errors}
+            return dict.fromkeys(("portfolio", "market", "ecosystem"), error)
+
+        data = response.data
+        network = data.get("network", {})
+        return {
+            "portfolio": self.tracker._process_portfolio_data(
+                {"accounts": data.get("portfolio", []), "network": network},
+                response.execution_time,
+            ),
+            "market": self.analyzer._process_market_data(
+                {"accounts": data.get("market", []), "network": network},
+                timeframe_hours,
+            ),
+            "ecosystem": self.dashboard._process_ecosystem_data(
+                {"metagraphs": data.get("ecosystem", []), "network": network}
+            ),
+        }
+
+
 async def run_portfolio_tracking_demo():
     """Demonstrate real-world portfolio tracking."""
     print_header("Real-World Portfolio Tracking Demo")
@@ -566,13 +874,13 @@ async def run_portfolio_tracking_demo():
 
     for i, account in enumerate(test_accounts):
         tracker.add_address(account.address, f"Test_Wallet_{i+1}")
-        print(f"📍 Added {account.address[:12]}... as Test_Wallet_{i+1}")
+        emit(f"📍 Added {account.address[:12]}... as Test_Wallet_{i+1}")
 
     print_section("Fetching Comprehensive Portfolio Data")
 
     # Get portfolio data
     start_time = time.time()
-    portfolio_data = tracker.get_comprehensive_portfolio()
+    portfolio_data = await tracker.get_comprehensive_portfolio()
     execution_time = time.time() - start_time
 
     if "error" in portfolio_data:
@@ -583,27 +891,25 @@ async def run_portfolio_tracking_demo():
 
     # Display portfolio summary
     print_section("Portfolio Summary")
-    print(tracker.get_portfolio_summary())
+    emit(await tracker.get_portfolio_summary())
 
     # Demonstrate real-time monitoring setup
     print_section("Real-time Monitoring Setup")
-    print("🔄 In a real application, you would:")
-    print("   • Set up periodic portfolio updates")
-    print("   • Monitor balance changes")
-    print("   • Track new transactions")
-    print("   • Send alerts for significant changes")
-    print("   • Generate performance reports")
+    emit("🔄 In a real application, you would:")
+    emit("   • Set up periodic portfolio updates")
+    emit("   • Monitor balance changes")
+    emit("   • Track new transactions")
+    emit("   • Send alerts for significant changes")
+    emit("   • Generate performance reports")
 
     # Show GraphQL efficiency
     print_section("GraphQL Efficiency Benefits")
-    print("✅ Single query retrieved:")
-    print(f"   • {portfolio_data['total_accounts']} account balances")
-    print(
-        f"   • {sum(len(acc['latest_transactions']) for acc in portfolio_data['accounts'])} transactions"
-    )
-    print(f"   • {portfolio_data['total_metagraph_tokens']} metagraph token balances")
-    print(f"   • Network status and metrics")
-    print(f"   • All in {portfolio_data['execution_time']:.3f}s!")
+    emit("✅ Single query retrieved:")
+    emit(f"   • {portfolio_data['total_accounts']} account balances")
+    emit(f"   • {portfolio_data['total_latest_tx_shown']} transactions")
+    emit(f"   • {portfolio_data['total_metagraph_tokens']} metagraph token balances")
+    emit(f"   • Network status and metrics")
+    emit(f"   • All in {portfolio_data['execution_time']:.3f}s!")
 
 
 async def run_trading_bot_demo():
@@ -622,13 +928,15 @@ async def run_trading_bot_demo():
     # Generate test addresses for market analysis
     test_addresses = [Account().address for _ in range(5)]
 
-    print(f"📊 Analyzing market activity for {len(test_addresses)} addresses...")
+    emit(f"📊 Analyzing market activity for {len(test_addresses)} addresses...")
 
     print_section("Market Activity Analysis")
 
     # Analyze market activity
     start_time = time.time()
-    analysis = analyzer.analyze_market_activity(test_addresses, timeframe_hours=24)
+    analysis = await analyzer.analyze_market_activity(
+        test_addresses, timeframe_hours=24
+    )
     execution_time = time.time() - start_time
 
     if "error" in analysis:
@@ -641,21 +949,21 @@ async def run_trading_bot_demo():
     print_section("Market Insights")
     market = analysis["market_insights"]
 
-    print(f"📈 Total Volume (24h): {market['total_volume']:.2f} DAG")
-    print(f"🔄 Transaction Count: {market['transaction_count']}")
-    print(f"👥 Active Traders: {market['active_traders']}")
-    print(f"💰 Average Transaction Size: {market['avg_transaction_size']:.2f} DAG")
+    emit(f"📈 Total Volume (24h): {market['total_volume']:.2f} DAG")
+    emit(f"🔄 Transaction Count: {market['transaction_count']}")
+    emit(f"👥 Active Traders: {market['active_traders']}")
+    emit(f"💰 Average Transaction Size: {market['avg_transaction_size']:.2f} DAG")
 
     # Show account analysis
     print_section("Account Analysis")
     for acc in analysis["account_analysis"]:
-        print(f"📍 {acc['address'][:12]}...")
-        print(f"   💰 Balance: {acc['balance']:.2f} DAG")
-        print(f"   🔄 Recent Transactions: {acc['recent_transactions']}")
-        print(f"   📊 Volume: {acc['volume']:.2f} DAG")
-        print(f"   🔀 Trading Ratio: {acc['trading_ratio']:.2f}")
-        print(f"   🎯 Active Trader: {'Yes' if acc['is_active_trader'] else 'No'}")
-        print()
+        emit(f"📍 {acc['address'][:12]}...")
+        emit(f"   💰 Balance: {acc['balance']:.2f} DAG")
+        emit(f"   🔄 Recent Transactions: {acc['recent_transactions']}")
+        emit(f"   📊 Volume: {acc['volume']:.2f} DAG")
+        emit(f"   🔀 Trading Ratio: {acc['trading_ratio']:.2f}")
+        emit(f"   🎯 Active Trader: {'Yes' if acc['is_active_trader'] else 'No'}")
+        emit()
 
     # Generate trading signals
     print_section("Trading Signals")
@@ -664,13 +972,13 @@ async def run_trading_bot_demo():
     if signals:
         for signal in signals:
             icon = "🚨" if signal["type"] == "error" else "💡"
-            print(
+            emit(
                 f"{icon} {signal.get('signal', 'SIGNAL')}: {signal.get('message', 'No message')}"
             )
             if "confidence" in signal:
-                print(f"   Confidence: {signal['confidence']:.1%}")
+                emit(f"   Confidence: {signal['confidence']:.1%}")
     else:
-        print("📊 No significant trading signals detected in current market conditions")
+        emit("📊 No significant trading signals detected in current market conditions")
 
 
 async def run_defi_analytics_demo():
@@ -693,13 +1001,13 @@ async def run_defi_analytics_demo():
         "DAG9Nth8FKMcvfK6A8BGSKvJvBYe4EFKgPvvQPJqhRu",
     ]
 
-    print(f"🏛️ Analyzing DeFi ecosystem with {len(test_metagraph_ids)} metagraphs...")
+    emit(f"🏛️ Analyzing DeFi ecosystem with {len(test_metagraph_ids)} metagraphs...")
 
     print_section("Ecosystem Overview Analysis")
 
     # Get ecosystem overview
     start_time = time.time()
-    ecosystem = dashboard.get_ecosystem_overview(test_metagraph_ids)
+    ecosystem = await dashboard.get_ecosystem_overview(test_metagraph_ids)
     execution_time = time.time() - start_time
 
     if "error" in ecosystem:
@@ -712,35 +1020,65 @@ async def run_defi_analytics_demo():
     print_section("Ecosystem Metrics")
     metrics = ecosystem["ecosystem_metrics"]
 
-    print(f"🏛️ Total Metagraphs: {ecosystem['total_metagraphs']}")
-    print(f"💰 Total Supply: {metrics['total_supply']:.2f} tokens")
-    print(f"👥 Total Holders: {metrics['total_holders']}")
-    print(f"🔄 Total Transactions: {metrics['total_transactions']}")
-    print(f"🛡️ Total Validators: {metrics['total_validators']}")
-    print(f"📊 Avg Holders per Metagraph: {metrics['avg_holder_ratio']:.1f}")
+    emit(f"🏛️ Total Metagraphs: {ecosystem['total_metagraphs']}")
+    emit(f"💰 Total Supply: {metrics['total_supply']:.2f} tokens")
+    emit(f"👥 Total Holders: {metrics['total_holders']}")
+    emit(f"🔄 Total Transactions: {metrics['total_transactions']}")
+    emit(f"🛡️ Total Validators: {metrics['total_validators']}")
+    emit(f"📊 Avg Holders per Metagraph: {metrics['avg_holder_ratio']:.1f}")
 
     # Show individual metagraph details
     print_section("Metagraph Details")
     for mg in ecosystem["metagraph_details"]:
-        print(f"🏛️ {mg['name']} ({mg['token_symbol']})")
-        print(f"   ID: {mg['id'][:12]}...")
-        print(f"   💰 Supply: {mg['total_supply']:.2f} tokens")
-        print(f"   👥 Holders: {mg['holder_count']}")
-        print(f"   🔄 Transactions: {mg['transaction_count']}")
-        print(f"   🛡️ Validators: {mg['validator_count']}")
-        print(f"   📈 Recent Volume: {mg['recent_volume']:.2f} tokens")
-        print(f"   📊 Status: {mg['status']}")
-        print()
+        emit(f"🏛️ {mg['name']} ({mg['token_symbol']})")
+        emit(f"   ID: {mg['id'][:12]}...")
+        emit(f"   💰 Supply: {mg['total_supply']:.2f} tokens")
+        emit(f"   👥 Holders: {mg['holder_count']}")
+        emit(f"   🔄 Transactions: {mg['transaction_count']}")
+        emit(f"   🛡️ Validators: {mg['validator_count']}")
+        emit(f"   📈 Recent Volume: {mg['recent_volume']:.2f} tokens")
+        emit(f"   📊 Status: {mg['status']}")
+        emit()
 
     # Network status
     print_section("Network Status")
     network = ecosystem["network_status"]
-    print(f"🌐 Network Status: {network.get('status', 'Unknown')}")
+    emit(f"🌐 Network Status: {network.get('status', 'Unknown')}")
     if "metrics" in network:
         metrics = network["metrics"]
-        print(f"📊 Total Transactions: {metrics.get('totalTransactions', 'N/A')}")
-        print(f"👥 Active Addresses: {metrics.get('activeAddresses', 'N/A')}")
-        print(f"⚡ Transaction Rate: {metrics.get('transactionRate', 'N/A')}")
+        emit(f"📊 Total Transactions: {metrics.get('totalTransactions', 'N/A')}")
+        emit(f"👥 Active Addresses: {metrics.get('activeAddresses', 'N/A')}")
+        emit(f"⚡ Transaction Rate: {metrics.get('transactionRate', 'N/A')}")
+
+
+async def run_batched_use_cases_demo():
+    """Demonstrate running all three analyses in a single request."""
+    print_header("Batched Use Cases Demo")
+
+    if not GRAPHQL_AVAILABLE:
+        print_result(False, "GraphQL not available.")
+        return
+
+    tracker = PortfolioTracker("testnet")
+    for i, account in enumerate(Account() for _ in range(3)):
+        tracker.add_address(account.address, f"Test_Wallet_{i+1}")
+    runner = BatchRunner(
+        tracker, TradingBotAnalyzer("testnet"), DeFiAnalyticsDashboard("testnet")
+    )
+
+    start_time = time.time()
+    results = await runner.run(
+        [Account().address for _ in range(5)],
+        ["DAG7Ghth6FKMcvfK6A8BGSKvJvBYe4EFKgPvvQPJqhQs"],
+    )
+    execution_time = time.time() - start_time
+
+    print_result(True, f"Three analyses fetched in one request ({execution_time:.3f}s)")
+    for name, result in results.items():
+        if "error" in result:
+            print_result(False, f"{name}: {result['error']}")
+        else:
+            print_result(True, f"{name}: processed")
 
 
 async def run_comprehensive_demo():
@@ -757,14 +1095,32 @@ async def run_comprehensive_demo():
     print("🚀 Running comprehensive real-world use case demonstrations...")
 
     try:
-        # Run all demos
-        await run_portfolio_tracking_demo()
-        await run_trading_bot_demo()
-        await run_defi_analytics_demo()
+        # The demos are independent, so run them concurrently. Each one's
+        # output is buffered and printed in order afterwards so sections do
+        # not interleave; a failure in one is reported without cancelling
+        # the others
+        demos = (
+            run_portfolio_tracking_demo,
+            run_trading_bot_demo,
+            run_defi_analytics_demo,
+            run_batched_use_cases_demo,
+        )
+        results = await asyncio.gather(
+            *(_capture_output(demo) for demo in demos), return_exceptions=True
+        )
+        failures = []
+        for demo, result in zip(demos, results):
+            if isinstance(result, Exception):
+                failures.append((demo, result))
+            else:
+                print(result, end="")
 
         # Summary
         print_header("Demo Summary")
-        print("✅ All real-world use cases completed successfully!")
+        for demo, error in failures:
+            print_result(False, f"{demo.__name__} failed: {error}")
+        if not failures:
+            print("✅ All real-world use cases completed successfully!")
         print()
         print("🎯 Key Takeaways:")
         print("   • GraphQL enables complex, efficient data fetching")
@@ -793,6 +1149,8 @@ async def run_comprehensive_demo():
         import traceback
 
         traceback.print_exc()
+    finally:
+        await close_clients()
 
 
 def main():
@@ -6,23 +6,85 @@ This script demonstrates everything you can do with the metagraph functionality
 in the Constellation Python SDK.
 """
 
+import asyncio
+import sys
+from itertools import islice
+
 from constellation_sdk import (
     Account,
     MetagraphClient,
     Network,
+    TokenTxTemplate,
     Transactions,
-    discover_production_metagraphs,
     get_realistic_metagraph_summary,
 )
 
+NETWORKS = ["mainnet", "testnet", "integrationnet"]
+
+# Static demo payloads for the data transaction examples
+_SENSOR_PAYLOAD = {
+    "sensor_type": "temperature",
+    "value": 25.7,
+    "unit": "celsius",
+    "location": "warehouse_a",
+    "timestamp": "2024-01-15T10:30:00Z",
+    "device_id": "TEMP_001",
+}
+_SUPPLY_PAYLOAD = {
+    "product_id": "PROD_12345",
+    "batch_number": "B2024001",
+    "origin": "Factory_Shanghai",
+    "destination": "Warehouse_NYC",
+    "status": "in_transit",
+    "carrier": "GlobalShipping",
+    "tracking_number": "GS789456123",
+}
+_AUDIT_PAYLOAD = {
+    "transaction_id": "TXN_789",
+    "audit_type": "compliance_check",
+    "status": "verified",
+    "auditor": "AuditFirm_ABC",
+    "compliance_score": 95.5,
+    "risk_level": "low",
+}
+_APP_PAYLOAD = {
+    "app": "social_media_dapp",
+    "action": "post_content",
+    "user_id": "user_456",
+    "content_hash": "bafybeigdyrzt5sfp7udm7hu76uh7y26nf3efuylqabf3oclgtqy55fbzdi",
+    "likes": 0,
+    "shares": 0,
+}
+
+
+async def fetch_network_data(client):
+    """
+    Fetch the independent network lookups the demos report, concurrently.
+
+    Returns:
+        Tuple of the all-network summary, the MainNet production metagraphs
+        and a {network: summary} dict whose values are exceptions for
+        networks that could not be reached
+    """
+    loop = asyncio.get_running_loop()
+    summary, production_mgs, *network_summaries = await asyncio.gather(
+        loop.run_in_executor(None, get_realistic_metagraph_summary),
+        client.adiscover_production_metagraphs(),
+        *(MetagraphClient(network).aget_network_summary() for network in NETWORKS),
+        return_exceptions=True,
+    )
+    for result in (summary, production_mgs):
+        if isinstance(result, Exception):
+            raise result
+    return summary, production_mgs, dict(zip(NETWORKS, network_summaries))
+
 
-def demo_discovery_capabilities():
+def demo_discovery_capabilities(summary, production_mgs):
     """Demo: Discover and explore metagraphs"""
     print("🔍 1. DISCOVERY & EXPLORATION CAPABILITIES")
     print("=" * 45)
 
     # Realistic discovery across all networks
-    summary = get_realistic_metagraph_summary()
     print(f"✅ Real production metagraphs: {summary['production_total']}")
     print(f"✅ Total deployments (all): {summary['total_deployments']}")
 
@@ -34,288 +96,205 @@ def demo_discovery_capabilities():
 
     # Focus on production metagraphs
     print(f"\n🎯 Production Metagraphs on MainNet:")
-    production_mgs = discover_production_metagraphs("mainnet")
 
-    for i, mg in enumerate(production_mgs[:3]):  # Show first 3
+    for i, mg in enumerate(islice(production_mgs, 3)):  # Show first 3
         print(f"   {i+1}. {mg['id'][:30]}... (created: {mg['created'][:10]})")
 
     if len(production_mgs) > 3:
         print(f"   ... and {len(production_mgs) - 3} more")
 
-    return production_mgs
-
 
-def demo_metagraph_info():
+def demo_metagraph_info(client, metagraphs):
     """Demo: Get detailed metagraph information"""
     print(f"\n💡 2. METAGRAPH INFORMATION & ANALYSIS")
     print("=" * 45)
 
-    client = MetagraphClient("mainnet")
-
-    # Get all production metagraphs
-    metagraphs = client.discover_production_metagraphs()
+    if not metagraphs:
+        print("   ℹ️  No production metagraphs found")
+        return None
 
-    if metagraphs:
-        # Analyze first metagraph
-        mg = metagraphs[0]
-        mg_id = mg["id"]
+    # Analyze first metagraph
+    mg = metagraphs[0]
+    mg_id = mg["id"]
 
-        print(f"🔬 Analyzing: {mg_id[:30]}...")
+    print(f"🔬 Analyzing: {mg_id[:30]}...")
 
-        # Get detailed info
-        info = client.get_metagraph_info(mg_id)
-        print(f"   💰 Balance: {info['balance']} DAG")
-        print(f"   📊 Transactions: {info['transaction_count']}")
-        print(f"   ⚡ Is Active: {info['is_active']}")
-        print(f"   🌐 Network: {info['network']}")
+    # Get detailed info
+    info = client.get_metagraph_info(mg_id)
+    print(f"   💰 Balance: {info['balance']} DAG")
+    print(f"   📊 Transactions: {info['transaction_count']}")
+    print(f"   ⚡ Is Active: {info['is_active']}")
+    print(f"   🌐 Network: {info['network']}")
 
-        # Check activity across all metagraphs
-        print(f"\n📈 Activity Analysis:")
-        active_mgs = client.get_active_metagraphs()
-        print(f"   Active metagraphs: {len(active_mgs)}/{len(metagraphs)}")
+    # Check activity across all metagraphs in one bulk lookup
+    print(f"\n📈 Activity Analysis:")
+    infos = client.get_metagraphs_bulk_info([m["id"] for m in metagraphs])
+    active_count = sum(1 for i in infos.values() if i["is_active"])
+    print(f"   Active metagraphs: {active_count}/{len(metagraphs)}")
 
-        return mg_id
-    else:
-        print("   ℹ️  No production metagraphs found")
-        return None
+    return mg_id
 
 
-def demo_token_transactions():
+def demo_token_transactions(production_mgs, sender, recipient):
     """Demo: Create custom token transactions"""
     print(f"\n🪙  3. CUSTOM TOKEN TRANSACTIONS")
     print("=" * 35)
 
-    # Create accounts
-    sender = Account()
-    recipient = Account()
-
     print(f"👤 Sender: {sender.address[:30]}...")
     print(f"👤 Recipient: {recipient.address[:30]}...")
 
-    # Create metagraph client
-    client = MetagraphClient("mainnet")
+    if not production_mgs:
+        print("   ℹ️  No production metagraphs available for demo")
+        return None
 
-    # Get a production metagraph to work with
-    production_mgs = client.discover_production_metagraphs()
+    metagraph_id = production_mgs[0]["id"]
 
-    if production_mgs:
-        metagraph_id = production_mgs[0]["id"]
+    # Create different types of token transactions
+    print(f"\n💸 Creating token transactions for: {metagraph_id[:25]}...")
 
-        # Create different types of token transactions
-        print(f"\n💸 Creating token transactions for: {metagraph_id[:25]}...")
+    # Transfers share the sender and metagraph; validate those once
+    template = TokenTxTemplate(sender.address, metagraph_id)
+    # 10 tokens (assuming 8 decimals)
+    token_tx = template.build(recipient.address, 1000000000)
+    micro_tx = template.build(recipient.address, 1000000)  # 0.01 tokens
+    large_tx = template.build(recipient.address, 100000000000)  # 1000 tokens
 
-        # Standard token transfer
-        token_tx = Transactions.create_token_transfer(
-            source=sender.address,
-            destination=recipient.address,
-            amount=1000000000,  # 10 tokens (assuming 8 decimals)
-            metagraph_id=metagraph_id,
-            fee=0,
-        )
-        # Sign the transaction
-        signed_token_tx = sender.sign_metagraph_transaction(token_tx)
+    # Sign all three transactions in one batch
+    signed_token_tx, signed_micro_tx, signed_large_tx = sender.sign_many(
+        [token_tx, micro_tx, large_tx]
+    )
 
-        print(f"✅ Standard transfer: 10 tokens")
-        print(f"   Transaction keys: {list(signed_token_tx.keys())}")
-        print(f"   Value keys: {list(signed_token_tx['value'].keys())}")
-        print(
-            f"   Signature length: {len(signed_token_tx['proofs'][0]['signature'])} chars"
-        )
+    print(f"✅ Standard transfer: 10 tokens")
+    print(f"   Transaction keys: {list(signed_token_tx.keys())}")
+    print(f"   Value keys: {list(signed_token_tx['value'].keys())}")
+    print(
+        f"   Signature length: {len(signed_token_tx['proofs'][0]['signature'])} chars"
+    )
+    print(f"✅ Micro-transaction: 0.01 tokens")
+    print(f"✅ Large transfer: 1000 tokens")
 
-        # Micro-transaction (fractional tokens)
-        micro_tx = Transactions.create_token_transfer(
-            source=sender.address,
-            destination=recipient.address,
-            amount=1000000,  # 0.01 tokens
-            metagraph_id=metagraph_id,
-        )
-        signed_micro_tx = sender.sign_metagraph_transaction(micro_tx)
+    return signed_token_tx
 
-        print(f"✅ Micro-transaction: 0.01 tokens")
 
-        # Large transaction
-        large_tx = Transactions.create_token_transfer(
-            source=sender.address,
-            destination=recipient.address,
-            amount=100000000000,  # 1000 tokens
-            metagraph_id=metagraph_id,
-        )
-        signed_large_tx = sender.sign_metagraph_transaction(large_tx)
+def demo_data_transactions(production_mgs, data_account):
+    """Demo: Submit custom data to metagraphs"""
+    print(f"\n📦 4. DATA TRANSACTIONS & CUSTOM PAYLOADS")
+    print("=" * 45)
 
-        print(f"✅ Large transfer: 1000 tokens")
+    print(f"📡 Data submitter: {data_account.address[:30]}...")
 
-        return signed_token_tx
-    else:
+    if not production_mgs:
         print("   ℹ️  No production metagraphs available for demo")
         return None
 
+    metagraph_id = production_mgs[0]["id"]
 
-def demo_data_transactions():
-    """Demo: Submit custom data to metagraphs"""
-    print(f"\n📦 4. DATA TRANSACTIONS & CUSTOM PAYLOADS")
-    print("=" * 45)
+    print(f"\n📤 Submitting data to: {metagraph_id[:25]}...")
 
-    # Create account for data submission
-    data_account = Account()
-    print(f"📡 Data submitter: {data_account.address[:30]}...")
+    # IoT sensor data
+    sensor_tx = Transactions.create_data_submission(
+        source=data_account.address,
+        data=_SENSOR_PAYLOAD,
+        metagraph_id=metagraph_id,
+    )
+    signed_sensor_tx = data_account.sign_metagraph_transaction(sensor_tx)
 
-    client = MetagraphClient("mainnet")
-    production_mgs = client.discover_production_metagraphs()
-
-    if production_mgs:
-        metagraph_id = production_mgs[0]["id"]
-
-        print(f"\n📤 Submitting data to: {metagraph_id[:25]}...")
-
-        # IoT sensor data
-        sensor_tx = Transactions.create_data_submission(
-            source=data_account.address,
-            data={
-                "sensor_type": "temperature",
-                "value": 25.7,
-                "unit": "celsius",
-                "location": "warehouse_a",
-                "timestamp": "2024-01-15T10:30:00Z",
-                "device_id": "TEMP_001",
-            },
-            metagraph_id=metagraph_id,
-        )
-        signed_sensor_tx = data_account.sign_metagraph_transaction(sensor_tx)
-
-        print(f"✅ IoT sensor data submitted")
-        print(f"   Data keys: {list(signed_sensor_tx['value']['data'].keys())}")
-
-        # Supply chain tracking
-        supply_tx = Transactions.create_data_submission(
-            source=data_account.address,
-            data={
-                "product_id": "PROD_12345",
-                "batch_number": "B2024001",
-                "origin": "Factory_Shanghai",
-                "destination": "Warehouse_NYC",
-                "status": "in_transit",
-                "carrier": "GlobalShipping",
-                "tracking_number": "GS789456123",
-            },
-            metagraph_id=metagraph_id,
-        )
-        signed_supply_tx = data_account.sign_metagraph_transaction(supply_tx)
-
-        print(f"✅ Supply chain data submitted")
-
-        # Financial/audit data
-        audit_tx = Transactions.create_data_submission(
-            source=data_account.address,
-            data={
-                "transaction_id": "TXN_789",
-                "audit_type": "compliance_check",
-                "status": "verified",
-                "auditor": "AuditFirm_ABC",
-                "compliance_score": 95.5,
-                "risk_level": "low",
-            },
-            metagraph_id=metagraph_id,
-        )
-        signed_audit_tx = data_account.sign_metagraph_transaction(audit_tx)
-
-        print(f"✅ Audit/compliance data submitted")
-
-        # Custom application data
-        app_tx = Transactions.create_data_submission(
-            source=data_account.address,
-            data={
-                "app": "social_media_dapp",
-                "action": "post_content",
-                "user_id": "user_456",
-                "content_hash": "bafybeigdyrzt5sfp7udm7hu76uh7y26nf3efuylqabf3oclgtqy55fbzdi",
-                "likes": 0,
-                "shares": 0,
-            },
-            metagraph_id=metagraph_id,
-        )
-        signed_app_tx = data_account.sign_metagraph_transaction(app_tx)
+    print(f"✅ IoT sensor data submitted")
+    print(f"   Data keys: {list(signed_sensor_tx['value']['data'].keys())}")
 
-        print(f"✅ Social media DApp data submitted")
+    # Supply chain tracking
+    supply_tx = Transactions.create_data_submission(
+        source=data_account.address,
+        data=_SUPPLY_PAYLOAD,
+        metagraph_id=metagraph_id,
+    )
+    signed_supply_tx = data_account.sign_metagraph_transaction(supply_tx)
 
-        return signed_sensor_tx, signed_supply_tx, signed_audit_tx, signed_app_tx
-    else:
-        print("   ℹ️  No production metagraphs available for demo")
-        return None
+    print(f"✅ Supply chain data submitted")
 
+    # Financial/audit data
+    audit_tx = Transactions.create_data_submission(
+        source=data_account.address,
+        data=_AUDIT_PAYLOAD,
+        metagraph_id=metagraph_id,
+    )
+    signed_audit_tx = data_account.sign_metagraph_transaction(audit_tx)
+
+    print(f"✅ Audit/compliance data submitted")
+
+    # Custom application data
+    app_tx = Transactions.create_data_submission(
+        source=data_account.address,
+        data=_APP_PAYLOAD,
+        metagraph_id=metagraph_id,
+    )
+    signed_app_tx = data_account.sign_metagraph_transaction(app_tx)
 
-def demo_balance_queries():
+    print(f"✅ Social media DApp data submitted")
+
+    return signed_sensor_tx, signed_supply_tx, signed_audit_tx, signed_app_tx
+
+
+def demo_balance_queries(client, production_mgs, network_summary, account1, account2):
     """Demo: Query balances and metagraph states"""
     print(f"\n💰 5. BALANCE QUERIES & STATE MANAGEMENT")
     print("=" * 45)
 
-    # Create test accounts
-    account1 = Account()
-    account2 = Account()
-
-    client = MetagraphClient("mainnet")
-    production_mgs = client.discover_production_metagraphs()
+    if not production_mgs:
+        print("   ℹ️  No production metagraphs available for demo")
+        return
 
-    if production_mgs:
-        metagraph_id = production_mgs[0]["id"]
+    metagraph_id = production_mgs[0]["id"]
 
-        print(f"💳 Checking balances on: {metagraph_id[:25]}...")
+    print(f"💳 Checking balances on: {metagraph_id[:25]}...")
 
-        # Check DAG balances (standard)
-        dag_balance1 = client.get_balance(metagraph_id, account1.address)
-        dag_balance2 = client.get_balance(metagraph_id, account2.address)
+    # Check token balances for both accounts in one call
+    balances = client.get_balances(metagraph_id, [account1.address, account2.address])
 
-        print(f"   Account 1 balance: {dag_balance1} DAG")
-        print(f"   Account 2 balance: {dag_balance2} DAG")
+    print(f"   Account 1 balance: {balances[account1.address]} DAG")
+    print(f"   Account 2 balance: {balances[account2.address]} DAG")
 
-        # Get metagraph state
-        mg_info = client.get_metagraph_info(metagraph_id)
-        print(f"   Metagraph balance: {mg_info['balance']} DAG")
-        print(f"   Transaction count: {mg_info['transaction_count']}")
+    # Get metagraph state
+    mg_info = client.get_metagraph_info(metagraph_id)
+    print(f"   Metagraph balance: {mg_info['balance']} DAG")
+    print(f"   Transaction count: {mg_info['transaction_count']}")
 
-        # Network summary
-        network_summary = client.get_network_summary()
-        print(f"\n📊 Network Summary:")
+    # Network summary
+    print(f"\n📊 Network Summary:")
+    if isinstance(network_summary, Exception):
+        print(f"   Unavailable: {network_summary}")
+    else:
         print(f"   Network: {network_summary['network']}")
         print(f"   Production metagraphs: {network_summary['production_count']}")
         print(f"   Test deployments: {network_summary['test_deployments']}")
 
-    else:
-        print("   ℹ️  No production metagraphs available for demo")
-
 
-def demo_advanced_features():
+def demo_advanced_features(network_summaries):
     """Demo: Advanced SDK features"""
     print(f"\n⚡ 6. ADVANCED FEATURES & USE CASES")
     print("=" * 40)
 
     print("🎯 Smart Filtering:")
 
-    # Compare production vs all deployments
+    # Compare production vs all deployments from a single discovery
     client = MetagraphClient("testnet")
-
-    production_only = client.discover_production_metagraphs()
-    all_deployments = client.discover_metagraphs(include_test_deployments=True)
+    production_only, test_deployments = client.partition_deployments()
 
     print(f"   TestNet production: {len(production_only)}")
-    print(f"   TestNet all deployments: {len(all_deployments)}")
-    print(
-        f"   Filtered out: {len(all_deployments) - len(production_only)} test deployments"
-    )
+    print(f"   TestNet all deployments: {len(production_only) + len(test_deployments)}")
+    print(f"   Filtered out: {len(test_deployments)} test deployments")
 
     print(f"\n🔄 Multi-Network Operations:")
 
-    # Work across different networks
-    networks = ["mainnet", "testnet", "integrationnet"]
-    for network in networks:
-        try:
-            net_client = MetagraphClient(network)
-            summary = net_client.get_network_summary()
+    # Work across different networks (summaries fetched concurrently up front)
+    for network, summary in network_summaries.items():
+        if isinstance(summary, Exception):
+            print(f"   {network}: unavailable")
+        else:
             print(
                 f"   {network}: {summary['production_count']} production, "
                 f"{summary['test_deployments']} test"
             )
-        except:
-            print(f"   {network}: unavailable")
 
     print(f"\n🏗️  SDK Integration Examples:")
     integration_examples = [
@@ -333,18 +312,47 @@ def demo_advanced_features():
 
 def main():
     """Run complete metagraph capabilities demo"""
+    # The demo prints ~80 lines; block-buffer stdout instead of writing each
+    # line separately and flush once at the end
+    if hasattr(sys.stdout, "reconfigure"):
+        sys.stdout.reconfigure(line_buffering=False, write_through=False)
+
     print("🏛️  CONSTELLATION METAGRAPH PYTHON SDK")
     print("🚀 COMPLETE CAPABILITIES DEMONSTRATION")
     print("=" * 60)
 
     try:
-        # Run all demos
-        production_mgs = demo_discovery_capabilities()
-        metagraph_id = demo_metagraph_info()
-        token_tx = demo_token_transactions()
-        data_txs = demo_data_transactions()
-        demo_balance_queries()
-        demo_advanced_features()
+        # Run the independent discovery lookups concurrently, then share the
+        # client and results across the demos instead of re-querying in each
+        client = MetagraphClient("mainnet")
+        summary, production_mgs, network_summaries = asyncio.run(
+            fetch_network_data(client)
+        )
+
+        demo_discovery_capabilities(summary, production_mgs)
+
+        # Sections 2-5 all work on a MainNet production metagraph; when
+        # discovery found none, skip them (and their keypair generation)
+        if production_mgs:
+            # Generate every demo keypair once and hand them to the demos
+            sender, recipient, data_account, account1, account2 = [
+                Account() for _ in range(5)
+            ]
+
+            demo_metagraph_info(client, production_mgs)
+            demo_token_transactions(production_mgs, sender, recipient)
+            demo_data_transactions(production_mgs, data_account)
+            demo_balance_queries(
+                client,
+                production_mgs,
+                network_summaries["mainnet"],
+                account1,
+                account2,
+            )
+        else:
+            print("\nℹ️  No production metagraphs on MainNet; skipping sections 2-5")
+
+        demo_advanced_features(network_summaries)
 
         print(f"\n🎉 CAPABILITIES SUMMARY")
         print("=" * 25)
@@ -375,7 +383,10 @@ def main():
         print(f"\n❌ Demo error: {e}")
         import traceback
 
+        sys.stdout.flush()
         traceback.print_exc()
+    finally:
+        sys.stdout.flush()
 
 
 if __name__ == "__main__":
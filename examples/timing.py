@@ -0,0 +1,26 @@
+"""
+Timing helper shared by the example scripts.
+"""
+
+import time
+
+
+class Timer:
+    """
+    Context manager measuring elapsed time with a monotonic clock.
+
+    Example:
+        >>> with Timer() as t:
+        ...     response = network.batch_request(operations)
+        >>> print(f"completed in {t.s:.3f}s")
+    """
+
+    def __enter__(self):
+        self.ns = 0
+        self.s = 0.0
+        self.t0 = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.ns = time.perf_counter_ns() - self.t0
+        self.s = self.ns / 1e9
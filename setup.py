@@ -36,6 +36,12 @@ setup(
     ],
     python_requires=">=3.8",
     install_requires=requirements,
+    extras_require={
+        # Faster JSON decoding of API responses and transaction encoding
+        "orjson": ["orjson>=3.6.0"],
+        # Streaming parse of the combined global snapshot
+        "ijson": ["ijson>=3.1.0"],
+    },
     entry_points={
         "console_scripts": [
             "constellation=constellation_sdk.cli:main",
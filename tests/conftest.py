@@ -213,17 +213,17 @@ def mock_network(test_network_config, mock_network_responses):
 
 @pytest.fixture
 def mock_metagraph_client(mock_metagraph_responses):
-    """Mock MetagraphClient with patched requests."""
-    with patch("constellation_sdk.metagraph.requests") as mock_requests:
+    """Mock MetagraphClient with patched session requests."""
+    with patch("constellation_sdk.metagraph.requests.Session.get") as mock_get:
         client = MetagraphClient("testnet")
 
         # Configure mock responses
         mock_response = Mock()
         mock_response.status_code = 200
         mock_response.json.return_value = mock_metagraph_responses["currency_response"]
-        mock_requests.get.return_value = mock_response
+        mock_get.return_value = mock_response
 
-        yield client, mock_requests
+        yield client, mock_get
 
 
 # =====================
@@ -3,10 +3,18 @@ Comprehensive unit tests for Account functionality.
 """
 
 import hashlib
+import json
+from datetime import datetime
+from unittest.mock import MagicMock, patch
 
 import pytest
 
-from constellation_sdk.account import Account, ConstellationError
+from constellation_sdk.account import (
+    Account,
+    ConstellationError,
+    _canonical_json,
+    verify_transactions,
+)
 
 
 @pytest.mark.unit
@@ -84,6 +92,13 @@ class TestAccountProperties:
         assert len(private_key) == 64
         assert all(c in "0123456789ABCDEFabcdef" for c in private_key)
 
+    def test_redacted_key(self, known_account):
+        """Test redacted key keeps only 4 hex characters at each end."""
+        private_key = known_account.private_key_hex
+        redacted = known_account.redacted_key()
+        assert redacted == f"{private_key[:4]}...{private_key[-4:]}"
+        assert len(redacted) == 11
+
     def test_public_key_hex_property(self, known_account):
         """Test public key hex property."""
         public_key = known_account.public_key_hex
@@ -104,6 +119,19 @@ class TestAccountProperties:
         assert len(account1.address) == 38
         assert account1.address.startswith("DAG")
 
+    def test_address_derived_lazily(self, known_private_key):
+        """Test address and public key are derived on first access, then reused."""
+        account = Account(known_private_key)
+        assert account._address is None
+
+        address = account.address
+        assert account._address == address
+        assert account.address is address
+
+        assert account._public_key_hex is None
+        public_key = account.public_key_hex
+        assert account.public_key_hex is public_key
+
 
 @pytest.mark.unit
 class TestMessageSigning:
@@ -239,6 +267,26 @@ class TestTransactionSigning:
             == valid_data_submission_data["metagraph_id"]
         )
 
+    def test_sign_many(
+        self,
+        alice_account,
+        valid_token_transfer_data,
+        valid_data_submission_data,
+        signature_validator,
+    ):
+        """Test batch signing matches signing each metagraph transaction."""
+        transactions = [valid_token_transfer_data, valid_data_submission_data]
+        signed = alice_account.sign_many(transactions)
+
+        assert len(signed) == 2
+        assert all(signature_validator(tx) for tx in signed)
+        assert all(verify_transactions(signed))
+        for signed_tx, transaction in zip(signed, transactions):
+            single = alice_account.sign_metagraph_transaction(transaction)
+            assert signed_tx["proofs"][0]["id"] == single["proofs"][0]["id"]
+            assert signed_tx["value"]["metagraph_id"] == transaction["metagraph_id"]
+        assert alice_account.sign_many([]) == []
+
     def test_signature_determinism(self, known_account, valid_dag_transaction_data):
         """Test that transaction signing produces valid signatures."""
         # Same transaction should produce valid signatures
@@ -276,6 +324,61 @@ class TestTransactionSigning:
             != bob_signed["proofs"][0]["signature"]
         )
 
+    def test_verify_transactions(
+        self, alice_account, bob_account, valid_dag_transaction_data
+    ):
+        """Test bulk verification of signed transactions."""
+        alice_signed = alice_account.sign_transaction(valid_dag_transaction_data)
+        bob_signed = bob_account.sign_transaction(valid_dag_transaction_data)
+
+        tampered = {
+            "value": {**alice_signed["value"], "amount": 1},
+            "proofs": alice_signed["proofs"],
+        }
+        unsigned = {"value": alice_signed["value"], "proofs": []}
+
+        assert verify_transactions(
+            [alice_signed, bob_signed, tampered, unsigned, {}]
+        ) == [True, True, False, False, False]
+
+    def test_canonical_json_matches_stdlib(self):
+        """Test signed bytes are the compact, key-sorted stdlib encoding."""
+        values = [
+            {"source": "DAG1", "amount": 100, "fee": 0, "salt": 2**63},
+            {"data": {"city": "Zürich", "temp": 23.5}, "metagraph_id": "DAG2"},
+            {"data": {"tiny": 1e-7, "large": 1e16, "readings": [0.1, 2.5e-8]}},
+            {"data": {"nan": float("nan"), "inf": float("inf")}},
+            {"data": {"ninf": float("-inf")}},
+        ]
+        for value in values:
+            expected = json.dumps(value, sort_keys=True, separators=(",", ":"))
+            assert _canonical_json(value) == expected.encode("utf-8")
+
+    def test_canonical_json_skips_orjson_for_floats(self):
+        """Test float values never take the orjson path."""
+        fake_orjson = MagicMock()
+        fake_orjson.dumps.return_value = b'{"amount":1}'
+        with patch("constellation_sdk.account.ORJSON_AVAILABLE", True), patch(
+            "constellation_sdk.account.orjson", fake_orjson, create=True
+        ):
+            assert _canonical_json({"amount": 1}) == b'{"amount":1}'
+            assert _canonical_json({"data": [{"temp": 1e-7}]}) == (
+                b'{"data":[{"temp":1e-07}]}'
+            )
+        fake_orjson.dumps.assert_called_once()
+
+    @pytest.mark.parametrize("orjson_available", [True, False])
+    def test_canonical_json_rejects_non_json_types(self, orjson_available):
+        """Test a datetime payload is rejected whether or not orjson is present."""
+        fake_orjson = MagicMock()
+        fake_orjson.dumps.return_value = b'{"ts":"2026-01-01T00:00:00"}'
+        with patch(
+            "constellation_sdk.account.ORJSON_AVAILABLE", orjson_available
+        ), patch("constellation_sdk.account.orjson", fake_orjson, create=True):
+            with pytest.raises(TypeError):
+                _canonical_json({"data": {"ts": datetime(2026, 1, 1)}})
+        fake_orjson.dumps.assert_not_called()
+
 
 @pytest.mark.unit
 class TestAccountEdgeCases:
@@ -6,6 +6,7 @@ with proper async/await patterns and mocking.
 """
 
 import asyncio
+import json
 import time
 from typing import Any, Dict
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -17,6 +18,7 @@ try:
     from constellation_sdk.async_network import (
         AsyncHTTPClient,
         AsyncNetwork,
+        _json_loads,
         create_async_network,
         get_multiple_balances_concurrent,
     )
@@ -408,6 +410,29 @@ class TestAsyncNetwork:
         assert len(network._cache_times) == 0
 
 
+class TestAsyncJsonDecoding:
+    """Test response decoding with and without orjson."""
+
+    def test_json_loads_uses_orjson(self):
+        """Test orjson decodes response bodies when it is installed."""
+        fake_orjson = MagicMock()
+        fake_orjson.loads.return_value = {"data": {"balance": 1}}
+
+        with patch("constellation_sdk.async_network.ORJSON_AVAILABLE", True), patch(
+            "constellation_sdk.async_network.orjson", fake_orjson, create=True
+        ):
+            assert _json_loads('{"data": {"balance": 1}}') == {"data": {"balance": 1}}
+
+        fake_orjson.loads.assert_called_once_with('{"data": {"balance": 1}}')
+
+    def test_json_loads_without_orjson(self):
+        """Test the json module decodes response bodies without orjson."""
+        with patch("constellation_sdk.async_network.ORJSON_AVAILABLE", False):
+            assert _json_loads('{"data": {"balance": 1}}') == {"data": {"balance": 1}}
+            with pytest.raises(json.JSONDecodeError):
+                _json_loads('{"data": ')
+
+
 @pytest.mark.asyncio
 class TestAsyncNetworkUtilities:
     """Test async network utility functions."""
@@ -2,6 +2,7 @@
 Tests for batch operations functionality.
 """
 
+import asyncio
 import time
 from unittest.mock import MagicMock, Mock, patch
 
@@ -47,6 +48,17 @@ class TestBatchOperation:
         assert operation.params == {"address": "DAG123..."}
         assert operation.id is None
 
+    def test_build_many(self):
+        """Test bulk construction of same-type operations."""
+        params = [{"address": "DAG123..."}, {"address": "DAG456..."}]
+        operations = BatchOperation.build_many(
+            BatchOperationType.GET_ORDINAL, params, "ord"
+        )
+
+        assert [op.id for op in operations] == ["ord_0", "ord_1"]
+        assert [op.params for op in operations] == params
+        assert all(op.operation == BatchOperationType.GET_ORDINAL for op in operations)
+
 
 class TestBatchResult:
     """Test BatchResult class."""
@@ -65,6 +77,13 @@ class TestBatchResult:
         assert result.data == 1000000000
         assert result.error is None
         assert result.id == "test_op"
+        assert result.to_dict() == {
+            "id": "test_op",
+            "operation": "get_balance",
+            "success": True,
+            "data": 1000000000,
+            "error": None,
+        }
 
     def test_batch_result_failure(self):
         """Test failed BatchResult."""
@@ -105,6 +124,9 @@ class TestBatchResponse:
         assert len(successful) == 2
         assert all(r.success for r in successful)
 
+        # Test iter_successful
+        assert [r.id for r in response.iter_successful()] == ["op1", "op3"]
+
         # Test get_failed_results
         failed = response.get_failed_results()
         assert len(failed) == 1
@@ -115,6 +137,21 @@ class TestBatchResponse:
             abs(response.success_rate() - 66.67) < 0.1
         )  # 66.67% (allowing for floating point precision)
 
+    def test_results_by_prefix(self):
+        """Test grouping results by ID prefix."""
+        results = [
+            BatchResult(BatchOperationType.GET_BALANCE, True, 1, id="balance_0"),
+            BatchResult(BatchOperationType.GET_ORDINAL, True, 2, id="ordinal_0"),
+            BatchResult(BatchOperationType.GET_BALANCE, True, 3, id="balance_1"),
+            BatchResult(BatchOperationType.GET_NODE_INFO, True, {}, id=None),
+        ]
+
+        response = BatchResponse(results=results)
+
+        assert [r.data for r in response.results_by_prefix("balance")] == [1, 3]
+        assert [r.data for r in response.results_by_prefix("balance_")] == [1, 3]
+        assert list(response.results_by_prefix("transactions")) == []
+
     def test_batch_response_empty(self):
         """Test BatchResponse with empty results."""
         response = BatchResponse(results=[])
@@ -323,6 +360,20 @@ class TestNetworkBatchOperations:
         assert ordinal_result.success is True
         assert ordinal_result.data == 5
 
+    def test_batch_request_concurrent(self):
+        """Test concurrent batch execution keeps results in operation order."""
+        operations = [
+            create_batch_operation("get_balance", {"address": "DAG123..."}, "balance"),
+            create_batch_operation("get_ordinal", {"address": "DAG123..."}, "ordinal"),
+            create_batch_operation("get_node_info", {}, "node_info"),
+        ]
+
+        response = self.network.batch_request(operations, max_workers=3)
+
+        assert [r.id for r in response.results] == ["balance", "ordinal", "node_info"]
+        assert response.success_rate() == 100.0
+        assert response.summary["concurrent_execution"] is True
+
     def test_batch_request_with_errors(self):
         """Test batch request with some operations failing."""
         # Make one operation fail
@@ -482,6 +533,19 @@ class TestAsyncNetworkBatchOperations:
         assert response.success_rate() == 100.0
         assert response.summary["concurrent_execution"] is True
 
+    async def test_async_batch_request_chunked(self):
+        """Test large async batches are split into chunks in order."""
+        self.network.max_batch_size = 2
+        operations = batch_get_ordinals(["DAG1", "DAG2", "DAG3", "DAG4", "DAG5"])
+
+        response = await self.network.batch_request(operations)
+
+        assert response.summary["chunks"] == 3
+        assert response.summary["concurrent_execution"] is True
+        assert response.summary["concurrent_chunks"] is True
+        assert [r.id for r in response.results] == [op.id for op in operations]
+        assert all(r.data == 5 for r in response.results)
+
     async def test_async_get_multi_balance_enhanced(self):
         """Test async get_multi_balance_enhanced method."""
         addresses = ["DAG123...", "DAG456..."]
@@ -523,6 +587,29 @@ class TestAsyncNetworkBatchOperations:
         assert "execution_time" in overview
 
 
+def test_async_batch_request_across_event_loops():
+    """Test one AsyncNetwork can run batches on successive event loops."""
+    with patch("constellation_sdk.async_network.AIOHTTP_AVAILABLE", True):
+        from constellation_sdk.async_network import AsyncNetwork
+
+        network = AsyncNetwork()
+
+    async def mock_get_ordinal(*args, **kwargs):
+        await asyncio.sleep(0)
+        return 5
+
+    network.get_ordinal = mock_get_ordinal
+    # One chunk in flight at a time, so later chunks wait on the semaphore
+    network.max_batch_size = 1
+    network.max_concurrent_chunks = 1
+    operations = batch_get_ordinals(["DAG1", "DAG2", "DAG3"])
+
+    for _ in range(2):
+        response = asyncio.run(network.batch_request(operations))
+        assert response.success_rate() == 100.0
+        assert response.summary["concurrent_chunks"] is False
+
+
 # Integration tests
 @pytest.mark.integration
 class TestBatchOperationsIntegration:
@@ -530,7 +617,9 @@ class TestBatchOperationsIntegration:
 
     def test_real_batch_request_with_mock_network(self):
         """Test batch request with mock network responses."""
-        with patch("constellation_sdk.network.requests.request") as mock_request:
+        with patch(
+            "constellation_sdk.network.requests.Session.request"
+        ) as mock_request:
             # Mock successful responses
             mock_response = Mock()
             mock_response.status_code = 200
@@ -565,7 +654,9 @@ class TestBatchOperationsPerformance:
 
     def test_batch_performance_vs_individual(self):
         """Test that batch operations are more efficient than individual calls."""
-        with patch("constellation_sdk.network.requests.request") as mock_request:
+        with patch(
+            "constellation_sdk.network.requests.Session.request"
+        ) as mock_request:
             # Mock fast responses
             mock_response = Mock()
             mock_response.status_code = 200
@@ -0,0 +1,82 @@
+"""
+Tests for the shared TTL result cache.
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from constellation_sdk.cache import TTLCache, ttl_cached
+
+
+class TestTTLCache:
+    """Test TTLCache storage and expiry."""
+
+    def test_get_set_and_expiry(self):
+        """Test entries are returned until their TTL passes."""
+        cache = TTLCache(ttl=10.0, maxsize=4)
+        cache.set("key", 1)
+        assert cache.get("key") == (True, 1)
+        assert cache.get("missing") == (False, None)
+
+        with patch("constellation_sdk.cache.time.monotonic", return_value=1e12):
+            assert cache.get("key") == (False, None)
+        assert len(cache) == 0
+
+    def test_eviction_discard_and_clear(self):
+        """Test the oldest entry is evicted and entries can be dropped."""
+        cache = TTLCache(ttl=10.0, maxsize=2)
+        for key in ("a", "b", "c"):
+            cache.set(key, key)
+        assert cache.get("a") == (False, None)
+        assert len(cache) == 2
+
+        cache.discard(lambda key: key == "b")
+        assert cache.get("b") == (False, None)
+        assert cache.get("c") == (True, "c")
+
+        cache.clear()
+        assert len(cache) == 0
+
+
+class TestTTLCached:
+    """Test the ttl_cached decorator."""
+
+    def test_binds_arguments_and_copies_results(self):
+        """Test keyword and positional calls share an entry and get copies."""
+        cache = TTLCache(ttl=10.0, maxsize=8)
+        calls = []
+
+        @ttl_cached(lambda arguments: (cache, arguments))
+        def lookup(network="mainnet"):
+            calls.append(network)
+            return {"network": network, "nested": {"count": 1}}
+
+        first = lookup()
+        first["nested"]["count"] = 99
+        assert lookup("mainnet") == {"network": "mainnet", "nested": {"count": 1}}
+        assert lookup(network="mainnet")["nested"]["count"] == 1
+        assert calls == ["mainnet"]
+
+    def test_bypass_and_exceptions_not_cached(self):
+        """Test resolve() returning None bypasses the cache."""
+        cache = TTLCache(ttl=10.0, maxsize=8)
+        calls = []
+
+        @ttl_cached(lambda arguments: None if arguments[0] < 0 else (cache, arguments))
+        def square(value):
+            calls.append(value)
+            if value == 0:
+                raise ValueError("zero")
+            return value * value
+
+        assert square(-2) == square(-2) == 4
+        assert calls == [-2, -2]
+
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                square(0)
+        assert calls == [-2, -2, 0, 0]
+
+
+pytestmark = [pytest.mark.unit]
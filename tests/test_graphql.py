@@ -3,6 +3,7 @@ Tests for GraphQL functionality.
 """
 
 import asyncio
+import threading
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
@@ -14,6 +15,7 @@ from constellation_sdk.graphql import (
     GraphQLOperationType,
     GraphQLQuery,
     GraphQLResponse,
+    _plan_query,
     execute_query,
     execute_query_async,
     get_account_portfolio,
@@ -174,6 +176,32 @@ class TestGraphQLClient:
             assert response.is_successful
             assert response.data == {"network": {"status": "active"}}
 
+    @pytest.mark.asyncio
+    async def test_execute_async_runs_off_event_loop(self):
+        """Test async queries run the REST translation in a worker thread."""
+        client = GraphQLClient("testnet")
+        loop_thread = threading.get_ident()
+        started = threading.Barrier(2, timeout=5)
+        threads = []
+
+        def translate(query):
+            threads.append(threading.get_ident())
+            # Both queries must be in flight at once to pass the barrier
+            started.wait()
+            return {"network": {"status": "active"}}
+
+        with patch.object(
+            client, "_execute_via_rest_translation", side_effect=translate
+        ):
+            responses = await asyncio.gather(
+                client.execute_async("query { network { status } }"),
+                client.execute_async("query { network { status } }"),
+            )
+
+        assert all(response.is_successful for response in responses)
+        assert loop_thread not in threads
+        await client.close()
+
     def test_batch_execute(self):
         """Test batch query execution."""
         queries = [
@@ -272,6 +300,20 @@ class TestGraphQLClient:
                 assert result["network"]["status"] == "active"
                 assert result["network"]["info"]["version"] == "1.0.0"
 
+    def test_rest_translation_plan_cached(self):
+        """Test repeated documents reuse their translation plan."""
+        query = GraphQLQuery(query="query { network { status } }")
+        _plan_query.cache_clear()
+
+        with patch.object(self.client.network_client, "get_node_info"):
+            with patch.object(self.client.network_client, "get_cluster_info"):
+                self.client._execute_via_rest_translation(query)
+                self.client._execute_via_rest_translation(query)
+
+        info = _plan_query.cache_info()
+        assert info.misses == 1
+        assert info.hits == 1
+
     def test_rest_translation_metagraph_query(self):
         """Test REST translation for metagraph queries."""
         query = GraphQLQuery(
@@ -0,0 +1,68 @@
+"""
+Tests for NumPy-backed snapshot holder analytics.
+"""
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from constellation_sdk.holders import HoldersView
+
+
+@pytest.fixture
+def holders():
+    """Sample snapshot holders."""
+    return [
+        {"wallet": "DAG_A", "amount": 10.0},
+        {"wallet": "DAG_B", "amount": 250.5},
+        {"wallet": "DAG_C", "amount": 0.5},
+        {"wallet": "DAG_D", "amount": 99.0},
+    ]
+
+
+class TestHoldersView:
+    """Test HoldersView aggregates."""
+
+    def test_top_returns_largest_first(self, holders):
+        """Test top-K selection matches a full sort."""
+        view = HoldersView(holders)
+
+        assert len(view) == 4
+        assert view.top(2) == [
+            {"wallet": "DAG_B", "amount": 250.5},
+            {"wallet": "DAG_D", "amount": 99.0},
+        ]
+        expected = sorted(holders, key=lambda h: h["amount"], reverse=True)
+        assert view.top(10) == expected
+        assert view.top(0) == []
+
+    def test_total_and_gini(self, holders):
+        """Test total supply and concentration measures."""
+        view = HoldersView(holders)
+
+        assert view.total() == pytest.approx(360.0)
+        assert 0.0 < view.gini() < 1.0
+
+        equal = HoldersView([{"wallet": "a", "amount": 5.0}] * 3)
+        assert equal.gini() == pytest.approx(0.0)
+
+    def test_empty_view(self):
+        """Test aggregates over an empty holder list."""
+        view = HoldersView([])
+
+        assert view.top(5) == []
+        assert view.total() == 0.0
+        assert view.gini() == 0.0
+
+    def test_lazy_package_export(self):
+        """Test the package exposes HoldersView without importing it eagerly."""
+        import constellation_sdk
+        from constellation_sdk import holders
+
+        assert constellation_sdk.HoldersView is holders.HoldersView
+        assert constellation_sdk.NUMPY_AVAILABLE is holders.NUMPY_AVAILABLE
+        with pytest.raises(AttributeError):
+            constellation_sdk.NotAnExport
+
+
+pytestmark = [pytest.mark.unit]
@@ -2,12 +2,19 @@
 Comprehensive integration tests for MetagraphClient functionality.
 """
 
+import asyncio
 from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 
 from constellation_sdk import ConstellationError
-from constellation_sdk.metagraph import MetagraphClient
+from constellation_sdk.metagraph import (
+    MetagraphClient,
+    clear_discovery_cache,
+    discover_production_metagraphs,
+    get_realistic_metagraph_summary,
+    prewarm_metagraphs,
+)
 import time
 
 
@@ -44,7 +51,7 @@ class TestMetagraphClientInitialization:
 class TestMetagraphDiscovery:
     """Test metagraph discovery functionality."""
 
-    @patch("constellation_sdk.metagraph.requests.get")
+    @patch("constellation_sdk.metagraph.requests.Session.get")
     def test_discover_metagraphs_success(self, mock_get, mock_metagraph_responses):
         """Test successful metagraph discovery."""
         # Setup mock response
@@ -66,7 +73,7 @@ class TestMetagraphDiscovery:
         assert metagraphs[0]["id"] == "DAG31fddd28e278f8086f52cbd40abe08a8692"
         assert metagraphs[0]["network"] == "testnet"
 
-    @patch("constellation_sdk.metagraph.requests.get")
+    @patch("constellation_sdk.metagraph.requests.Session.get")
     def test_discover_metagraphs_empty_result(self, mock_get):
         """Test metagraph discovery with no results."""
         # Setup mock response with empty data
@@ -82,7 +89,7 @@ class TestMetagraphDiscovery:
         assert isinstance(metagraphs, list)
         assert len(metagraphs) == 0
 
-    @patch("constellation_sdk.metagraph.requests.get")
+    @patch("constellation_sdk.metagraph.requests.Session.get")
     def test_discover_metagraphs_http_error(self, mock_get):
         """Test metagraph discovery with HTTP error."""
         # Setup mock error response
@@ -96,7 +103,7 @@ class TestMetagraphDiscovery:
         with pytest.raises(ConstellationError, match="Error discovering metagraphs"):
             client.discover_metagraphs()
 
-    @patch("constellation_sdk.metagraph.requests.get")
+    @patch("constellation_sdk.metagraph.requests.Session.get")
     def test_discover_metagraphs_connection_error(self, mock_get):
         """Test metagraph discovery with connection error."""
         # Setup mock connection error
@@ -107,7 +114,21 @@ class TestMetagraphDiscovery:
         with pytest.raises(ConstellationError, match="Network unreachable"):
             client.discover_metagraphs()
 
-    @patch("constellation_sdk.metagraph.requests.get")
+    @patch("constellation_sdk.metagraph.requests.Session.get")
+    def test_async_discovery(self, mock_get, mock_metagraph_responses):
+        """Test async discovery awaits the same lookup as the sync method."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = mock_metagraph_responses["currency_response"]
+        mock_get.return_value = mock_response
+
+        client = MetagraphClient("mainnet")
+        metagraphs = asyncio.run(client.adiscover_production_metagraphs())
+
+        assert metagraphs == client.discover_production_metagraphs()
+        assert mock_get.call_count == 2
+
+    @patch("constellation_sdk.metagraph.requests.Session.get")
     def test_discover_metagraphs_with_limit(self, mock_get, mock_metagraph_responses):
         """Test metagraph discovery with limit parameter."""
         # Setup mock response
@@ -123,13 +144,74 @@ class TestMetagraphDiscovery:
         call_args = str(mock_get.call_args)
         assert "limit=10" in call_args or "10" in call_args
 
+    @patch("constellation_sdk.metagraph.requests.Session.get")
+    def test_partition_deployments(self, mock_get, mock_metagraph_responses):
+        """Test deployments are split by category from a single discovery."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = mock_metagraph_responses["currency_response"]
+        mock_get.return_value = mock_response
+
+        production, test = MetagraphClient("testnet").partition_deployments()
+        assert production == []
+        assert [mg["category"] for mg in test] == ["test", "test"]
+        assert mock_get.call_count == 1
+
+        production, test = MetagraphClient("mainnet").partition_deployments()
+        assert len(production) == 2
+        assert test == []
+
+    @patch("constellation_sdk.metagraph.requests.Session.get")
+    def test_production_discovery_cached(self, mock_get, mock_metagraph_responses):
+        """Test module-level production discovery is cached per network."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = mock_metagraph_responses["currency_response"]
+        mock_get.return_value = mock_response
+
+        clear_discovery_cache()
+        first = discover_production_metagraphs("testnet")
+        second = discover_production_metagraphs("testnet")
+        assert first == second
+        assert mock_get.call_count == 1
+
+        clear_discovery_cache()
+        warmed = asyncio.run(prewarm_metagraphs("testnet"))
+        assert warmed == first
+        assert mock_get.call_count == 2
+        clear_discovery_cache()
+
+    @patch("constellation_sdk.metagraph.requests.Session.get")
+    def test_realistic_summary_cached(self, mock_get, mock_metagraph_responses):
+        """Test the all-network summary is cached and returned as a deep copy."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = mock_metagraph_responses["currency_response"]
+        mock_get.return_value = mock_response
+
+        clear_discovery_cache()
+        first = get_realistic_metagraph_summary()
+        calls = mock_get.call_count
+        first["production_total"] = -1
+        first["networks"]["testnet"]["total"] = -1
+
+        second = get_realistic_metagraph_summary()
+        assert mock_get.call_count == calls
+        assert second["production_total"] != -1
+        assert second["networks"]["testnet"]["total"] != -1
+
+        clear_discovery_cache()
+        get_realistic_metagraph_summary()
+        assert mock_get.call_count == 2 * calls
+        clear_discovery_cache()
+
 
 @pytest.mark.integration
 @pytest.mark.mock
 class TestMetagraphBalanceOperations:
     """Test metagraph balance operations."""
 
-    @patch("constellation_sdk.metagraph.requests.get")
+    @patch("constellation_sdk.metagraph.requests.Session.get")
     def test_get_metagraph_balance_success(
         self, mock_get, alice_account, test_metagraph_id
     ):
@@ -152,7 +234,24 @@ class TestMetagraphBalanceOperations:
         # Validate response
         assert balance == 1500000000
 
-    @patch("constellation_sdk.metagraph.requests.get")
+    @patch("constellation_sdk.metagraph.requests.Session.get")
+    def test_get_metagraph_balances(self, mock_get, test_accounts, test_metagraph_id):
+        """Test balances for several addresses are fetched in one call."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {"data": {"balance": 250000000}}
+        mock_get.return_value = mock_response
+
+        client = MetagraphClient("testnet")
+        addresses = [account.address for account in test_accounts.values()]
+        balances = client.get_balances(test_metagraph_id, addresses)
+
+        assert list(balances) == addresses
+        assert all(balance == 250000000 for balance in balances.values())
+        assert mock_get.call_count == len(addresses)
+        assert client.get_balances(test_metagraph_id, []) == {}
+
+    @patch("constellation_sdk.metagraph.requests.Session.get")
     def test_get_metagraph_balance_address_not_found(self, mock_get, test_metagraph_id):
         """Test metagraph balance for non-existent address."""
         # Setup mock 404 response
@@ -167,7 +266,7 @@ class TestMetagraphBalanceOperations:
         # Should return 0 for non-existent addresses
         assert balance == 0
 
-    @patch("constellation_sdk.metagraph.requests.get")
+    @patch("constellation_sdk.metagraph.requests.Session.get")
     def test_get_metagraph_balance_invalid_metagraph(self, mock_get, alice_account):
         """Test metagraph balance with invalid metagraph ID."""
         # Setup mock error response
@@ -181,7 +280,7 @@ class TestMetagraphBalanceOperations:
         with pytest.raises(ConstellationError, match="Invalid metagraph ID"):
             client.get_balance(alice_account.address, "INVALID_METAGRAPH_ID")
 
-    @patch("constellation_sdk.metagraph.requests.get")
+    @patch("constellation_sdk.metagraph.requests.Session.get")
     def test_get_metagraph_balance_validation_errors(
         self, alice_account, test_metagraph_id, invalid_dag_addresses
     ):
@@ -207,7 +306,7 @@ class TestMetagraphBalanceOperations:
 class TestMetagraphTransactionHistory:
     """Test metagraph transaction history operations."""
 
-    @patch("constellation_sdk.metagraph.requests.get")
+    @patch("constellation_sdk.metagraph.requests.Session.get")
     def test_get_metagraph_transactions_success(
         self, mock_get, alice_account, test_metagraph_id
     ):
@@ -256,7 +355,7 @@ class TestMetagraphTransactionHistory:
         assert transactions[1]["type"] == "data_submission"
         assert "data" in transactions[1]
 
-    @patch("constellation_sdk.metagraph.requests.get")
+    @patch("constellation_sdk.metagraph.requests.Session.get")
     def test_get_metagraph_transactions_with_limit(
         self, mock_get, alice_account, test_metagraph_id
     ):
@@ -274,7 +373,7 @@ class TestMetagraphTransactionHistory:
         call_args = str(mock_get.call_args)
         assert "limit=5" in call_args or "5" in call_args
 
-    @patch("constellation_sdk.metagraph.requests.get")
+    @patch("constellation_sdk.metagraph.requests.Session.get")
     def test_get_metagraph_transactions_empty_history(
         self, mock_get, alice_account, test_metagraph_id
     ):
@@ -297,7 +396,7 @@ class TestMetagraphTransactionHistory:
 class TestMetagraphDataQueries:
     """Test metagraph data query operations."""
 
-    @patch("constellation_sdk.metagraph.requests.get")
+    @patch("constellation_sdk.metagraph.requests.Session.get")
     def test_query_metagraph_data_success(self, mock_get, test_metagraph_id):
         """Test successful metagraph data query."""
         # Setup mock response with data
@@ -335,7 +434,7 @@ class TestMetagraphDataQueries:
         assert data[0]["data"]["sensor_type"] == "temperature"
         assert data[1]["data"]["sensor_type"] == "humidity"
 
-    @patch("constellation_sdk.metagraph.requests.get")
+    @patch("constellation_sdk.metagraph.requests.Session.get")
     def test_query_metagraph_data_with_filters(self, mock_get, test_metagraph_id):
         """Test metagraph data query with filters."""
         # Setup mock response
@@ -363,7 +462,7 @@ class TestMetagraphDataQueries:
         assert "DAG123sensor" in call_args
         assert "limit=10" in call_args or "10" in call_args
 
-    @patch("constellation_sdk.metagraph.requests.get")
+    @patch("constellation_sdk.metagraph.requests.Session.get")
     def test_query_metagraph_data_no_results(self, mock_get, test_metagraph_id):
         """Test metagraph data query with no results."""
         # Setup mock response with empty data
@@ -384,7 +483,7 @@ class TestMetagraphDataQueries:
 class TestMetagraphErrorHandling:
     """Test metagraph client error handling."""
 
-    @patch("constellation_sdk.metagraph.requests.get")
+    @patch("constellation_sdk.metagraph.requests.Session.get")
     def test_timeout_error_handling(self, mock_get, alice_account, test_metagraph_id):
         """Test handling of request timeouts."""
         # Setup mock timeout
@@ -395,7 +494,7 @@ class TestMetagraphErrorHandling:
         with pytest.raises(ConstellationError, match="Request timeout"):
             client.get_balance(alice_account.address, test_metagraph_id)
 
-    @patch("constellation_sdk.metagraph.requests.get")
+    @patch("constellation_sdk.metagraph.requests.Session.get")
     def test_malformed_json_response(self, mock_get, alice_account, test_metagraph_id):
         """Test handling of malformed JSON responses."""
         # Setup mock response with invalid JSON
@@ -409,7 +508,7 @@ class TestMetagraphErrorHandling:
         with pytest.raises(ConstellationError, match="Invalid JSON"):
             client.get_balance(alice_account.address, test_metagraph_id)
 
-    @patch("constellation_sdk.metagraph.requests.get")
+    @patch("constellation_sdk.metagraph.requests.Session.get")
     def test_unexpected_response_structure(
         self, mock_get, alice_account, test_metagraph_id
     ):
@@ -426,7 +525,7 @@ class TestMetagraphErrorHandling:
         balance = client.get_balance(alice_account.address, test_metagraph_id)
         assert balance == 0  # Default for missing balance data
 
-    @patch("constellation_sdk.metagraph.requests.get")
+    @patch("constellation_sdk.metagraph.requests.Session.get")
     def test_metagraph_not_found(self, mock_get, alice_account):
         """Test handling of non-existent metagraph."""
         # Setup mock 404 response
@@ -446,7 +545,7 @@ class TestMetagraphErrorHandling:
 class TestMetagraphPerformance:
     """Test metagraph client performance."""
 
-    @patch("constellation_sdk.metagraph.requests.get")
+    @patch("constellation_sdk.metagraph.requests.Session.get")
     def test_concurrent_balance_requests(
         self, mock_get, test_accounts, test_metagraph_id
     ):
@@ -471,7 +570,7 @@ class TestMetagraphPerformance:
         assert all(balance == 500000000 for balance in balances)
         assert mock_get.call_count == len(addresses)
 
-    @patch("constellation_sdk.metagraph.requests.get")
+    @patch("constellation_sdk.metagraph.requests.Session.get")
     def test_multiple_metagraph_discovery(self, mock_get, mock_metagraph_responses):
         """Test multiple metagraph discovery requests."""
         # Setup mock response
@@ -492,13 +591,39 @@ class TestMetagraphPerformance:
         assert all(len(result) == 2 for result in results)
         assert mock_get.call_count == 3
 
+    @patch("constellation_sdk.metagraph.requests.Session.get")
+    def test_bulk_metagraph_info(self, mock_get):
+        """Test bulk info keeps input order and skips failed lookups."""
+
+        def fake_get(url, timeout=None):
+            if "DAG_FAIL" in url:
+                raise ConnectionError("Connection failed")
+            response = Mock()
+            response.status_code = 200
+            if url.endswith("/balance"):
+                balance = 0 if "DAG_IDLE" in url else 100
+                response.json.return_value = {"data": {"balance": balance}}
+            else:
+                response.json.return_value = {"data": []}
+            return response
+
+        mock_get.side_effect = fake_get
+
+        client = MetagraphClient("testnet")
+        infos = client.get_metagraphs_bulk_info(["DAG_LIVE", "DAG_FAIL", "DAG_IDLE"])
+
+        assert list(infos) == ["DAG_LIVE", "DAG_IDLE"]
+        assert infos["DAG_LIVE"]["is_active"] is True
+        assert infos["DAG_IDLE"]["is_active"] is False
+        assert client.get_metagraphs_bulk_info([]) == {}
+
 
 @pytest.mark.integration
 @pytest.mark.mock
 class TestMetagraphEdgeCases:
     """Test metagraph client edge cases."""
 
-    @patch("constellation_sdk.metagraph.requests.get")
+    @patch("constellation_sdk.metagraph.requests.Session.get")
     def test_very_large_metagraph_balance(
         self, mock_get, alice_account, test_metagraph_id
     ):
@@ -517,7 +642,7 @@ class TestMetagraphEdgeCases:
         assert balance == large_balance
         assert isinstance(balance, int)
 
-    @patch("constellation_sdk.metagraph.requests.get")
+    @patch("constellation_sdk.metagraph.requests.Session.get")
     def test_large_data_query_result(self, mock_get, test_metagraph_id):
         """Test handling of large data query results."""
         # Setup mock response with large data set
@@ -642,7 +767,7 @@ class TestMetagraphSubmissions:
         with pytest.raises(ConstellationError, match="not confirmed after"):
             client.wait_for_confirmation(tx_hash, timeout=0.1, poll_interval=0.05)
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_custom_state_success(self, mock_get):
         """Test successful custom state retrieval."""
         mock_response = Mock()
@@ -657,7 +782,7 @@ class TestMetagraphSubmissions:
         mock_get.assert_called_once()
         assert "state/my_key" in mock_get.call_args[0][0]
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_custom_state_not_found(self, mock_get):
         """Test custom state retrieval when key not found."""
         mock_response = Mock()
@@ -2,14 +2,15 @@
 Comprehensive integration tests for Network functionality - FIXED VERSION.
 """
 
+import io
 import json
 from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 
-from constellation_sdk import ConstellationError
+from constellation_sdk import ConstellationError, NetworkError, create_batch_operation
 from constellation_sdk.config import NetworkConfig
-from constellation_sdk.network import Network
+from constellation_sdk.network import Network, _parse_json
 
 
 @pytest.mark.integration
@@ -37,13 +38,30 @@ class TestNetworkInitialization:
         with pytest.raises(ConstellationError):
             Network("invalid_network_name")
 
+    @patch("constellation_sdk.network.requests.Session.request")
+    def test_session_reused_and_closed(self, mock_request, test_network_config):
+        """Test that requests share one pooled session closed on exit."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {}
+        mock_request.return_value = mock_response
+
+        with Network(test_network_config) as network:
+            network.get_node_info()
+            session = network.session
+            network.get_cluster_info()
+            assert network.session is session
+            assert mock_request.call_count == 2
+
+        assert network._session is None
+
 
 @pytest.mark.integration
 @pytest.mark.mock
 class TestNetworkInfo:
     """Test network information retrieval."""
 
-    @patch("constellation_sdk.network.requests.request")
+    @patch("constellation_sdk.network.requests.Session.request")
     def test_get_node_info_success(
         self, mock_request, test_network_config, mock_network_responses
     ):
@@ -66,7 +84,7 @@ class TestNetworkInfo:
         assert node_info["id"] == "test_node_id"
         assert node_info["state"] == "Ready"
 
-    @patch("constellation_sdk.network.requests.request")
+    @patch("constellation_sdk.network.requests.Session.request")
     def test_get_node_info_http_error(
         self, mock_request, test_network_config, network_error_scenarios
     ):
@@ -82,7 +100,7 @@ class TestNetworkInfo:
         with pytest.raises(ConstellationError):
             network.get_node_info()
 
-    @patch("constellation_sdk.network.requests.request")
+    @patch("constellation_sdk.network.requests.Session.request")
     def test_get_node_info_connection_error(self, mock_request, test_network_config):
         """Test node info retrieval with connection error."""
         # Setup mock connection error
@@ -93,7 +111,7 @@ class TestNetworkInfo:
         with pytest.raises(ConstellationError):
             network.get_node_info()
 
-    @patch("constellation_sdk.network.requests.request")
+    @patch("constellation_sdk.network.requests.Session.request")
     def test_get_cluster_info_success(
         self, mock_request, test_network_config, mock_network_responses
     ):
@@ -120,7 +138,7 @@ class TestNetworkInfo:
 class TestBalanceOperations:
     """Test balance retrieval operations."""
 
-    @patch("constellation_sdk.network.requests.request")
+    @patch("constellation_sdk.network.requests.Session.request")
     def test_get_balance_success(
         self, mock_request, test_network_config, mock_network_responses, alice_account
     ):
@@ -141,7 +159,7 @@ class TestBalanceOperations:
         # Validate response
         assert balance == 100000000
 
-    @patch("constellation_sdk.network.requests.request")
+    @patch("constellation_sdk.network.requests.Session.request")
     def test_get_balance_address_not_found(self, mock_request, test_network_config):
         """Test balance retrieval for non-existent address."""
         # Setup mock 404 response
@@ -156,7 +174,7 @@ class TestBalanceOperations:
         # Should return 0 for non-existent addresses
         assert balance == 0
 
-    @patch("constellation_sdk.network.requests.request")
+    @patch("constellation_sdk.network.requests.Session.request")
     def test_get_balance_invalid_address(
         self, mock_request, test_network_config, invalid_dag_addresses
     ):
@@ -176,13 +194,101 @@ class TestBalanceOperations:
                 with pytest.raises(ConstellationError):
                     network.get_balance(invalid_address)
 
+    @patch("constellation_sdk.network.requests.Session.request")
+    def test_malformed_address_short_circuits(self, mock_request, test_network_config):
+        """Test malformed addresses fail locally without a request."""
+        network = Network(test_network_config)
+
+        with pytest.raises(ConstellationError):
+            network.get_balance("INVALID_ADDRESS")
+
+        response = network.batch_request(
+            [
+                create_batch_operation(
+                    "get_ordinal", {"address": "BTC4J6gixVGKYmcZs9W"}, "bad"
+                )
+            ]
+        )
+
+        assert response.get_result("bad").success is False
+        mock_request.assert_not_called()
+
+    @patch("constellation_sdk.network.requests.Session.request")
+    def test_get_balance_cached_until_invalidated(
+        self, mock_request, test_network_config, mock_network_responses, alice_account
+    ):
+        """Test repeated balance queries hit the cache until invalidated."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = mock_network_responses["balance_response"]
+        mock_request.return_value = mock_response
+
+        network = Network(test_network_config)
+        assert network.get_balance(alice_account.address) == 100000000
+        assert network.get_balance(alice_account.address) == 100000000
+        assert mock_request.call_count == 1
+
+        network.invalidate(alice_account.address)
+        network.get_balance(alice_account.address)
+        assert mock_request.call_count == 2
+
+    @patch("constellation_sdk.network.requests.Session.request")
+    def test_get_balance_keyword_argument_cached(
+        self, mock_request, test_network_config, mock_network_responses, alice_account
+    ):
+        """Test keyword and positional calls work and share one cache entry."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = mock_network_responses["balance_response"]
+        mock_request.return_value = mock_response
+
+        network = Network(test_network_config)
+        assert network.get_balance(address=alice_account.address) == 100000000
+        assert network.get_balance(alice_account.address) == 100000000
+        assert mock_request.call_count == 1
+
+        network.invalidate(alice_account.address)
+        assert network.get_balance(address=alice_account.address) == 100000000
+        assert mock_request.call_count == 2
+
+    @patch("constellation_sdk.network.requests.Session.request")
+    def test_cached_results_are_copies(
+        self, mock_request, test_network_config, mock_network_responses
+    ):
+        """Test mutating a cached response does not alter later reads."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = mock_network_responses["node_info"]
+        mock_request.return_value = mock_response
+
+        network = Network(test_network_config)
+        network.get_node_info()["version"] = "mutated"
+
+        assert network.get_node_info()["version"] == "3.2.1-test"
+        assert mock_request.call_count == 1
+
+    @patch("constellation_sdk.network.requests.Session.request")
+    def test_cache_disabled(
+        self, mock_request, test_network_config, mock_network_responses, alice_account
+    ):
+        """Test clients created with cache_enabled=False always query."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = mock_network_responses["balance_response"]
+        mock_request.return_value = mock_response
+
+        network = Network(test_network_config, cache_enabled=False)
+        network.get_balance(alice_account.address)
+        network.get_balance(alice_account.address)
+        assert mock_request.call_count == 2
+
 
 @pytest.mark.integration
 @pytest.mark.mock
 class TestTransactionOperations:
     """Test transaction submission and retrieval."""
 
-    @patch("constellation_sdk.network.requests.request")
+    @patch("constellation_sdk.network.requests.Session.request")
     def test_submit_transaction_success(
         self,
         mock_request,
@@ -216,7 +322,7 @@ class TestTransactionOperations:
         # Validate response
         assert result["hash"] == "tx_hash_123"
 
-    @patch("constellation_sdk.network.requests.request")
+    @patch("constellation_sdk.network.requests.Session.request")
     def test_get_transaction_success(
         self, mock_request, test_network_config, mock_network_responses
     ):
@@ -238,7 +344,7 @@ class TestTransactionOperations:
         assert transaction is not None
         assert transaction["hash"] == tx_hash
 
-    @patch("constellation_sdk.network.requests.request")
+    @patch("constellation_sdk.network.requests.Session.request")
     def test_get_transaction_not_found(self, mock_request, test_network_config):
         """Test single transaction retrieval for non-existent hash."""
         mock_response = Mock()
@@ -250,7 +356,7 @@ class TestTransactionOperations:
 
         assert transaction is None
 
-    @patch("constellation_sdk.network.requests.request")
+    @patch("constellation_sdk.network.requests.Session.request")
     def test_get_transaction_server_error(self, mock_request, test_network_config):
         """Test single transaction retrieval with server error."""
         mock_response = Mock()
@@ -262,13 +368,53 @@ class TestTransactionOperations:
         with pytest.raises(ConstellationError):
             network.get_transaction("any_hash")
 
+    @patch("constellation_sdk.network.requests.Session.request")
+    def test_get_transactions_interns_addresses(
+        self, mock_request, test_network_config
+    ):
+        """Test repeated addresses share one string object after parsing."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {
+            "data": [
+                {"source": "".join(["DAG", "123test"]), "destination": "DAG456test"},
+                {"source": "DAG789test", "destination": "".join(["DAG", "123test"])},
+            ]
+        }
+        mock_request.return_value = mock_response
+
+        network = Network(test_network_config)
+        transactions = network.get_transactions("DAG123test")
+
+        assert transactions[0]["source"] == "DAG123test"
+        assert transactions[0]["source"] is transactions[1]["destination"]
+
+
+@pytest.fixture(params=["ijson", "json"])
+def snapshot_parser(request):
+    """Run a snapshot test with the streaming and the whole-body parser."""
+    if request.param == "ijson":
+        pytest.importorskip("ijson")
+    with patch("constellation_sdk.network.IJSON_AVAILABLE", request.param == "ijson"):
+        yield request.param
+
+
+def _snapshot_response(body: str, status_code: int = 200) -> Mock:
+    """Build a snapshot response serving body both as a stream and as JSON."""
+    response = Mock()
+    response.status_code = status_code
+    response.content = body.encode()
+    response.json.side_effect = lambda: json.loads(body)
+    response.raw = io.BytesIO(body.encode())
+    return response
+
 
 @pytest.mark.integration
 @pytest.mark.mock
 class TestSnapshotOperations:
     """Test snapshot retrieval operations."""
 
-    @patch("constellation_sdk.network.requests.request")
+    @patch("constellation_sdk.network.requests.Session.request")
     def test_get_snapshot_holders_success(self, mock_request, test_network_config):
         """Test successful snapshot holders retrieval."""
         # Setup mock response
@@ -285,6 +431,7 @@ class TestSnapshotOperations:
             },
         ]
         mock_response.json.return_value = mock_snapshot_data
+        mock_response.raw = io.BytesIO(json.dumps(mock_snapshot_data).encode())
         mock_request.return_value = mock_response
 
         network = Network(test_network_config)
@@ -303,7 +450,7 @@ class TestSnapshotOperations:
             h["wallet"] == "0000000000000000000000000000000000000000" for h in holders
         )
 
-    @patch("constellation_sdk.network.requests.request")
+    @patch("constellation_sdk.network.requests.Session.request")
     def test_get_snapshot_holders_http_error(self, mock_request, test_network_config):
         """Test snapshot holders retrieval with HTTP error."""
         # Setup mock error response
@@ -316,7 +463,7 @@ class TestSnapshotOperations:
         with pytest.raises(ConstellationError):
             network.get_snapshot_holders()
 
-    @patch("constellation_sdk.network.requests.request")
+    @patch("constellation_sdk.network.requests.Session.request")
     def test_get_snapshot_holders_malformed_json(
         self, mock_request, test_network_config
     ):
@@ -325,6 +472,7 @@ class TestSnapshotOperations:
         mock_response = Mock()
         mock_response.status_code = 200
         mock_response.json.return_value = {"data": "invalid_structure"}
+        mock_response.raw = io.BytesIO(b'{"data": "invalid_structure"}')
         mock_request.return_value = mock_response
 
         network = Network(test_network_config)
@@ -332,3 +480,142 @@ class TestSnapshotOperations:
 
         # Should return an empty list for malformed data
         assert holders == []
+
+    @patch("constellation_sdk.network.requests.Session.request")
+    def test_snapshot_parsers_read_only_info_balances(
+        self, mock_request, test_network_config, snapshot_parser
+    ):
+        """Test both parsers read balances from the second element only."""
+        body = json.dumps(
+            [
+                {"balances": {"DAGDECOY": 500000000}, "ordinal": 7},
+                {
+                    "balances": {
+                        "DAGWALLET1": 1000000000,
+                        "DAGWALLET2": 250000000,
+                        "0000000000000000000000000000000000000000": 123,
+                    },
+                    "lastTxRefs": {"DAGWALLET1": {"ordinal": 3}},
+                },
+                {"balances": {"DAGTRAILING": 100000000}},
+            ]
+        )
+        mock_request.return_value = _snapshot_response(body)
+
+        network = Network(test_network_config)
+        holders = list(network.iter_snapshot_holders())
+
+        assert holders == [
+            {"wallet": "DAGWALLET1", "amount": 10.0},
+            {"wallet": "DAGWALLET2", "amount": 2.5},
+        ]
+
+    @patch("constellation_sdk.network.requests.Session.request")
+    def test_snapshot_parsers_unexpected_shape(
+        self, mock_request, test_network_config, snapshot_parser
+    ):
+        """Test both parsers yield nothing for well-formed, unexpected shapes."""
+        network = Network(test_network_config)
+        for body in ['{"data": "invalid"}', "[{}]", '[{}, {"balances": [1, 2]}]']:
+            mock_request.return_value = _snapshot_response(body)
+            assert list(network.iter_snapshot_holders()) == []
+
+    @patch("constellation_sdk.network.requests.Session.request")
+    def test_snapshot_truncated_stream_keeps_cause(
+        self, mock_request, test_network_config, snapshot_parser
+    ):
+        """Test a truncated body raises NetworkError chained to the parse error."""
+        body = json.dumps([{}, {"balances": {"DAGWALLET1": 1000000000}}])
+        response = _snapshot_response(body[:-8])
+        mock_request.return_value = response
+
+        network = Network(test_network_config)
+
+        with pytest.raises(NetworkError, match="Invalid snapshot JSON") as exc_info:
+            list(network.iter_snapshot_holders())
+        assert exc_info.value.__cause__ is not None
+        if snapshot_parser == "ijson":
+            response.close.assert_called_once()
+
+    @patch("constellation_sdk.network.requests.Session.request")
+    def test_snapshot_http_error_closes_response(
+        self, mock_request, test_network_config, snapshot_parser
+    ):
+        """Test a failed snapshot request releases its streamed connection."""
+        response = _snapshot_response("", status_code=503)
+        mock_request.return_value = response
+
+        network = Network(test_network_config)
+
+        with pytest.raises(NetworkError, match="503"):
+            list(network.iter_snapshot_holders())
+        response.close.assert_called_once()
+
+    @patch("constellation_sdk.network.requests.Session.request")
+    def test_get_snapshot_holders_truncated_body(
+        self, mock_request, test_network_config
+    ):
+        """Test a truncated snapshot body raises instead of returning partial data."""
+        body = json.dumps(
+            [{}, {"balances": {"DAGWALLET1": 1000000000, "DAGWALLET2": 2000000000}}]
+        )
+        truncated = body[: len(body) // 2]
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.content = truncated.encode()
+        mock_response.json.side_effect = lambda: json.loads(truncated)
+        mock_response.raw = io.BytesIO(truncated.encode())
+        mock_request.return_value = mock_response
+
+        network = Network(test_network_config)
+
+        with pytest.raises(NetworkError, match="Invalid snapshot JSON"):
+            network.get_snapshot_holders()
+
+        # The failure is not cached, so the next call fetches again
+        mock_response.raw = io.BytesIO(truncated.encode())
+        with pytest.raises(NetworkError):
+            network.get_snapshot_holders()
+        assert mock_request.call_count == 2
+
+
+@pytest.mark.unit
+class TestJsonDecoding:
+    """Test response decoding with and without orjson."""
+
+    def test_parse_json_uses_orjson_for_bytes(self):
+        """Test orjson decodes the raw body when it is installed."""
+        fake_orjson = Mock()
+        fake_orjson.loads.return_value = {"data": {"balance": 1}}
+        response = Mock(content=b'{"data": {"balance": 1}}')
+
+        with patch("constellation_sdk.network.ORJSON_AVAILABLE", True), patch(
+            "constellation_sdk.network.orjson", fake_orjson, create=True
+        ):
+            assert _parse_json(response) == {"data": {"balance": 1}}
+
+        fake_orjson.loads.assert_called_once_with(b'{"data": {"balance": 1}}')
+        response.json.assert_not_called()
+
+    def test_parse_json_falls_back_without_bytes_body(self):
+        """Test a response without a bytes body is decoded by Response.json."""
+        fake_orjson = Mock()
+        response = Mock(content=None)
+        response.json.return_value = {"data": {}}
+
+        with patch("constellation_sdk.network.ORJSON_AVAILABLE", True), patch(
+            "constellation_sdk.network.orjson", fake_orjson, create=True
+        ):
+            assert _parse_json(response) == {"data": {}}
+
+        fake_orjson.loads.assert_not_called()
+
+    def test_parse_json_without_orjson(self):
+        """Test Response.json is used when orjson is not installed."""
+        response = Mock(content=b'{"data": {}}')
+        response.json.return_value = {"data": {}}
+
+        with patch("constellation_sdk.network.ORJSON_AVAILABLE", False):
+            assert _parse_json(response) == {"data": {}}
+
+        response.json.assert_called_once_with()
@@ -7,7 +7,11 @@ from unittest.mock import Mock, patch
 
 import pytest
 
-from constellation_sdk.transactions import Transactions, ValidationError
+from constellation_sdk.transactions import (
+    TokenTxTemplate,
+    Transactions,
+    ValidationError,
+)
 
 
 @pytest.mark.unit
@@ -172,6 +176,30 @@ class TestTokenTransfers:
                 metagraph_id="",
             )
 
+    def test_token_template_matches_create_token_transfer(
+        self, alice_account, bob_account, test_metagraph_id
+    ):
+        """Test template-built transfers equal create_token_transfer output."""
+        template = TokenTxTemplate(alice_account.address, test_metagraph_id, fee=5)
+        built = template.build(bob_account.address, 1000000000, salt=42)
+
+        assert built == Transactions.create_token_transfer(
+            source=alice_account.address,
+            destination=bob_account.address,
+            amount=1000000000,
+            metagraph_id=test_metagraph_id,
+            fee=5,
+            salt=42,
+        )
+        assert template.build(bob_account.address, 1)["salt"] != built["salt"]
+
+        with pytest.raises(ValidationError):
+            TokenTxTemplate(alice_account.address, "INVALID_METAGRAPH")
+        with pytest.raises(ValidationError):
+            template.build("not_an_address", 1)
+        with pytest.raises(ValidationError):
+            template.build(bob_account.address, 1, salt="42")
+
 
 @pytest.mark.unit
 class TestDataSubmissions:
@@ -0,0 +1,398 @@
+"""
+Unit tests for the validation module.
+"""
+
+import inspect
+from collections import deque
+from unittest import mock
+
+import pytest
+
+from constellation_sdk import validation
+from constellation_sdk.exceptions import (
+    AddressValidationError,
+    AmountValidationError,
+    MetagraphIdValidationError,
+    TransactionValidationError,
+    ValidationError,
+)
+from constellation_sdk.validation import (
+    AddressValidator,
+    AmountValidator,
+    MetagraphIdValidator,
+    _check_address_cached,
+    _copy_meta,
+    _is_noop,
+    _resolve_param_index,
+    disable_validator,
+    validate_address,
+    validate_amount,
+    validate_batch_transfers,
+    validate_metagraph_id,
+    validate_transaction,
+)
+
+pytestmark = [pytest.mark.unit]
+
+# Hex addresses; the digit sum of the first is even, so it passes the checksum
+VALID_ADDRESS = "DAG" + "0" * 35
+BAD_CHECKSUM_ADDRESS = "DAG" + "0" * 34 + "1"
+METAGRAPH_ID = "DAG7Ghth6FKMcvfK6A8BGSKvJvBYe4EFKgPvvQPJ"
+
+
+@pytest.fixture
+def restore_validators():
+    """Restore validator classes that a test disables."""
+    originals = {
+        cls: cls.__dict__["validate"]
+        for cls in (AddressValidator, AmountValidator, MetagraphIdValidator)
+    }
+    yield
+    for cls, validate in originals.items():
+        cls.validate = validate
+
+
+class TestCheckPredicates:
+    """Test the non-raising check() classmethods agree with validate()."""
+
+    @pytest.mark.parametrize(
+        "address, expected",
+        [
+            (VALID_ADDRESS, True),
+            ("DAG" + "a" * 37, True),
+            ("DAG" + "0" * 34, False),
+            ("XYZ" + "0" * 35, False),
+            ("DAG" + "g" * 35, False),
+            ("", False),
+            (None, False),
+            (123, False),
+        ],
+    )
+    def test_address_check(self, address, expected):
+        """Test AddressValidator.check returns a bool and never raises."""
+        assert AddressValidator.check(address) is expected
+        if expected:
+            AddressValidator.validate(address)
+        else:
+            with pytest.raises(AddressValidationError):
+                AddressValidator.validate(address)
+
+    @pytest.mark.parametrize("address", [None, 123, "DAG" + "0" * 34, "XYZ" + "0" * 35])
+    def test_address_check_skips_regex_for_cheap_failures(self, address, monkeypatch):
+        """Test type, length and prefix failures never reach the regex."""
+        pattern = mock.Mock(wraps=AddressValidator.DAG_ADDRESS_PATTERN)
+        monkeypatch.setattr(AddressValidator, "DAG_ADDRESS_PATTERN", pattern)
+
+        assert not AddressValidator.check(address, check_checksum=True)
+        pattern.match.assert_not_called()
+
+    def test_address_check_checksum(self):
+        """Test the checksum is only verified when requested."""
+        assert AddressValidator.check(BAD_CHECKSUM_ADDRESS)
+        assert not AddressValidator.check(BAD_CHECKSUM_ADDRESS, check_checksum=True)
+        assert AddressValidator.check(VALID_ADDRESS, check_checksum=True)
+
+    @pytest.mark.parametrize(
+        "amount, allow_zero, expected",
+        [
+            (1, False, True),
+            (100.0, False, True),
+            (AmountValidator.MAX_AMOUNT, False, True),
+            (AmountValidator.MAX_AMOUNT + 1, False, False),
+            (0, False, False),
+            (0, True, True),
+            (-1, True, False),
+            (1.5, False, False),
+            ("100", False, False),
+            (None, False, False),
+        ],
+    )
+    def test_amount_check(self, amount, allow_zero, expected):
+        """Test AmountValidator.check matches validate()."""
+        assert AmountValidator.check(amount, allow_zero) is expected
+        if expected:
+            AmountValidator.validate(amount, allow_zero)
+        else:
+            with pytest.raises(AmountValidationError):
+                AmountValidator.validate(amount, allow_zero)
+
+    def test_amount_check_int_subclass(self):
+        """Test int subclasses skip the exact-int fast path but still pass."""
+
+        class Datum(int):
+            pass
+
+        assert AmountValidator.check(Datum(5))
+        assert AmountValidator.check(Datum(0), allow_zero=True)
+        assert not AmountValidator.check(Datum(0))
+        assert not AmountValidator.check(Datum(AmountValidator.MAX_AMOUNT + 1))
+
+    @pytest.mark.parametrize(
+        "metagraph_id, expected",
+        [
+            (VALID_ADDRESS, True),
+            (METAGRAPH_ID, True),
+            ("DAG" + "0" * 36, False),
+            ("DAG" + "0" * 37, False),
+            (None, False),
+        ],
+    )
+    def test_metagraph_id_check(self, metagraph_id, expected):
+        """Test MetagraphIdValidator.check matches validate()."""
+        assert MetagraphIdValidator.check(metagraph_id) is expected
+        if expected:
+            MetagraphIdValidator.validate(metagraph_id)
+        else:
+            with pytest.raises(MetagraphIdValidationError):
+                MetagraphIdValidator.validate(metagraph_id)
+
+
+class TestValidationDecorators:
+    """Test the parameter validation decorators."""
+
+    def test_param_index_resolution(self):
+        """Test parameter positions are resolved from the signature."""
+
+        def send(self, destination, amount=0):
+            pass
+
+        assert _resolve_param_index(send, "destination") == 1
+        assert _resolve_param_index(send, "amount") == 2
+        assert _resolve_param_index(send, "missing") is None
+
+    @pytest.mark.parametrize("call", ["positional", "keyword"])
+    def test_decorators_validate_positional_and_keyword(self, call):
+        """Test values are found whether passed by position or keyword."""
+
+        @validate_address("destination")
+        @validate_amount("amount")
+        def send(destination, amount):
+            return destination, amount
+
+        def invoke(destination, amount):
+            if call == "positional":
+                return send(destination, amount)
+            return send(destination=destination, amount=amount)
+
+        assert invoke(VALID_ADDRESS, 5) == (VALID_ADDRESS, 5)
+        with pytest.raises(AddressValidationError):
+            invoke(BAD_CHECKSUM_ADDRESS, 5)
+        with pytest.raises(AmountValidationError):
+            invoke(VALID_ADDRESS, 0)
+
+    def test_metagraph_id_decorator(self):
+        """Test the metagraph ID decorator validates its parameter."""
+
+        @validate_metagraph_id("metagraph_id")
+        def lookup(metagraph_id):
+            return metagraph_id
+
+        assert lookup(METAGRAPH_ID) == METAGRAPH_ID
+        with pytest.raises(MetagraphIdValidationError):
+            lookup("not-a-metagraph")
+
+    def test_validate_address_memoizes_checks(self):
+        """Test repeated addresses reuse the cached check result."""
+
+        @validate_address("destination")
+        def send(destination):
+            return destination
+
+        _check_address_cached.cache_clear()
+        send(VALID_ADDRESS)
+        send(VALID_ADDRESS)
+
+        info = _check_address_cached.cache_info()
+        assert (info.hits, info.misses) == (1, 1)
+        # Failed checks are re-raised with the full validation error
+        with pytest.raises(AddressValidationError):
+            send(BAD_CHECKSUM_ADDRESS)
+        with pytest.raises(AddressValidationError):
+            send(BAD_CHECKSUM_ADDRESS)
+
+    def test_copy_meta_preserves_metadata(self):
+        """Test decorated functions keep their name, docstring and module."""
+
+        def original(destination):
+            """Send to a destination."""
+
+        decorated = validate_address("destination")(original)
+
+        assert decorated is not original
+        assert decorated.__name__ == "original"
+        assert decorated.__qualname__ == original.__qualname__
+        assert decorated.__doc__ == "Send to a destination."
+        assert decorated.__module__ == __name__
+        assert decorated.__wrapped__ is original
+        assert inspect.signature(decorated) == inspect.signature(original)
+
+    def test_copy_meta_returns_wrapper(self):
+        """Test _copy_meta updates and returns the wrapper itself."""
+
+        def func():
+            """Docstring."""
+
+        def wrapper():
+            pass
+
+        assert _copy_meta(wrapper, func) is wrapper
+        assert wrapper.__doc__ == "Docstring."
+
+    def test_validation_enabled_toggle(self, monkeypatch):
+        """Test VALIDATION_ENABLED bypasses decorators at call time."""
+
+        @validate_address("destination")
+        @validate_amount("amount")
+        def send(destination, amount):
+            return amount
+
+        monkeypatch.setattr(validation, "VALIDATION_ENABLED", False)
+        assert send("invalid", -1) == -1
+
+        monkeypatch.setattr(validation, "VALIDATION_ENABLED", True)
+        with pytest.raises(ValidationError):
+            send("invalid", -1)
+
+    def test_disable_validator(self, restore_validators):
+        """Test disabled validators skip wrapping newly decorated functions."""
+
+        def send(destination):
+            return destination
+
+        assert not _is_noop(AddressValidator.validate)
+        wrapped = validate_address("destination")(send)
+
+        disable_validator(AddressValidator)
+
+        assert _is_noop(AddressValidator.validate)
+        assert AddressValidator.validate("invalid") is None
+        assert validate_address("destination")(send) is send
+        # Other validators are unaffected
+        assert not _is_noop(AmountValidator.validate)
+        # Functions decorated before disabling call the no-op as well
+        assert wrapped("invalid") == "invalid"
+
+
+class TestValidateTransaction:
+    """Test the validate_transaction decorator."""
+
+    @pytest.fixture
+    def dag_transaction(self):
+        return {
+            "source": VALID_ADDRESS,
+            "destination": "DAG" + "2" * 35,
+            "amount": 100,
+            "fee": 0,
+            "salt": 1,
+        }
+
+    def test_unknown_type_rejected_at_decoration(self):
+        """Test an unknown transaction type fails when decorating."""
+        with pytest.raises(ValidationError, match="Unknown transaction type"):
+            validate_transaction("bogus")
+
+    def test_validates_first_positional_argument(self, dag_transaction):
+        """Test the transaction is validated and passed through unchanged."""
+
+        @validate_transaction("dag")
+        def submit(transaction, retries=0):
+            return transaction, retries
+
+        assert submit(dag_transaction, retries=2) == (dag_transaction, 2)
+        with pytest.raises(TransactionValidationError):
+            submit({"source": VALID_ADDRESS})
+
+    def test_transaction_is_positional_only(self, dag_transaction):
+        """Test the wrapper accepts the transaction only by position."""
+
+        @validate_transaction("dag")
+        def submit(transaction):
+            return transaction
+
+        with pytest.raises(TypeError):
+            submit(transaction=dag_transaction)
+
+    def test_validation_disabled(self, monkeypatch):
+        """Test VALIDATION_ENABLED also bypasses transaction validation."""
+
+        @validate_transaction("dag")
+        def submit(transaction):
+            return transaction
+
+        monkeypatch.setattr(validation, "VALIDATION_ENABLED", False)
+        assert submit({}) == {}
+
+
+class TestValidateBatchTransfers:
+    """Test batch transfer validation."""
+
+    def test_valid_iterables(self):
+        """Test lists, tuples, deques and generators are accepted."""
+        transfers = [
+            {"destination": VALID_ADDRESS, "amount": 1},
+            {"destination": "DAG" + "2" * 35, "amount": 2},
+        ]
+        validate_batch_transfers(transfers)
+        validate_batch_transfers(tuple(transfers))
+        validate_batch_transfers(deque(transfers))
+        validate_batch_transfers(t for t in transfers)
+
+    @pytest.mark.parametrize(
+        "transfers",
+        [
+            None,
+            "DAG" + "0" * 35,
+            b"transfers",
+            {"destination": VALID_ADDRESS, "amount": 1},
+        ],
+    )
+    @pytest.mark.parametrize("fail_fast", [True, False])
+    def test_rejects_non_batch_inputs(self, transfers, fail_fast):
+        """Test None, strings, bytes and mappings are rejected up front."""
+        with pytest.raises(ValidationError, match="must be an iterable") as exc_info:
+            validate_batch_transfers(transfers, fail_fast=fail_fast)
+        assert exc_info.value.details["field"] == "transfers"
+
+    def test_empty_batch(self):
+        """Test an empty batch is rejected in both modes."""
+        with pytest.raises(ValidationError, match="cannot be empty"):
+            validate_batch_transfers([])
+        with pytest.raises(ValidationError, match="cannot be empty"):
+            validate_batch_transfers(iter([]), fail_fast=False)
+
+    def test_fail_fast_raises_first_error(self):
+        """Test fail-fast mode stops at the first invalid transfer."""
+        transfers = [
+            {"destination": VALID_ADDRESS, "amount": 1},
+            {"destination": "invalid", "amount": 1},
+            {"amount": 1},
+        ]
+        with pytest.raises(AddressValidationError):
+            validate_batch_transfers(transfers)
+        with pytest.raises(ValidationError, match="Transfer 0 missing destination"):
+            validate_batch_transfers([{"amount": 1}])
+        with pytest.raises(ValidationError, match="Transfer 0 missing amount"):
+            validate_batch_transfers([{"destination": VALID_ADDRESS}])
+
+    def test_collects_every_error(self):
+        """Test fail_fast=False reports every invalid transfer at once."""
+        transfers = [
+            {"destination": VALID_ADDRESS, "amount": 1},
+            {"destination": "invalid", "amount": 1},
+            {"destination": VALID_ADDRESS, "amount": -5},
+            {"destination": VALID_ADDRESS},
+            "not a dict",
+        ]
+
+        with pytest.raises(ValidationError) as exc_info:
+            validate_batch_transfers(transfers, fail_fast=False)
+
+        error = exc_info.value
+        message = str(error)
+        assert "Transfer 0" not in message
+        assert "Transfer 1 has invalid destination: invalid" in message
+        assert "Transfer 2 has invalid amount: -5" in message
+        assert "Transfer 3 missing amount" in message
+        assert "Transfer 4 must be a dictionary" in message
+        assert error.details["field"] == "transfers"
+        assert error.details["value"] == [1, 2, 3, 4]